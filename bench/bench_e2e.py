@@ -0,0 +1,172 @@
+import argparse
+import contextlib
+import importlib
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from wolfdice.metrics import Histogram
+
+# ---------------- End-to-end throughput benchmark ----------------
+# Jalankan mock WolfBet server (process berasingan) dan ukur bot.py / V2bot.py:
+#   - "place": panggil place_dice_bet berulang kali -> latency p50/p99 per request
+#   - "session": satu sesi martingale penuh (dashboard ke /dev/null); p50/p99 dari
+#     histogram stage "place" bot (had atas bucket log2, jadi lebih kasar dari "place")
+#   - "headless": sesi yang sama tanpa Rich (headless=True, status line ke /dev/null)
+# Laporan: bets/s, p50/p99 latency, CPU (process bot sahaja) per bet.
+#
+#   python bench/bench_e2e.py --bets 2000 --latency-ms 0 --error-rate 0
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _start_mock(args):
+    port = _free_port()
+    cmd = [
+        sys.executable, "-m", "wolfdice.mockserver", "--port", str(port), "--seed", "bench",
+        "--balance", "1000000", "--latency-ms", str(args.latency_ms), "--jitter-ms", str(args.jitter_ms),
+        "--error-rate", str(args.error_rate), "--malformed-rate", str(args.malformed_rate),
+    ]
+    proc = subprocess.Popen(cmd, cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        with contextlib.suppress(OSError), socket.create_connection(("127.0.0.1", port), timeout=0.2):
+            return proc, f"http://127.0.0.1:{port}/api/v1"
+        time.sleep(0.05)
+    proc.kill()
+    raise RuntimeError("mock server tak boleh start")
+
+
+def _make_bot(module, api_base, bets, cfg_dir):
+    cfg = {
+        "access_token": "bench",
+        "currency": "doge",
+        "base_bet": 0.00000004,
+        "multiplier": 1.12,
+        "max_bet": 0.1,
+        "chance": 10,
+        "rule_mode": "under",
+        "take_profit": 1000.0,
+        "stop_loss": -1000.0,
+        "cooldown_sec": 0,
+        "debug": False,
+        "api_base": api_base,
+        "max_bets": bets,
+    }
+    path = os.path.join(cfg_dir, f"{module}.json")
+    with open(path, "w") as f:
+        json.dump(cfg, f)
+    return importlib.import_module(module).WolfBetBot(path)
+
+
+def _pct(sorted_vals, p):
+    if not sorted_vals:
+        return float("nan")
+    k = min(len(sorted_vals) - 1, int(round(p / 100.0 * (len(sorted_vals) - 1))))
+    return sorted_vals[k]
+
+
+def bench_place(bot, bets):
+    lat = []
+    ok = 0
+    cpu0, t0 = time.process_time(), time.perf_counter()
+    for _ in range(bets):
+        rule, bet_value = bot.chance_to_rule_and_threshold()
+        s = time.perf_counter()
+        data, _ = bot.place_dice_bet(bot.base_bet, rule, bet_value)
+        lat.append(time.perf_counter() - s)
+        ok += bool(data and data.get("bet"))
+    wall, cpu = time.perf_counter() - t0, time.process_time() - cpu0
+    lat.sort()
+    return {
+        "bets": ok,
+        "bets_per_sec": ok / wall,
+        "p50_ms": _pct(lat, 50) * 1000,
+        "p99_ms": _pct(lat, 99) * 1000,
+        "cpu_us_per_bet": cpu / max(ok, 1) * 1e6,
+    }
+
+
+def _place_hist(bot):
+    # salinan histogram stage "place" bot (None kalau metrics dimatikan)
+    if bot.metrics is None:
+        return None
+    hist = Histogram("place")
+    src = bot.metrics.stages["place"]
+    hist.counts, hist.total = list(src.counts), src.total
+    return hist
+
+
+def bench_session(bot, headless=False):
+    bot.headless = headless
+    before = _place_hist(bot)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        cpu0, t0 = time.process_time(), time.perf_counter()
+        bot.run()
+        wall, cpu = time.perf_counter() - t0, time.process_time() - cpu0
+    res = {
+        "bets": bot.total_bets,
+        "bets_per_sec": bot.total_bets / wall,
+        "cpu_us_per_bet": cpu / max(bot.total_bets, 1) * 1e6,
+    }
+    place = _place_hist(bot)
+    if place is not None:
+        # sesi ini sahaja: tolak request dari bench_place sebelumnya
+        place.counts = [a - b for a, b in zip(place.counts, before.counts)]
+        if place.count:
+            res["p50_ms"] = place.percentile(50) / 1e6
+            res["p99_ms"] = place.percentile(99) / 1e6
+    return res
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark bot.py / V2bot.py dengan mock WolfBet server")
+    ap.add_argument("--bets", type=int, default=2000)
+    ap.add_argument("--latency-ms", type=float, default=0.0)
+    ap.add_argument("--jitter-ms", type=float, default=0.0)
+    ap.add_argument("--error-rate", type=float, default=0.0)
+    ap.add_argument("--malformed-rate", type=float, default=0.0)
+    ap.add_argument("--bots", default="bot,V2bot")
+    ap.add_argument("--json", action="store_true")
+    args = ap.parse_args(argv)
+
+    proc, api_base = _start_mock(args)
+    results = {}
+    try:
+        with tempfile.TemporaryDirectory() as cfg_dir:
+            for module in args.bots.split(","):
+                bot = _make_bot(module, api_base, args.bets, cfg_dir)
+                results[module] = {
+                    "place": bench_place(bot, args.bets),
+                    "session": bench_session(bot),
+                    "headless": bench_session(_make_bot(module, api_base, args.bets, cfg_dir), headless=True),
+                }
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"mock: latency {args.latency_ms}ms ±{args.jitter_ms}ms, error {args.error_rate}, malformed {args.malformed_rate}")
+    print(f"{'bot':8} {'mode':8} {'bets':>7} {'bets/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'CPU us/bet':>11}")
+    for module, res in results.items():
+        for mode, r in res.items():
+            print(f"{module:8} {mode:8} {r['bets']:7d} {r['bets_per_sec']:9.1f} "
+                  f"{r.get('p50_ms', float('nan')):8.3f} {r.get('p99_ms', float('nan')):8.3f} {r['cpu_us_per_bet']:11.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+import argparse
+import json
+import os
+import sys
+import time
+
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from wolfdice import decode
+from wolfdice.money import to_units
+from wolfdice.mockserver import start_server
+
+# ---------------- /bet/place decode benchmark ----------------
+# Banding cara asal (r.json() + bet.get) dengan wolfdice.decode (orjson / scan
+# / json) atas response /bet/place yang dirakam dari mock server, termasuk
+# response error dan JSON rosak. Semak dulu setiap decoder beri 4 medan yang
+# sama (state, profit, amount, result_value) seperti cara asal, kemudian ukur
+# ns setiap response. Exit code 1 kalau ada decoder yang beri hasil berbeza.
+#
+#   python bench/bench_json.py                        # guna bench/data/bet_place.jsonl
+#   python bench/bench_json.py --record 2000          # rakam semula dari mock server
+
+DATA = os.path.join(ROOT, "bench", "data", "bet_place.jsonl")
+
+
+def record(path, n, seed="bench"):
+    # satu response mentah (body bytes) setiap baris; error 500 & JSON rosak ikut kadar mock
+    server, api_base = start_server(currency="doge", balance=1000000.0, seed=seed,
+                                    error_rate=0.01, malformed_rate=0.01)
+    session = requests.Session()
+    session.headers.update({"Authorization": "Bearer bench", "Content-Type": "application/json"})
+    rows = []
+    try:
+        for i in range(n):
+            payload = {
+                "currency": "doge", "game": "dice", "amount": f"{(i % 50 + 1) * 4e-8:.8f}",
+                "rule": "under" if i % 2 else "over", "bet_value": "49.5" if i % 3 else "10.0",
+                "multiplier": "2.0" if i % 3 else "9.9",
+            }
+            r = session.post(f"{api_base}/bet/place", json=payload, timeout=5)
+            rows.append(r.content)
+    finally:
+        session.close()
+        server.shutdown()
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(path, "wb") as f:
+        for raw in rows:
+            f.write(raw + b"\n")
+    return len(rows)
+
+
+def load(path):
+    with open(path, "rb") as f:
+        return [line.rstrip(b"\n") for line in f if line.strip()]
+
+
+def _response(raw):
+    r = requests.Response()
+    r.status_code = 200
+    r._content = raw
+    r.headers["Content-Type"] = "application/json"
+    return r
+
+
+def _fields(data):
+    # 4 medan seperti yang _settle guna (None kalau tiada bet)
+    bet = data.get("bet") if isinstance(data, dict) else None
+    if bet is None:
+        return None
+    try:
+        result_value = float(bet.get("result_value"))
+    except (TypeError, ValueError):
+        result_value = None
+    return (
+        bet.get("state"),
+        to_units(bet.get("profit", 0) or 0),
+        to_units(bet["amount"]) if "amount" in bet else None,
+        result_value,
+    )
+
+
+def _legacy(r):
+    try:
+        return r.json()
+    except Exception:
+        return None
+
+
+def check(payloads, decoders):
+    bad = {}
+    for raw in payloads:
+        want = _fields(_legacy(_response(raw)))
+        for name, fn in decoders.items():
+            if _fields(fn(raw)) != want:
+                bad.setdefault(name, []).append(raw[:80])
+    return bad
+
+
+def bench_legacy(responses):
+    for r in responses:
+        try:
+            data = r.json()
+        except Exception:
+            data = None
+        bet = data.get("bet") if data else None
+        if bet is not None:
+            bet.get("state"), bet.get("profit"), bet.get("amount"), bet.get("result_value")
+
+
+def bench_decoder(fn, payloads):
+    for raw in payloads:
+        data = fn(raw)
+        bet = data.get("bet") if data else None
+        if bet is not None:
+            bet.get("state"), bet.get("profit"), bet.get("amount"), bet.get("result_value")
+
+
+def _time(fn, arg, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - t0)
+    return best / len(arg) * 1e9
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark decode response /bet/place")
+    ap.add_argument("--data", default=DATA)
+    ap.add_argument("--record", type=int, default=0, help="rakam N response baru dari mock server dahulu")
+    ap.add_argument("--repeat", type=int, default=20)
+    ap.add_argument("--json", action="store_true", help="output JSON")
+    args = ap.parse_args(argv)
+
+    if args.record:
+        print(f"rakam {record(args.data, args.record)} response -> {args.data}", file=sys.stderr)
+    payloads = load(args.data)
+    decoders = {"scan": decode.get_decoder("scan"), "json": decode.get_decoder("json")}
+    if decode.orjson is not None:
+        decoders["orjson"] = decode.get_decoder("orjson")
+
+    bad = check(payloads, decoders)
+    responses = [_response(raw) for raw in payloads]
+    results = {"r.json()": _time(bench_legacy, responses, args.repeat)}
+    for name, fn in decoders.items():
+        results[name] = _time(lambda p, fn=fn: bench_decoder(fn, p), payloads, args.repeat)
+    auto = decode.decoder_name(decode.get_decoder("auto"))
+
+    if args.json:
+        print(json.dumps({"payloads": len(payloads), "auto": auto, "ns": results,
+                          "mismatch": {k: len(v) for k, v in bad.items()}}))
+    else:
+        base = results["r.json()"]
+        print(f"{len(payloads)} response, auto = {auto}")
+        for name, ns in results.items():
+            status = "GAGAL" if name in bad else "OK  "
+            print(f"  {status} {name:9s} {ns:8.0f} ns/response  ({base / ns:.2f}x)")
+        for name, rows in bad.items():
+            print(f"  {name}: {rows[:3]}")
+    return 1 if bad else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from decimal import Decimal
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from wolfdice.money import SAT, fmt, to_units
+from wolfdice.strategy import from_config as strategy_from_config
+
+# ---------------- Fixed-point money: benchmark + property check ----------------
+# 1. Semak sifat wolfdice.money dengan input rawak (Decimal sebagai rujukan):
+#    parse string server, round-trip fmt, nilai config, jumlah profit, SL/TP
+#    dan ladder strategy (sama dengan formula float asal).
+# 2. Ukur hot path _settle: float (cara lama) vs int unit (cara baru).
+# Exit code 1 kalau ada sifat yang gagal.
+#
+#   python bench/bench_money.py --n 200000 --seed 1
+
+
+def _amount_str(rng, max_units):
+    units = rng.randrange(-max_units, max_units + 1)
+    return fmt(units), units
+
+
+def check_parse(rng, n):
+    bad = []
+    for _ in range(n):
+        # nilai kecil (bet), besar (baki) dan luar laluan pantas
+        max_units = rng.choice((10 ** 4, 10 ** 12, 10 ** 17))
+        s, units = _amount_str(rng, max_units)
+        if to_units(s) != units or Decimal(s) * SAT != units:
+            bad.append(s)
+        short = s.rstrip("0").rstrip(".") or "0"   # "1.50000000" -> "1.5"
+        if to_units(short) != units:
+            bad.append(short)
+    return bad
+
+
+def check_roundtrip(rng, n):
+    bad = []
+    for _ in range(n):
+        units = rng.randrange(-(10 ** 18), 10 ** 18)
+        if to_units(fmt(units)) != units or Decimal(fmt(units)) != Decimal(units) / SAT:
+            bad.append(units)
+    return bad
+
+
+def check_config(rng, n):
+    # nilai config ditulis manusia (float JSON) -> unit ikut nilai perpuluhan yang ditulis
+    bad = []
+    for _ in range(n):
+        units = rng.randrange(1, 10 ** rng.randrange(1, 16))
+        text = fmt(units).rstrip("0").rstrip(".")
+        if to_units(json.loads(text)) != units:
+            bad.append(text)
+    return bad
+
+
+def check_sum(rng, n):
+    # jumlah profit: int tepat sama dengan Decimal; float lari sedikit
+    total_units, total_float, total_dec = 0, 0.0, Decimal(0)
+    for _ in range(n):
+        s, _ = _amount_str(rng, 10 ** 7)
+        total_units += to_units(s)
+        total_float += float(s)
+        total_dec += Decimal(s)
+    ok = Decimal(total_units) / SAT == total_dec
+    return ([] if ok else [(total_units, total_dec)]), abs(Decimal(repr(total_float)) - total_dec)
+
+
+def check_thresholds(rng, n):
+    bad = []
+    for _ in range(n):
+        profit_s, profit = _amount_str(rng, 10 ** 6)
+        limit_s, limit = _amount_str(rng, 10 ** 6)
+        if (profit <= limit) != (Decimal(profit_s) <= Decimal(limit_s)):
+            bad.append((profit_s, limit_s))
+    return bad
+
+
+def _legacy_ladder(base, factor, max_bet):
+    # formula float asal: round(x * f, 12), dihantar sebagai round(x, 8)
+    amounts = [base]
+    while factor > 1.0:
+        nxt = round(amounts[-1] * factor, 12)
+        if nxt > max_bet or nxt <= amounts[-1]:
+            break
+        amounts.append(nxt)
+    return [int(Decimal(repr(round(a, 8))) * SAT) for a in amounts]
+
+
+def check_ladders(rng, n):
+    bad = []
+    for _ in range(n):
+        base = rng.randrange(1, 1000) / SAT
+        factor = rng.choice((1.0, 1.05, 1.12, 1.5, 2.0, 3.0))
+        max_bet = base * rng.randrange(1, 10 ** 6)
+        cfg = {"base_bet": base, "multiplier": factor, "max_bet": max_bet, "chance": 49.5}
+        st = strategy_from_config(cfg)
+        rungs = [row[0][0] for row in st._rows]
+        if rungs[0] != to_units(base) or any(r.__class__ is not int or r > to_units(max_bet) for r in rungs):
+            bad.append(cfg)
+            continue
+        if rungs != _legacy_ladder(base, factor, max_bet):
+            bad.append(cfg)
+    return bad
+
+
+# ---------------- Benchmark ----------------
+def _bets(rng, n):
+    # bet seperti dari server: amount ikut ladder martingale, profit win = amount * (multiplier - 1)
+    st = strategy_from_config({"base_bet": 0.00000004, "multiplier": 1.12, "max_bet": 0.1, "chance": 10})
+    out = []
+    for _ in range(n):
+        amount = st.amount
+        win = rng.random() < 0.1
+        profit = round(amount * 8.9) if win else -amount
+        out.append({"state": "win" if win else "lose", "profit": fmt(profit), "amount": fmt(amount)})
+        st.next(win)
+    return out
+
+
+def bench_float(bets, stop_loss=-1e9, take_profit=1e9):
+    profit_total, streak = 0.0, 0.0
+    for bet in bets:
+        profit = float(bet.get("profit", 0) or 0)
+        amount = float(bet.get("amount", 0.0))
+        if bet.get("state") == "win":
+            profit_total += profit
+            streak = 0.0
+        else:
+            profit_total -= amount
+            streak += amount
+        if profit_total <= stop_loss or profit_total >= take_profit:
+            break
+        payload_amount = str(round(float(amount), 8))
+    return profit_total, payload_amount
+
+
+def bench_units(bets, stop_loss=-10 ** 17, take_profit=10 ** 17):
+    profit_total, streak = 0, 0
+    for bet in bets:
+        profit = to_units(bet.get("profit", 0) or 0)
+        amount = to_units(bet["amount"]) if "amount" in bet else 0
+        if bet.get("state") == "win":
+            profit_total += profit
+            streak = 0
+        else:
+            profit_total -= amount
+            streak += amount
+        if profit_total <= stop_loss or profit_total >= take_profit:
+            break
+        payload_amount = fmt(amount)
+    return profit_total, payload_amount
+
+
+def _time(fn, bets, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(bets)
+        best = min(best, time.perf_counter() - t0)
+    return best / len(bets) * 1e9
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Property check + benchmark untuk wolfdice.money")
+    ap.add_argument("--n", type=int, default=200000, help="bilangan kes rawak / bet benchmark")
+    ap.add_argument("--seed", type=int, default=None)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args(argv)
+
+    seed = args.seed if args.seed is not None else random.randrange(1 << 30)
+    rng = random.Random(seed)
+    n = args.n
+    failures = 0
+    sum_bad, float_drift = check_sum(rng, n)
+    checks = [
+        ("parse string server", check_parse(rng, n)),
+        ("fmt round-trip", check_roundtrip(rng, n)),
+        ("nilai config", check_config(rng, n // 10)),
+        ("jumlah profit", sum_bad),
+        ("banding SL/TP", check_thresholds(rng, n)),
+        ("ladder strategy", check_ladders(rng, max(1, n // 1000))),
+    ]
+    print(f"seed {seed}, {n} kes")
+    for name, bad in checks:
+        failures += bool(bad)
+        print(f"  {'OK  ' if not bad else 'GAGAL'} {name}" + (f": {bad[:3]}" if bad else ""))
+    print(f"  drift float selepas {n} profit: {float_drift:.3E} (int: 0)")
+
+    bets = _bets(rng, n)
+    f_ns = _time(bench_float, bets, args.repeat)
+    u_ns = _time(bench_units, bets, args.repeat)
+    print(f"settle hot path: float {f_ns:.0f} ns/bet, int unit {u_ns:.0f} ns/bet ({f_ns / u_ns:.2f}x)")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,300 @@
+import argparse
+import contextlib
+import importlib
+import itertools
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from functools import partial
+
+try:
+    import resource
+except ImportError:   # bukan unix: tiada peak RSS
+    resource = None
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from wolfdice.decode import decoder_name, get_decoder
+from wolfdice.simulator import DiceSimulator
+from wolfdice.strategy import from_config as strategy_from_config
+from wolfdice.transport import prepare_bet
+
+# ---------------- Replay regression benchmark ----------------
+# Ulang aliran response /bet/place (dirakam atau sintetik) melalui laluan
+# sebenar bot.run() -> martingale -> frontend, dengan transport diganti
+# ReplayBackend dalam process (tiada socket): yang diukur hanya loop bot,
+# decode, accounting, journal dan dashboard.
+#   - CPU us/bet   : process_time (semua thread, termasuk render) / bet, terbaik dari --repeat
+#   - tracemalloc  : peak & baki memori Python selepas --trace-bets bet (run berasingan, lebih perlahan)
+#   - peak RSS     : ru_maxrss; setiap varian dalam process sendiri supaya tidak bercampur
+# Varian: bot (dashboard classic), V2bot (dashboard v2), headless.
+# Keputusan dibanding dengan baseline JSON; exit code 1 kalau CPU us/bet
+# mana-mana varian naik lebih dari --tolerance.
+#
+#   python bench/bench_replay.py --bets 100000                    # banding bench/data/replay_baseline.json
+#   python bench/bench_replay.py --bets 1000000 --source recorded  # bench/data/bet_place.jsonl
+#   python bench/bench_replay.py --save-baseline                  # simpan keputusan sebagai baseline baru
+
+DATA = os.path.join(ROOT, "bench", "data", "bet_place.jsonl")
+BASELINE = os.path.join(ROOT, "bench", "data", "replay_baseline.json")
+VARIANTS = {
+    # nama: (modul, headless)
+    "bot": ("bot", False),
+    "V2bot": ("V2bot", False),
+    "headless": ("bot", True),
+}
+
+CONFIG = {
+    "access_token": "",
+    "backend": "sim",          # bina tanpa session HTTP; backend diganti ReplayBackend
+    "sim_balance": 1000000,
+    "sim_seed": "replay",
+    "currency": "doge",
+    "base_bet": 0.00000004,
+    "multiplier": 1.12,
+    "max_bet": 0.1,
+    "chance": 10,
+    "rule_mode": "under",
+    "take_profit": 1000000.0,
+    "stop_loss": -1000000.0,
+    "cooldown_sec": 0,
+    "debug": False,
+    "hot_reload": False,
+    "balance_refresh_sec": 0,
+    "retry_base_sec": 0,       # ralat dalam aliran: cuba semula terus, tanpa tidur
+    "retry_reconcile": False,  # baki replay tetap, jadi semakan baki tidak bermakna
+    "journal": "",
+    "json_decoder": "scan",    # tetap: orjson pilihan, "auto" akan beza antara mesin
+}
+
+
+# ---------------- Replay transport ----------------
+class ReplayBackend:
+    # ganti HttpBackend: response mentah diulang ikut giliran, decode seperti HTTP
+    def __init__(self, stream, decode, currency, balance):
+        self.stream = stream   # [(body bytes, status)]
+        self.decode = decode
+        self.api_base = "replay"
+        self._balances = [{"currency": currency, "amount": f"{balance:.8f}"}]
+        self.rewind()
+
+    def rewind(self):
+        self._next = itertools.cycle(self.stream).__next__
+
+    def get_balances(self):
+        return self._balances
+
+    def place_bet(self, request):
+        raw, status = self._next()
+        return self.decode(raw), (status, None, None, None)
+
+
+def _status(raw):
+    # response dirakam tiada status: {"error": ...} = 500, selain itu 200 (JSON rosak -> malformed)
+    try:
+        data = json.loads(raw)
+    except ValueError:
+        return 200
+    return 200 if isinstance(data, dict) and "bet" in data else 500
+
+
+def load_stream(path):
+    with open(path, "rb") as f:
+        return [(raw, _status(raw)) for raw in (line.rstrip(b"\n") for line in f) if raw.strip()]
+
+
+def synthetic(path, n, cfg, error_rate=0.0, seed="replay"):
+    # ikut strategy bot sendiri atas simulator: stake dalam response sama dengan stake bot
+    sim = DiceSimulator.from_config(cfg)
+    currency = str(cfg["currency"]).lower()
+    strategy = strategy_from_config(cfg, rng=random.Random(seed), build=partial(prepare_bet, currency))
+    rng = random.Random(seed)
+    bet = strategy.first()
+    with open(path, "wb") as f:
+        for _ in range(n):
+            if error_rate and rng.random() < error_rate:
+                f.write(b'{"error": "Server Error"}\n')   # bet tidak masuk; bot hantar semula stake sama
+                continue
+            data, _ = sim.place_bet(bet[3])
+            f.write(json.dumps(data).encode() + b"\n")
+            bet = strategy.next(data["bet"]["state"] == "win")
+    return path
+
+
+# ---------------- Satu varian (child process) ----------------
+def _make_bot(module, headless, stream, bets, journal_dir):
+    cfg = dict(CONFIG, max_bets=bets, headless=headless)
+    if journal_dir:
+        cfg["journal"] = os.path.join(journal_dir, f"{module}-{'h' if headless else 'ui'}.wbj")
+        cfg["resume"] = False
+    bot = importlib.import_module(module).WolfBetBot(cfg=cfg)
+    bot.backend = ReplayBackend(stream, get_decoder(cfg.get("json_decoder", "auto")), cfg["currency"], cfg["sim_balance"])
+    return bot
+
+
+def _session(bot, bets):
+    bot.max_bets = bets
+    bot.backend.rewind()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        cpu0, t0 = time.process_time(), time.perf_counter()
+        bot.run()
+        wall, cpu = time.perf_counter() - t0, time.process_time() - cpu0
+    return bot.total_bets, wall, cpu
+
+
+def run_variant(name, stream_path, bets, repeat, trace_bets, journal):
+    module, headless = VARIANTS[name]
+    stream = load_stream(stream_path)
+    with tempfile.TemporaryDirectory() as tmp:
+        bot = _make_bot(module, headless, stream, bets, tmp if journal else None)
+        best = None
+        for _ in range(max(1, repeat)):
+            done, wall, cpu = _session(bot, bets)
+            if best is None or cpu < best[2]:
+                best = (done, wall, cpu)
+        done, wall, cpu = best
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource is not None else 0
+
+        # tracemalloc perlahankan loop beberapa kali ganda: run berasingan & lebih pendek
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            traced, _, _ = _session(bot, min(bets, trace_bets))
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return {
+        "bets": done,
+        "bets_per_sec": done / wall,
+        "cpu_us_per_bet": cpu / max(done, 1) * 1e6,
+        "trace_bets": traced,
+        "tracemalloc_peak_kb": (peak - before) / 1024,
+        "tracemalloc_retained_kb": (current - before) / 1024,
+        "peak_rss_mb": rss / (1024 * 1024 if sys.platform == "darwin" else 1024),
+        "decoder": decoder_name(bot.backend.decode),
+    }
+
+
+def _child(name, args, stream_path):
+    cmd = [
+        sys.executable, os.path.abspath(__file__), "--child", name, "--source", stream_path,
+        "--bets", str(args.bets), "--repeat", str(args.repeat), "--trace-bets", str(args.trace_bets),
+    ]
+    if args.journal:
+        cmd.append("--journal")
+    proc = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"varian {name} gagal:\n{proc.stderr.strip()}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+# ---------------- Baseline ----------------
+def compare(results, baseline, tolerance):
+    # pulangkan {varian: nisbah CPU us/bet berbanding baseline} dan senarai regression
+    ratios, regressions = {}, []
+    for name, r in results.items():
+        base = baseline.get("results", {}).get(name)
+        if not base or not base.get("cpu_us_per_bet"):
+            continue
+        if base.get("decoder") != r.get("decoder"):
+            # decoder lain = ukuran lain; jangan banding
+            continue
+        ratio = r["cpu_us_per_bet"] / base["cpu_us_per_bet"]
+        ratios[name] = ratio
+        if ratio > 1.0 + tolerance:
+            regressions.append(
+                f"{name}: {r['cpu_us_per_bet']:.2f} us/bet vs baseline {base['cpu_us_per_bet']:.2f} (+{(ratio - 1) * 100:.0f}%)"
+            )
+    return ratios, regressions
+
+
+def _meta(args, source):
+    return {
+        "bets": args.bets, "source": source, "journal": args.journal,
+        "python": platform.python_version(), "machine": platform.machine(),
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Replay benchmark loop bot (bot.py / V2bot.py) dengan baseline")
+    ap.add_argument("--bets", type=int, default=100000, help="bet setiap run (10^5 - 10^7)")
+    ap.add_argument("--source", default="synthetic",
+                    help="synthetic (simulator ikut strategy), recorded (bench/data/bet_place.jsonl) atau path .jsonl")
+    ap.add_argument("--stream", type=int, default=10000, help="saiz aliran sintetik (diulang bila habis)")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="kadar response 500 dalam aliran sintetik")
+    ap.add_argument("--variants", default=",".join(VARIANTS))
+    ap.add_argument("--repeat", type=int, default=5, help="ambil CPU terbaik dari N run")
+    ap.add_argument("--trace-bets", type=int, default=20000, help="bet untuk run tracemalloc")
+    ap.add_argument("--journal", action="store_true", help="tulis journal (folder sementara) seperti production")
+    ap.add_argument("--baseline", default=BASELINE)
+    ap.add_argument("--save-baseline", action="store_true", help="tulis keputusan ke --baseline")
+    ap.add_argument("--tolerance", type=float, default=0.25, help="had kenaikan CPU us/bet sebelum gagal (0.25 = 25%%)")
+    ap.add_argument("--json", action="store_true")
+    ap.add_argument("--child", help=argparse.SUPPRESS)
+    args = ap.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(run_variant(args.child, args.source, args.bets, args.repeat, args.trace_bets, args.journal)))
+        return 0
+
+    names = [v for v in args.variants.split(",") if v]
+    for name in names:
+        if name not in VARIANTS:
+            ap.error(f"varian tidak dikenali: {name} (pilih: {', '.join(VARIANTS)})")
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.source == "synthetic":
+            stream_path = synthetic(os.path.join(tmp, "stream.jsonl"), min(args.stream, args.bets), CONFIG, args.error_rate)
+        else:
+            stream_path = DATA if args.source == "recorded" else args.source
+        results = {name: _child(name, args, stream_path) for name in names}
+
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+    ratios, regressions = compare(results, baseline, args.tolerance)
+
+    if args.save_baseline:
+        folder = os.path.dirname(args.baseline)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump({"meta": _meta(args, args.source), "results": results}, f, indent=2)
+            f.write("\n")
+
+    if args.json:
+        print(json.dumps({"meta": _meta(args, args.source), "results": results,
+                          "vs_baseline": ratios, "regressions": regressions}, indent=2))
+        return 1 if regressions else 0
+
+    print(f"replay: {args.source}, {args.bets} bet, terbaik dari {args.repeat}, tracemalloc {args.trace_bets} bet")
+    print(f"{'varian':9} {'bets':>9} {'bets/s':>9} {'CPU us/bet':>11} {'vs base':>8} "
+          f"{'tm peak KB':>11} {'tm baki KB':>11} {'RSS MB':>7}")
+    for name, r in results.items():
+        ratio = ratios.get(name)
+        vs = f"{(ratio - 1) * 100:+7.1f}%" if ratio is not None else f"{'-':>8}"
+        print(f"{name:9} {r['bets']:9d} {r['bets_per_sec']:9.0f} {r['cpu_us_per_bet']:11.2f} {vs} "
+              f"{r['tracemalloc_peak_kb']:11.1f} {r['tracemalloc_retained_kb']:11.1f} {r['peak_rss_mb']:7.1f}")
+    for name, r in results.items():
+        base = baseline.get("results", {}).get(name)
+        if base and base.get("decoder") != r.get("decoder"):
+            print(f"nota: {name} tidak dibanding, baseline decoder {base.get('decoder')} vs {r.get('decoder')}")
+    meta = baseline.get("meta", {})
+    if meta and (meta.get("source"), meta.get("journal"), meta.get("python")) != (args.source, args.journal, platform.python_version()):
+        print(f"nota: baseline dari {meta.get('source')} / journal {meta.get('journal')} / python {meta.get('python')}")
+    if args.save_baseline:
+        print(f"baseline disimpan: {args.baseline}")
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,290 +1,14 @@
-import json
-import time
-import random
-import requests
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.live import Live
-from rich.layout import Layout
-
-# ---------------- ANSI colors ----------------
-RED     = "\033[91m"
-GREEN   = "\033[92m"
-YELLOW  = "\033[93m"
-BLUE    = "\033[94m"
-CYAN    = "\033[96m"
-MAGENTA = "\033[95m"
-WHITE   = "\033[97m"
-RESET   = "\033[0m"
-
-GRADIENT = [RED, YELLOW, GREEN, CYAN, BLUE, MAGENTA]
-
-API_BASE = "https://wolfbet.com/api/v1"
-console = Console()
-
-class WolfBetBot:
-    def __init__(self, cfg_path="config.json"):
-        with open(cfg_path, "r") as f:
-            self.cfg = json.load(f)
-
-        token = self.cfg.get("access_token", "").strip()
-        if not token:
-            raise ValueError("access_token kosong dalam config.json")
-
-        self.headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-            "X-Requested-With": "XMLHttpRequest",
-        }
-
-        self.currency = str(self.cfg.get("currency", "btc")).lower()
-        self.base_bet = float(self.cfg.get("base_bet", 0.00000001))
-        self.multiplier_factor = float(self.cfg.get("multiplier", 2.0))
-        self.max_bet = float(self.cfg.get("max_bet", 0.0001))
-        self.chance = float(self.cfg.get("chance", 49.5))
-        self.rule_mode = str(self.cfg.get("rule_mode", "auto")).lower()
-        self.take_profit = float(self.cfg.get("take_profit", 0.0005))
-        self.stop_loss = float(self.cfg.get("stop_loss", -0.0005))
-        self.cooldown = float(self.cfg.get("cooldown_sec", 1.0))
-        self.debug = bool(self.cfg.get("debug", True))
-        self.auto_start = bool(self.cfg.get("auto_start", False))
-        self.auto_start_delay = int(self.cfg.get("auto_start_delay", 5))
-
-        self.session_profit = 0.0
-        self.current_bet = self.base_bet
-        self.bet_history = []
-        self.start_time = None   # untuk runtime tracking
-        self.loss_streak_total = 0.0  # cumulative lose streak
-        self.session_count = 0   # NEW: session counter
-
-    # ---------------- REST calls ----------------
-    def _get(self, path):
-        try:
-            r = requests.get(f"{API_BASE}{path}", headers=self.headers, timeout=20)
-            return r
-        except Exception as e:
-            if self.debug:
-                console.print(f"[red]⚠️ GET {path} network error:[/red] {e}")
-            return None
-
-    def _post(self, path, payload):
-        try:
-            r = requests.post(f"{API_BASE}{path}", headers=self.headers, json=payload, timeout=20)
-            return r
-        except Exception as e:
-            if self.debug:
-                console.print(f"[yellow]⚠️ POST {path} network error:[/yellow] {e}")
-            return None
-
-    def get_balances(self):
-        r = self._get("/user/balances")
-        if not r:
-            return None
-        try:
-            data = r.json()
-            return data.get("balances", [])
-        except Exception:
-            return None
-
-    def get_balance_currency(self, currency):
-        balances = self.get_balances()
-        if not balances:
-            return None
-        for b in balances:
-            if str(b.get("currency", "")).lower() == currency.lower():
-                try:
-                    return float(b.get("amount"))
-                except Exception:
-                    return None
-        return None
-
-    def place_dice_bet(self, amount, rule, bet_value):
-        amount = round(float(amount), 8)
-        win_chance = bet_value if rule == "under" else (100.0 - bet_value)
-        multiplier = 99.0 / win_chance
-        multiplier = float(f"{multiplier:.4f}")
-
-        payload = {
-            "currency": self.currency,
-            "game": "dice",
-            "amount": str(amount),
-            "rule": rule,
-            "bet_value": str(bet_value),
-            "multiplier": str(multiplier)
-        }
-        r = self._post("/bet/place", payload)
-        if not r:
-            return None, None
-
-        rl_limit = r.headers.get("x-ratelimit-limit")
-        rl_left  = r.headers.get("x-ratelimit-remaining")
-
-        try:
-            data = r.json()
-            return data, (rl_limit, rl_left)
-        except Exception:
-            return None, (rl_limit, rl_left)
-
-    # -------------- Dice helpers --------------
-    @staticmethod
-    def _cap(val, lo, hi):
-        return max(lo, min(hi, val))
-
-    def chance_to_rule_and_threshold(self):
-        chance = self._cap(self.chance, 0.01, 99.99)
-        if self.rule_mode == "over":
-            rule = "over"
-            bet_value = self._cap(100.0 - chance, 0.01, 99.99)
-        elif self.rule_mode == "under":
-            rule = "under"
-            bet_value = self._cap(chance, 0.01, 99.99)
-        else:
-            if random.randint(0, 1) == 1:
-                rule = "under"
-                bet_value = self._cap(chance, 0.01, 99.99)
-            else:
-                rule = "over"
-                bet_value = self._cap(100.0 - chance, 0.01, 99.99)
-        return rule, bet_value
-
-    # -------------- UI Rich Version --------------
-    def _summary_panel(self, start_balance, current_balance, total_bets, win, lose, runtime):
-        txt = f"""
-[bold yellow]Baki Awal :[/bold yellow] {start_balance:.8f} {self.currency.upper()}
-[bold cyan]Baki Sekarang:[/bold cyan] {current_balance:.8f} {self.currency.upper()}
-[bold green]Profit/Rugi:[/bold green] {self.session_profit:.8f} {self.currency.upper()}
-[bold magenta]Jumlah BET :[/bold magenta] {total_bets} (WIN {win} / LOSE {lose})
-[bold white]Runtime :[/bold white] {runtime}
-[bold blue]Session :[/bold blue] #{self.session_count}
-"""
-        return Panel(txt, title="📊 Ringkasan Sesi", border_style="bold blue")
-
-    def _bet_table(self):
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Target")
-        table.add_column("Result")
-        table.add_column("Bet")
-        table.add_column("W/L")
-        table.add_column("Profit")
-
-        for row in self.bet_history[-10:]:
-            table.add_row(*row)
-        return table
-
-    def _update_ui(self, start_balance, current_balance, total_bets, win, lose, live):
-        elapsed = int(time.time() - self.start_time)
-        runtime_str = time.strftime("%H:%M:%S", time.gmtime(elapsed))
-
-        layout = Layout()
-        layout.split(
-            Layout(name="summary", size=9),
-            Layout(name="bets")
-        )
-        layout["summary"].update(
-            self._summary_panel(start_balance, current_balance, total_bets, win, lose, runtime_str)
-        )
-        layout["bets"].update(self._bet_table())
-        live.update(layout)
-
-    # -------------- Logo --------------
-    def draw_logo(self):
-        logo_text = "W O L F   D I C E   B O T"
-        for i, c in enumerate(logo_text):
-            color = GRADIENT[i % len(GRADIENT)]
-            print(f"{color}{c}{RESET}", end="")
-        print("\n")
-        emoji_line = "🎲🐺  🎲🐺  🎲🐺  🎲🐺  🎲🐺"
-        print(emoji_line, "\n")
-
-    # -------------- Strategy loops --------------
-    def martingale(self):
-        self.draw_logo()
-        start_balance = self.get_balance_currency(self.currency)
-        if start_balance is None:
-            console.print(f"[red]❌ Tak dapat baca balance. Semak token/endpoint atau headers.[/red]")
-            return
-        console.print(f"[green]💰 Baki awal:[/green] {start_balance:.8f} {self.currency.upper()}")
-
-        self.session_profit = 0.0
-        self.current_bet = self.base_bet
-        win_count, lose_count, total_bets = 0, 0, 0
-        self.start_time = time.time()
-        self.loss_streak_total = 0.0
-
-        with Live(refresh_per_second=4, screen=True) as live:
-            while True:
-                if self.session_profit <= self.stop_loss:
-                    console.print(f"\n[yellow]🛑 Stop-loss triggered:[/yellow] {self.session_profit:.8f} {self.currency.upper()}")
-                    break
-                if self.session_profit >= self.take_profit:
-                    console.print(f"\n[green]✅ Take-profit triggered:[/green] {self.session_profit:.8f} {self.currency.upper()}")
-                    break
-                if self.current_bet > self.max_bet:
-                    console.print(f"\n[cyan]⚠️ current_bet reset base.[/cyan]")
-                    self.current_bet = self.base_bet
-
-                rule, bet_value = self.chance_to_rule_and_threshold()
-                data, _ = self.place_dice_bet(amount=self.current_bet, rule=rule, bet_value=bet_value)
-                if not data:
-                    time.sleep(self.cooldown)
-                    continue
-
-                bet = data.get("bet")
-                if bet is None:
-                    time.sleep(self.cooldown)
-                    continue
-
-                state = bet.get("state")
-                profit = float(bet.get("profit", 0) or 0)
-                total_bets += 1
-                result_value = str(bet.get("result_value"))
-
-                if state == "win":
-                    self.session_profit += profit
-                    win_count += 1
-                    outcome = "[green]WIN[/green]"
-                    self.current_bet = self.base_bet
-                    self.loss_streak_total = 0.0
-                    display_profit = f"[green]{profit:.8f}[/green]"
-                else:
-                    loss_amount = float(bet.get("amount", self.current_bet))
-                    self.session_profit -= float(loss_amount)
-                    lose_count += 1
-                    outcome = "[red]LOSE[/red]"
-                    self.current_bet = round(self.current_bet * self.multiplier_factor, 12)
-                    self.loss_streak_total += loss_amount
-                    display_profit = f"[red]{-self.loss_streak_total:.8f}[/red]"
-
-                arrow = "⬆" if rule == "over" else "⬇"
-                self.bet_history.append([
-                    f"{arrow} {bet_value:.2f}",
-                    result_value,
-                    f"{self.current_bet:.8f}",
-                    outcome,
-                    display_profit
-                ])
-
-                current_balance = start_balance + self.session_profit
-                self._update_ui(start_balance, current_balance, total_bets, win_count, lose_count, live)
-                time.sleep(self.cooldown)
-
-        final_runtime = time.strftime("%H:%M:%S", time.gmtime(int(time.time() - self.start_time)))
-        final_panel = self._summary_panel(start_balance, start_balance + self.session_profit, total_bets, win_count, lose_count, final_runtime)
-        console.print(final_panel)
-
-    def run(self):
-        self.session_count += 1
-        self.martingale()
-
-
-if __name__ == "__main__":
-    bot = WolfBetBot("config.json")
-
-    while True:
-        bot.run()
-        if not bot.auto_start:
-            break
-        console.print(f"\n[cyan]🔄 Auto-restart in {bot.auto_start_delay} seconds...[/cyan]")
-        time.sleep(bot.auto_start_delay)
+from wolfdice.cli import main
+from wolfdice.engine import WolfBetBot as _WolfBetBot
+
+# ---------------- WolfBet dice bot (dashboard classic) ----------------
+# Enjin dalam wolfdice.engine, paparan dalam wolfdice.frontends.classic.
+#   python bot.py [config.json] [--headless] [--ui v2]
+
+
+class WolfBetBot(_WolfBetBot):
+    default_ui = "classic"
+
+
+if __name__ == "__main__":
+    main(WolfBetBot)
@@ -0,0 +1,171 @@
+import argparse
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from rich.console import Console
+from rich.layout import Layout
+from rich.live import Live
+from rich.panel import Panel
+from rich.table import Table
+from rich.text import Text
+
+from wolfdice.engine import WolfBetBot
+from wolfdice.money import fmt
+from wolfdice.render import Renderer
+from wolfdice.transport import close_sessions
+
+# ---------------- Multi-account runner ----------------
+# Jalankan banyak WolfBetBot (akaun / currency berbeza) dalam satu process.
+# Setiap bot ada thread sendiri; bot dengan token sama kongsi connection
+# pool dan pacer rate limit. Satu dashboard untuk semua bot.
+#
+#   python multibot.py accounts.json
+#
+# accounts.json:
+#   {
+#     "defaults": "config.json",          <- fail atau object, dipakai semua bot
+#     "bots": [
+#       {"name": "doge", "currency": "doge"},
+#       {"name": "trx", "currency": "trx", "base_bet": 0.001},
+#       {"name": "akaun-2", "config": "akaun2.json"}
+#     ]
+#   }
+
+console = Console()
+
+
+def _load(value, base_dir):
+    if isinstance(value, str):
+        with open(os.path.join(base_dir, value), "r") as f:
+            return json.load(f)
+    return dict(value or {})
+
+
+def load_accounts(path):
+    base_dir = os.path.dirname(os.path.abspath(path))
+    with open(path, "r") as f:
+        spec = json.load(f)
+    if isinstance(spec, list):
+        spec = {"bots": spec}
+
+    defaults = _load(spec.get("defaults"), base_dir)
+    entries = []
+    for i, entry in enumerate(spec.get("bots", [])):
+        entry = dict(entry)
+        cfg = dict(defaults)
+        if "config" in entry:
+            cfg.update(_load(entry.pop("config"), base_dir))
+        name = entry.pop("name", None)
+        cfg.update(entry)
+        entries.append((name or f"{cfg.get('currency', 'btc')}#{i + 1}", cfg))
+    return entries
+
+
+class Slot:
+    def __init__(self, name, bot):
+        self.name = name
+        self.bot = bot
+        self.status = "mula"
+        self.last_reason = ""
+
+
+class Supervisor:
+    def __init__(self, entries, fps=4):
+        self.slots = [Slot(name, WolfBetBot(cfg=dict(cfg, name=name))) for name, cfg in entries]
+        self.fps = fps
+        self.stopping = threading.Event()
+        self.start_time = time.time()
+
+    def _worker(self, slot):
+        bot = slot.bot
+        while not self.stopping.is_set():
+            slot.status = "jalan"
+            reason = bot.run(dashboard=False)
+            if reason is None:
+                slot.last_reason = "Tak dapat baca balance"
+            else:
+                slot.last_reason = Text.from_markup(reason).plain
+            if not bot.auto_start or self.stopping.is_set():
+                break
+            slot.status = f"restart {bot.auto_start_delay}s"
+            self.stopping.wait(bot.auto_start_delay)
+        slot.status = "selesai"
+
+    # -------------- Dashboard --------------
+    def _table(self):
+        table = Table(show_header=True, header_style="bold magenta", expand=True)
+        for col in ("Bot", "Currency", "Sesi", "Bet", "W/L", "Profit", "Bet/s", "Rate", "Status"):
+            table.add_column(col)
+
+        total_bets, total_speed = 0, 0.0
+        profit_by_currency = {}
+        for slot in self.slots:
+            bot = slot.bot
+            bets, profit = bot.total_bets, bot.session_profit
+            elapsed = max(1e-9, time.time() - bot.start_time) if bot.start_time else 0
+            speed = bets / elapsed if elapsed else 0.0
+            total_bets += bets
+            total_speed += speed
+            cur = bot.currency.upper()
+            profit_by_currency[cur] = profit_by_currency.get(cur, 0) + profit
+            color = "green" if profit >= 0 else "red"
+            status = slot.status if not slot.last_reason else f"{slot.status} | {slot.last_reason}"
+            table.add_row(
+                slot.name, cur, str(bot.session_count), str(bets),
+                f"{bot.win_count}/{bot.lose_count}", f"[{color}]{fmt(profit)}[/{color}]",
+                f"{speed:.1f}", bot.pacer.describe(), status,
+            )
+        return table, total_bets, total_speed, profit_by_currency
+
+    def _build_ui(self):
+        table, total_bets, total_speed, profit_by_currency = self._table()
+        runtime = time.strftime("%H:%M:%S", time.gmtime(int(time.time() - self.start_time)))
+        profits = "  ".join(f"{c}: {fmt(p)}" for c, p in profit_by_currency.items())
+        txt = (
+            f"[bold white]Runtime :[/bold white] {runtime}   "
+            f"[bold magenta]Bot :[/bold magenta] {len(self.slots)}   "
+            f"[bold cyan]Jumlah BET :[/bold cyan] {total_bets}   "
+            f"[bold yellow]Speed :[/bold yellow] {total_speed:.1f} bets/s\n"
+            f"[bold green]Profit sesi :[/bold green] {profits}"
+        )
+        layout = Layout()
+        layout.split(
+            Layout(Panel(txt, title="🐺 Multi Bot", border_style="bold blue"), name="summary", size=4),
+            Layout(table, name="bots"),
+        )
+        return layout
+
+    def run(self):
+        with Live(screen=True, auto_refresh=False) as live:
+            renderer = Renderer(self._build_ui, live, fps=self.fps).start()
+            pool = ThreadPoolExecutor(max_workers=len(self.slots), thread_name_prefix="wolfdice-bot")
+            futures = [pool.submit(self._worker, slot) for slot in self.slots]
+            try:
+                while not all(f.done() for f in futures):
+                    time.sleep(0.2)
+            except KeyboardInterrupt:
+                self.stopping.set()
+                for slot in self.slots:
+                    slot.bot.stop_requested = True
+            finally:
+                pool.shutdown(wait=True)
+                renderer.stop()
+                for slot in self.slots:
+                    slot.bot.close()
+                close_sessions()
+        table, _, _, _ = self._table()
+        console.print(table)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Jalankan banyak WolfBetBot dalam satu process")
+    ap.add_argument("accounts", nargs="?", default="accounts.json")
+    ap.add_argument("--fps", type=float, default=4)
+    args = ap.parse_args(argv)
+    Supervisor(load_accounts(args.accounts), fps=args.fps).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+import json
+import random
+import unittest
+from decimal import Decimal
+from types import SimpleNamespace
+
+from wolfdice import money
+from wolfdice.engine import WolfBetBot
+from wolfdice.money import SAT, fmt, to_units
+from wolfdice.transport import prepare_bet
+
+# ---------------- wolfdice.money ----------------
+# Sifat fixed-point dengan seed tetap (Decimal sebagai rujukan): parse string
+# server, round-trip fmt, nilai config, payload /bet/place dan profit yang
+# di-settle. Jalankan: python -m pytest tests  (atau python -m unittest)
+
+SEED = 20240501
+N = 20000
+
+
+def _decimal_units(text):
+    return int(Decimal(text) * SAT)
+
+
+class ToUnitsTest(unittest.TestCase):
+    def test_eight_decimal_boundaries(self):
+        cases = {
+            "0.00000000": 0,
+            "0.00000001": 1,
+            "-0.00000001": -1,
+            "0.99999999": SAT - 1,
+            "1.00000000": SAT,
+            "1.00000001": SAT + 1,
+            "-1.00000000": -SAT,
+            "9999999.99999999": 10 ** 15 - 1,     # hujung laluan float
+            "-9999999.99999999": -(10 ** 15 - 1),
+            "10000000.00000000": 10 ** 15,        # laluan Decimal
+            "92233720368.54775807": 2 ** 63 - 1,
+            "-92233720368.54775808": -(2 ** 63),
+        }
+        for text, units in cases.items():
+            self.assertEqual(to_units(text), units, text)
+
+    def test_short_and_long_strings(self):
+        self.assertEqual(to_units("1.5"), 150000000)
+        self.assertEqual(to_units("0"), 0)
+        self.assertEqual(to_units("-0.5"), -50000000)
+        # lebih 8 d.p.: bundar half-even melalui Decimal
+        self.assertEqual(to_units("0.000000015"), 2)
+        self.assertEqual(to_units("0.000000025"), 2)
+        self.assertEqual(to_units("-0.000000015"), -2)
+
+    def test_config_values(self):
+        self.assertEqual(to_units(0.00000004), 4)
+        self.assertEqual(to_units(1e-8), 1)
+        self.assertEqual(to_units(0.1), 10000000)
+        self.assertEqual(to_units(-0.0005), -50000)
+        self.assertEqual(to_units(5), 5 * SAT)
+        self.assertEqual(to_units(None), 0)
+        self.assertEqual(to_units(""), 0)
+
+    def test_random_server_strings(self):
+        rng = random.Random(SEED)
+        for _ in range(N):
+            units = rng.randrange(-(10 ** rng.randrange(1, 19)), 10 ** rng.randrange(1, 19))
+            text = fmt(units)
+            self.assertEqual(to_units(text), units, text)
+            self.assertEqual(_decimal_units(text), units, text)
+            short = text.rstrip("0").rstrip(".") or "0"   # "1.50000000" -> "1.5"
+            self.assertEqual(to_units(short), units, short)
+
+    def test_random_config_floats(self):
+        rng = random.Random(SEED + 1)
+        for _ in range(N // 10):
+            units = rng.randrange(1, 10 ** rng.randrange(1, 16))
+            text = fmt(units).rstrip("0").rstrip(".")
+            self.assertEqual(to_units(json.loads(text)), units, text)
+
+    def test_cache_limit(self):
+        # lebih dari _CACHE_MAX nilai berbeza: cache dikosongkan, hasil tetap betul
+        rng = random.Random(SEED + 2)
+        values = [rng.randrange(-(10 ** 12), 10 ** 12) for _ in range(money._CACHE_MAX * 2 + 10)]
+        for units in values:
+            self.assertEqual(to_units(fmt(units)), units)
+        self.assertLessEqual(len(money._units_cache), money._CACHE_MAX)
+        self.assertLessEqual(len(money._str_cache), money._CACHE_MAX)
+        for units in values[:50]:
+            self.assertEqual(to_units(fmt(units)), units)
+
+
+class FmtTest(unittest.TestCase):
+    def test_boundaries(self):
+        self.assertEqual(fmt(0), "0.00000000")
+        self.assertEqual(fmt(1), "0.00000001")
+        self.assertEqual(fmt(-1), "-0.00000001")
+        self.assertEqual(fmt(SAT - 1), "0.99999999")
+        self.assertEqual(fmt(SAT), "1.00000000")
+        self.assertEqual(fmt(-SAT - 1), "-1.00000001")
+        self.assertEqual(fmt(2 ** 63 - 1), "92233720368.54775807")
+
+    def test_sign(self):
+        self.assertEqual(fmt(4, sign=True), "+0.00000004")
+        self.assertEqual(fmt(-4, sign=True), "-0.00000004")
+        self.assertEqual(fmt(0, sign=True), "+0.00000000")
+
+    def test_random_roundtrip(self):
+        rng = random.Random(SEED + 3)
+        for _ in range(N):
+            units = rng.randrange(-(10 ** 18), 10 ** 18)
+            text = fmt(units)
+            self.assertEqual(Decimal(text), Decimal(units) / SAT, text)
+            self.assertEqual(to_units(text), units, text)
+            self.assertEqual(fmt(units, sign=True).lstrip("+"), text)
+
+
+class SettleRoundTripTest(unittest.TestCase):
+    def test_payload_amount(self):
+        rng = random.Random(SEED + 4)
+        for units in [1, SAT - 1, SAT, 10 ** 15 - 1, 10 ** 15] + [rng.randrange(1, 10 ** 14) for _ in range(2000)]:
+            req = prepare_bet("doge", units, "under", 10.0)
+            self.assertEqual(to_units(req.payload["amount"]), units)
+            self.assertEqual(to_units(json.loads(req.body)["amount"]), units)
+
+    def test_profit_sum(self):
+        # response server -> _account: jumlah profit int sama tepat dengan Decimal
+        rng = random.Random(SEED + 5)
+        bot = SimpleNamespace(session_profit=0, total_bets=0, win_count=0, lose_count=0)
+        lane = SimpleNamespace(current_bet=0, loss_streak_total=0)
+        total = Decimal(0)
+        for _ in range(N):
+            amount = rng.randrange(1, 10 ** rng.randrange(1, 12))
+            win = rng.random() < 0.5
+            profit = round(amount * 8.9) if win else -amount
+            bet = {"state": "win" if win else "lose", "profit": fmt(profit), "amount": fmt(amount), "result_value": "1.5"}
+            got_win, got_amount, pnl, _ = WolfBetBot._account(bot, bet, lane)
+            self.assertEqual((got_win, got_amount, pnl), (win, amount, profit))
+            total += Decimal(bet["profit"])
+        self.assertEqual(Decimal(bot.session_profit) / SAT, total)
+        self.assertEqual(bot.total_bets, N)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1 @@
+# Modul sokongan untuk WolfBetBot (bot.py / V2bot.py)
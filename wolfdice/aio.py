@@ -0,0 +1,145 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from wolfdice.retry import AMBIGUOUS, NETWORK
+
+# ---------------- Async bet engine ----------------
+# Simpan sehingga `bot.inflight` bet serentak. Setiap lane ialah satu rantaian
+# strategy yang bebas (next stake bergantung pada result lane itu sahaja).
+# Kalau strategy.independent (cth. flat bet, multiplier == 1.0) stake tak
+# bergantung pada result, jadi satu lane boleh ada banyak bet in-flight.
+#
+# Result di-settle ikut turutan hantar (seq), jadi accounting sama seperti
+# mode sync. Bet baru hanya dihantar kalau worst case (semua bet in-flight
+# kalah) masih di atas stop_loss - sama syarat dengan loop sync.
+#
+# Bet yang gagal secara samar (timeout / network / 5xx / malformed) ditahan:
+# tiada bet baru dihantar sehingga semua bet in-flight selesai, kemudian baki
+# server disemak sekali untuk semua bet samar (bot._reconcile) sebelum lane
+# cuba semula.
+
+
+class Lane:
+    __slots__ = ("index", "strategy", "next_bet", "current_bet", "loss_streak_total", "busy")
+
+    def __init__(self, index, strategy):
+        self.index = index
+        self.strategy = strategy
+        self.next_bet = strategy.first()
+        self.current_bet = self.next_bet[0]
+        self.loss_streak_total = 0   # unit 1e-8
+        self.busy = False
+
+
+def _free_lane(lanes, flat):
+    if flat:
+        return lanes[0]
+    for lane in lanes:
+        if not lane.busy:
+            return lane
+    return None
+
+
+async def _engine(bot, pool):
+    loop = asyncio.get_running_loop()
+    flat = bot.strategy.independent
+    lanes = [Lane(i, bot.strategy.clone()) for i in range(1 if flat else bot.lanes)]
+
+    pending = {}    # future -> (seq, lane, rule, bet_value, amount, request)
+    finished = {}   # seq -> (lane, rule, bet_value, amount, request, data, status)
+    suspects = []   # (lane, amount, rule, bet_value, request) gagal samar, tunggu semak baki
+    next_seq = 0
+    settle_seq = 0
+    reason = None
+
+    while True:
+        if bot.scheduler is not None and reason is None:
+            cfg = bot.scheduler.poll(bot)
+            if cfg is not None:
+                # strategy baru: lane baru; bet in-flight di lane lama tetap di-settle
+                # ikut turutan seq. Strategy sama: lane (dan langkah ladder) kekal
+                if bot.apply_config(cfg):
+                    flat = bot.strategy.independent
+                    lanes = [Lane(i, bot.strategy.clone()) for i in range(1 if flat else bot.lanes)]
+
+        if suspects and not pending:
+            # semua bet lain sudah selesai: beza baki server kini datang dari bet samar sahaja
+            bets = await loop.run_in_executor(pool, bot._reconcile, [s[1:] for s in suspects])
+            for (lane, _, rule, bet_value, _), bet in zip(suspects, bets or [None] * len(suspects)):
+                lane.busy = False
+                if bet is not None:
+                    _settle(bot, bet, rule, bet_value, lane)
+                    if reason is None:
+                        reason = bot._stop_reason()
+            suspects.clear()
+            if reason is None and bot.stop_requested:
+                reason = bot._stop_reason()   # dihentikan semasa menunggu baki
+
+        # hantar bet baru selagi ada slot, lane kosong dan had stop-loss selamat
+        while reason is None and not suspects and len(pending) < bot.inflight:
+            lane = _free_lane(lanes, flat)
+            if lane is None:
+                break
+            if flat:
+                lane.next_bet = lane.strategy.first()   # rule auto dipilih semula
+            amount, rule, bet_value, request = lane.next_bet
+            # stake (unit) yang belum di-settle: in-flight + siap tetapi menunggu seq lebih awal
+            exposure = sum(p[4] for p in pending.values()) + sum(f[3] for f in finished.values())
+            if bot.session_profit - exposure <= bot.stop_loss:
+                break
+            if bot.max_bets and bot.total_bets + len(pending) + len(finished) >= bot.max_bets:
+                break
+
+            wait = bot.pacer.reserve()
+            if wait > 0:
+                if bot.metrics is not None:
+                    bot.metrics.stages["pace"].observe(int(wait * 1e9))
+                await asyncio.sleep(wait)
+            fut = loop.run_in_executor(pool, bot.place_dice_bet, amount, rule, bet_value, request)
+            pending[fut] = (next_seq, lane, rule, bet_value, amount, request)
+            lane.busy = True
+            next_seq += 1
+
+        if not pending:
+            return reason or bot._stop_reason()
+
+        done, _ = await asyncio.wait(list(pending), return_when=asyncio.FIRST_COMPLETED)
+        for fut in done:
+            seq, lane, rule, bet_value, amount, request = pending.pop(fut)
+            try:
+                data, status = fut.result()
+            except Exception:
+                data, status = None, NETWORK
+            finished[seq] = (lane, rule, bet_value, amount, request, data, status)
+
+        # settle ikut turutan seq
+        while settle_seq in finished:
+            lane, rule, bet_value, amount, request, data, status = finished.pop(settle_seq)
+            settle_seq += 1
+            lane.busy = False
+
+            bet = data.get("bet") if data else None
+            if bet is None:
+                # gagal: lane cuba semula dengan stake yang sama (selepas semak baki kalau samar)
+                if bot._bet_failed(data, status) in AMBIGUOUS and bot.retry_reconcile:
+                    lane.busy = True
+                    suspects.append((lane, amount, rule, bet_value, request))
+                if reason is None:
+                    reason = bot._stop_reason()
+                continue
+            if bot.retry.streak:
+                bot.retry.streak = 0
+            _settle(bot, bet, rule, bet_value, lane)
+            if reason is None:
+                reason = bot._stop_reason()
+
+
+def _settle(bot, bet, rule, bet_value, lane):
+    bot._settle(bet, rule, bet_value, lane)
+    bot.current_bet = lane.current_bet
+    bot.loss_streak_total = lane.loss_streak_total
+
+
+def run_async(bot):
+    with ThreadPoolExecutor(max_workers=bot.inflight) as pool:
+        return asyncio.run(_engine(bot, pool))
@@ -0,0 +1,129 @@
+import threading
+import time
+
+from wolfdice.money import to_units
+
+# ---------------- Balance reconciler ----------------
+# Ambil /user/balances dalam thread sendiri setiap `interval` saat, jauh dari
+# loop bet. Hasil di-parse sekali ke dict {currency: amount}, jadi lookup O(1)
+# dan tiada scan list dalam hot path. Bot yang guna akaun sama kongsi satu
+# reconciler (satu request untuk semua currency); setiap bot daftar listener
+# untuk kira drift antara baki server dan baki tempatan (start + profit).
+
+
+class BalanceReconciler:
+    def __init__(self, fetch, interval=15.0, log=None):
+        self.fetch = fetch          # callable -> [{"currency": ..., "amount": ...}] atau None
+        self.interval = float(interval)
+        self.log = log
+        self.balances = {}          # currency -> int unit 1e-8; diganti sekali gus setiap refresh
+        self.updated = None         # time.monotonic() refresh terakhir yang berjaya
+        self.refreshes = 0
+        self.failures = 0
+        self.listeners = []         # callable(balances), dipanggil dari thread reconciler
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def refresh(self):
+        # satu fetch (blocking); pulangkan True kalau berjaya
+        with self._lock:
+            raw = self.fetch()
+            if not raw:
+                self.failures += 1
+                return False
+            balances = {}
+            for b in raw:
+                try:
+                    balances[str(b.get("currency", "")).lower()] = to_units(b.get("amount"))
+                except (TypeError, ValueError, ArithmeticError):
+                    continue
+            self.balances = balances
+            self.updated = time.monotonic()
+            self.refreshes += 1
+        for listener in list(self.listeners):
+            listener(balances)
+        return True
+
+    def get(self, currency):
+        return self.balances.get(currency)
+
+    def age(self):
+        return None if self.updated is None else time.monotonic() - self.updated
+
+    def start(self):
+        if self.interval <= 0 or (self._thread is not None and self._thread.is_alive()):
+            return self
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="wolfdice-balance", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join()
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                self.failures += 1
+                if self.log:
+                    self.log(f"balance refresh gagal: {e}")
+
+    def describe(self):
+        age = self.age()
+        if age is None:
+            return "-"
+        return f"{age:.0f}s lalu ({self.refreshes} ok / {self.failures} gagal)"
+
+
+class DriftTracker:
+    # drift = baki server - baki tempatan. Bet in-flight buat bacaan lari sekejap
+    # (server sudah kira bet, bot belum settle), jadi drift hanya dibetulkan bila
+    # dua refresh berturut-turut beri nilai yang sama. Nilai dalam unit 1e-8 (int).
+    def __init__(self, tolerance=0):
+        self.tolerance = tolerance
+        self.drift = 0
+        self.corrections = 0
+        self._last = None
+
+    def observe(self, server, local):
+        drift = server - local
+        last, self._last = self._last, drift
+        if last is None or abs(drift - last) > self.tolerance:
+            return False
+        if abs(drift - self.drift) <= self.tolerance:
+            return False
+        self.drift = drift
+        self.corrections += 1
+        return True
+
+    def assume(self, drift):
+        # nilai pasti (baki dibaca bila tiada bet in-flight): terus dipakai
+        if drift != self.drift:
+            self.drift = drift
+            self.corrections += 1
+        self._last = None
+
+    def reset(self):
+        self.drift = 0
+        self._last = None
+
+
+_reconcilers = {}
+_reconcilers_lock = threading.Lock()
+
+
+def get_reconciler(key, fetch, interval=15.0, log=None):
+    # key = (token, api_base); key kosong = reconciler sendiri (cth. simulator)
+    if not key:
+        return BalanceReconciler(fetch, interval, log)
+    with _reconcilers_lock:
+        rec = _reconcilers.get(key)
+        if rec is None:
+            rec = BalanceReconciler(fetch, interval, log)
+            _reconcilers[key] = rec
+        return rec
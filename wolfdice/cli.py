@@ -0,0 +1,33 @@
+import argparse
+import time
+
+from wolfdice.frontends import FRONTENDS
+from wolfdice.transport import close_sessions
+
+# ---------------- Entry point ----------------
+# Dikongsi oleh bot.py dan V2bot.py: parse argumen, bina bot, jalankan sesi dan
+# auto-restart. Frontend (dan rich) hanya diimport bila sesi bermula.
+
+
+def main(bot_cls, argv=None, description="WolfBet dice bot"):
+    ap = argparse.ArgumentParser(description=description)
+    ap.add_argument("config", nargs="?", default="config.json")
+    ap.add_argument("--headless", action="store_true", help="tanpa dashboard; satu baris status setiap status_interval saat")
+    ap.add_argument("--ui", choices=[n for n in FRONTENDS if n != "headless"],
+                    help=f"dashboard (default: {bot_cls.default_ui})")
+    args = ap.parse_args(argv)
+    bot = bot_cls(args.config, ui=args.ui)
+    if args.headless:
+        bot.headless = True
+
+    try:
+        while True:
+            bot.run()
+            if not bot.auto_start:
+                break
+            bot._say(f"\n[cyan]🔄 Auto-restart in {bot.auto_start_delay} seconds...[/cyan]")
+            time.sleep(bot.auto_start_delay)
+    finally:
+        # hentikan thread latar dan tutup connection pool keep-alive sebelum process keluar
+        bot.close()
+        close_sessions()
@@ -0,0 +1,98 @@
+import json
+
+try:
+    import orjson
+except ImportError:   # optional: pip install orjson
+    orjson = None
+
+# ---------------- /bet/place response decode ----------------
+# Bot cuma perlu 4 medan dari setiap response: bet.state, bet.profit,
+# bet.amount dan bet.result_value. Tiga cara decode:
+#   "orjson" - parse penuh dengan orjson (C, kalau dipasang)
+#   "scan"   - cari 4 medan terus dengan str.find + slice, tanpa bina dict penuh
+#   "json"   - json.loads stdlib (cara asal, sama seperti r.json())
+# "auto" = orjson kalau ada, kalau tidak scan. Scan hanya terima bentuk yang
+# mudah (objek bet rata, string tanpa escape); selain itu (error, objek
+# bersarang, JSON rosak) ia jatuh balik ke parse penuh, jadi hasilnya sentiasa
+# sama dengan json.loads untuk 4 medan tersebut.
+#
+# Hasil: dict seperti response asal, {"bet": {...}}, atau None kalau JSON rosak.
+
+FIELDS = ("state", "profit", "amount", "result_value")
+DECODERS = ("auto", "orjson", "scan", "json")
+
+_KEYS = tuple((name, f'"{name}":', len(name) + 3) for name in FIELDS)
+
+
+def _loads_json(raw):
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return None
+
+
+def _loads_orjson(raw):
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return None
+
+
+_loads = _loads_orjson if orjson is not None else _loads_json
+
+
+def _scan(raw):
+    # str.find + slice sahaja; None = bentuk luar biasa, biar parse penuh yang urus
+    try:
+        text = raw.decode()
+    except UnicodeDecodeError:
+        return None
+    start = text.find('"bet":')
+    if start < 0:
+        return None
+    start = text.find("{", start + 6)
+    end = text.find("}", start)
+    if start < 0 or end < 0 or text.find("{", start + 1, end) >= 0 or text.find("\\", start, end) >= 0:
+        return None   # objek bet bersarang, escape atau rosak
+    bet = {}
+    for name, key, n in _KEYS:
+        i = text.find(key, start, end)
+        if i < 0:
+            return None
+        i += n
+        j = text.find(",", i, end)
+        value = text[i:end if j < 0 else j].strip()   # buang semua whitespace (space, tab, newline)
+        if not value or value[0] in "[ntf":   # list / null / true / false
+            return None
+        if value[0] == '"':
+            if len(value) < 2 or value[-1] != '"' or '"' in value[1:-1]:
+                return None   # string dengan koma / quote di dalam, atau rosak
+            value = value[1:-1]
+        bet[name] = value
+    return {"bet": bet}
+
+
+def scan_bet(raw):
+    # laluan pantas; jatuh balik ke parse penuh untuk bentuk lain
+    data = _scan(raw)
+    return data if data is not None else _loads(raw)
+
+
+def get_decoder(name="auto"):
+    # pulangkan fungsi bytes -> dict|None
+    name = str(name or "auto").lower()
+    if name == "auto":
+        return _loads_orjson if orjson is not None else scan_bet
+    if name == "orjson":
+        if orjson is None:
+            raise ValueError("json_decoder orjson dipilih tetapi orjson tidak dipasang")
+        return _loads_orjson
+    if name == "scan":
+        return scan_bet
+    if name == "json":
+        return _loads_json
+    raise ValueError(f"json_decoder tidak dikenali: {name} (pilih: {', '.join(DECODERS)})")
+
+
+def decoder_name(decode):
+    return {_loads_orjson: "orjson", scan_bet: "scan", _loads_json: "json"}.get(decode, "?")
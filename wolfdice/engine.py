@@ -0,0 +1,640 @@
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from time import perf_counter_ns
+from wolfdice.transport import HttpBackend, get_session, prepare_bet, timeouts
+from wolfdice.simulator import DiceSimulator
+from wolfdice.decode import get_decoder
+from wolfdice.aio import run_async
+from wolfdice.ratelimit import get_pacer
+from wolfdice.history import BetHistory
+from wolfdice.strategy import config_key as strategy_key, from_config as strategy_from_config
+from wolfdice.money import SAT, fmt, to_units
+from wolfdice.metrics import Metrics, MetricsDumper, profiled
+from wolfdice.balance import DriftTracker, get_reconciler
+from wolfdice.stats import StreamStats
+from wolfdice.retry import AMBIGUOUS, AUTH, RetryPolicy, classify
+from wolfdice.schedule import RESTART_KEYS, Scheduler
+from wolfdice.journal import JournalWriter, archive as archive_journal, load as load_journal
+from wolfdice.frontends import get_frontend
+
+# ---------------- Bet engine ----------------
+# Satu enjin untuk semua frontend: transport, strategy loop (sync / async),
+# accounting, journal, metrics dan hot reload. Paparan (dashboard Rich classic
+# / v2, atau headless) ialah frontend dalam wolfdice.frontends; bot.py dan
+# V2bot.py hanya pilih frontend. Modul ini tidak import rich.
+
+API_BASE = "https://wolfbet.com/api/v1"
+RECONCILE_MAX = 4     # had bet samar serentak yang dipadankan dengan baki (3**n gabungan)
+RECONCILE_TRIES = 3   # cubaan GET /user/balances untuk satu semakan
+
+
+class WolfBetBot:
+    default_ui = "classic"   # frontend dashboard bila tidak headless (classic / v2)
+
+    def __init__(self, cfg_path="config.json", cfg=None, ui=None):
+        if cfg is None:
+            with open(cfg_path, "r") as f:
+                cfg = json.load(f)
+        else:
+            cfg_path = None   # config dari caller (multibot): tiada fail untuk diperhati
+        self.cfg = cfg
+
+        # hot reload config.json + rotation profile (wolfdice.schedule); dipakai antara dua bet
+        self.scheduler = None
+        if (cfg_path and cfg.get("hot_reload", True)) or cfg.get("profiles"):
+            self.scheduler = Scheduler(cfg_path, cfg)
+            self.cfg = self.scheduler.config()
+
+        # backend: "http" (WolfBet sebenar) atau "sim" (simulator tempatan, tanpa duit)
+        self.backend_name = str(self.cfg.get("backend", "http")).lower()
+        token = self.cfg.get("access_token", "").strip()
+        if not token and self.backend_name != "sim":
+            raise ValueError("access_token kosong dalam config.json")
+
+        self.headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "X-Requested-With": "XMLHttpRequest",
+        }
+        # satu session keep-alive (connection pool) untuk semua REST call
+        self.pool_size = max(int(self.cfg.get("pool_size", 4)), int(self.cfg.get("inflight", 1)))
+        self.timeout = timeouts(self.cfg)
+        # nama bot (multibot.py) untuk journal / metrics; default = currency
+        self.name = str(self.cfg.get("name") or self.cfg.get("currency", "btc"))
+        # histogram masa setiap peringkat bet; "metrics": false = tiada timer
+        self.metrics = Metrics(self.name) if self.cfg.get("metrics", True) else None
+        if self.backend_name == "sim":
+            self.session = None
+            self.backend = DiceSimulator.from_config(self.cfg)
+        else:
+            self.session = get_session(token, self.headers, self.pool_size)
+            api_base = str(self.cfg.get("api_base", API_BASE)).rstrip("/")
+            self.backend = HttpBackend(
+                self.session, api_base, self.timeout, log=self._log_error, metrics=self.metrics,
+                decode=get_decoder(self.cfg.get("json_decoder", "auto")),
+            )
+
+        self.currency = str(self.cfg.get("currency", "btc")).lower()
+        # kegagalan /bet/place: counter setiap kelas, backoff berjitter, semak baki bila samar
+        self.retry = RetryPolicy()
+        self._strategies = {}   # strategy_key -> Strategy; tukar balik ke profile lama tanpa bina semula ladder
+        self.strategy = None
+        self._apply_settings()
+
+        # pacer belajar had server dari header x-ratelimit-*; cooldown_sec = jarak minimum antara bet.
+        # Bot dengan token sama kongsi satu pacer (budget rate limit ikut akaun).
+        self.pacer = get_pacer(
+            token,
+            window=float(self.cfg.get("ratelimit_window_sec", 60)),
+            min_interval=self.cooldown,
+        )
+
+        # baki server di-refresh dalam thread setiap balance_refresh_sec (0 = tiada);
+        # bot dengan token sama kongsi satu reconciler. drift = server - baki tempatan.
+        key = None if self.session is None else (token, self.backend.api_base)
+        self.reconciler = get_reconciler(
+            key, self.backend.get_balances,
+            interval=float(self.cfg.get("balance_refresh_sec", 15)), log=self._log_error,
+        )
+        self.reconciler.listeners.append(self._on_balances)
+        self.drift = DriftTracker()
+
+        self.session_profit = 0
+        self.next_bet = self.strategy.first()   # (amount, rule, bet_value, request)
+        self.current_bet = self.base_bet
+        self.bet_history = BetHistory(int(self.cfg.get("history_size", 64)))  # ring buffer, medan mentah
+        # win rate, drawdown, streak & edge; O(1) setiap bet, memori tetap
+        self.stats = StreamStats(self.chance, int(self.cfg.get("stats_window", 1000)))
+        self.start_time = None   # untuk runtime tracking
+        self.loss_streak_total = 0  # cumulative lose streak
+        self.session_count = 0   # NEW: session counter
+        self.stop_requested = False   # set dari thread lain untuk henti sesi
+        self.halt = None              # sebab sesi dihentikan oleh ralat (auth / retry_limit)
+        self.start_balance = 0
+        self.win_count, self.lose_count, self.total_bets = 0, 0, 0
+
+        # engine: "sync" (satu bet pada satu masa), "pipeline" (sync, bet seterusnya
+        # disediakan semasa bet in-flight) atau "async" (N bet in-flight)
+        self.engine = str(self.cfg.get("engine", "sync")).lower()
+        self.inflight = max(1, int(self.cfg.get("inflight", 4)))
+        self.lanes = max(1, int(self.cfg.get("lanes", self.inflight)))
+
+        # frontend: dashboard Rich (classic / v2) atau headless; modul frontend (dan rich)
+        # hanya diimport bila pertama kali diperlukan. Dashboard dilukis oleh render thread.
+        self.ui = str(ui or self.default_ui).lower()
+        self._frontend = None
+        self.ui_fps = float(self.cfg.get("ui_fps", 4))
+        self.renderer = None
+
+        # headless: tiada logo / Rich Live; satu baris status (text / json) setiap status_interval saat
+        self.headless = bool(self.cfg.get("headless", False))
+        self.status_interval = float(self.cfg.get("status_interval", 5))
+
+        # journal binari setiap bet; sesi yang tak tamat (crash / restart) disambung semula
+        journal = str(self.cfg.get("journal") or "")
+        self.journal_path = journal.format(currency=self.currency, name=self.name)
+        self.resume = bool(self.cfg.get("resume", True))
+        self.journal = None
+
+        # dump metrics berkala (jsonl / prom) dan profiler sekitar sesi (cprofile / sample)
+        self.metrics_dump = str(self.cfg.get("metrics_dump") or "").format(name=self.name)
+        self.metrics_format = str(self.cfg.get("metrics_format", "jsonl")).lower()
+        self.metrics_interval = float(self.cfg.get("metrics_interval", 10))
+        self.profile = str(self.cfg.get("profile") or "").lower()
+        ext = ".prof" if self.profile == "cprofile" else ".folded"
+        self.profile_out = str(self.cfg.get("profile_out") or f"profile/{{name}}{ext}").format(name=self.name)
+
+        if self.scheduler is not None:
+            self.scheduler.log = self._log_error
+        self._restart_keys = []   # tetapan yang berubah dalam fail tetapi perlu restart
+
+    @property
+    def frontend(self):
+        # dibina semula kalau headless / ui ditukar selepas bot dibina (cth. --headless)
+        name = "headless" if self.headless else self.ui
+        frontend = self._frontend
+        if frontend is None or frontend.name != name:
+            frontend = self._frontend = get_frontend(name)(self)
+        return frontend
+
+    # ---------------- Settings ----------------
+    def _apply_settings(self):
+        # tetapan yang boleh ditukar semasa bot berjalan (hot reload / profile)
+        cfg = self.cfg
+        # amount / profit / baki: int unit 1e-8 (wolfdice.money), tepat seperti baki server
+        self.base_bet = to_units(cfg.get("base_bet", 0.00000001))
+        self.multiplier_factor = float(cfg.get("multiplier", 2.0))
+        self.max_bet = to_units(cfg.get("max_bet", 0.0001))
+        self.chance = float(cfg.get("chance", 49.5))
+        self.rule_mode = str(cfg.get("rule_mode", "auto")).lower()
+        self.take_profit = to_units(cfg.get("take_profit", 0.0005))
+        self.stop_loss = to_units(cfg.get("stop_loss", -0.0005))
+        self.cooldown = float(cfg.get("cooldown_sec", 1.0))
+        self.debug = bool(cfg.get("debug", True))
+        self.auto_start = bool(cfg.get("auto_start", False))
+        self.auto_start_delay = int(cfg.get("auto_start_delay", 5))
+        self.max_bets = int(cfg.get("max_bets", 0))   # had bet setiap sesi (0 = tiada had)
+        retry = self.retry
+        retry.base = max(0.0, float(cfg.get("retry_base_sec", 0.05)))
+        retry.cap = max(retry.base, float(cfg.get("retry_max_sec", 5.0)))
+        retry.limit = max(0, int(cfg.get("retry_limit", 0)))
+        self.retry_reconcile = bool(cfg.get("retry_reconcile", True))
+        self.status_format = str(cfg.get("status_format", "text")).lower()   # headless: text / json
+        # strategy: amount seterusnya ikut outcome (martingale, fibonacci, ...)
+        # setiap rung ladder x over/under dibina sekali jadi request siap (body JSON)
+        key = strategy_key(cfg)
+        strategies = self._strategies
+        strategy = strategies.get(key)
+        if strategy is None:
+            strategy = strategies[key] = strategy_from_config(cfg, build=partial(prepare_bet, self.currency))
+        # cache hanya untuk profile yang dikonfigurasi + config semasa; kunci dari edit lama dibuang
+        keep = {key}
+        scheduler = self.scheduler
+        if scheduler is not None:
+            base = scheduler.base
+            keep.update(strategy_key(dict(base, **overlay)) for _, overlay in scheduler.profiles)
+        for stale in [k for k in strategies if k not in keep]:
+            del strategies[stale]
+        if strategy is not self.strategy:
+            # strategy lain: mula dari base_bet; strategy sama (cth. hanya cooldown_sec
+            # berubah) kekalkan langkah ladder supaya bet recovery tidak hilang
+            strategy.reset()
+            self.strategy = strategy
+
+    def apply_config(self, cfg):
+        # dipanggil dari thread bot antara dua bet: tukar tetapan tanpa restart
+        ignored = [k for k in RESTART_KEYS if cfg.get(k) != self.cfg.get(k)]
+        if ignored:
+            if ignored != self._restart_keys:
+                self._log_error(f"Perlu restart untuk tukar: {', '.join(ignored)}")
+            cfg = dict(cfg)
+            for k in ignored:
+                if k in self.cfg:
+                    cfg[k] = self.cfg[k]
+                else:
+                    cfg.pop(k, None)
+        self._restart_keys = ignored
+        self.cfg = cfg
+        old = self.strategy
+        self._apply_settings()
+        self.pacer.min_interval = max(0.0, self.cooldown)
+        self.stats.set_chance(self.chance)
+        changed = self.strategy is not old
+        if changed:
+            # strategy baru bermula dari base_bet; profit & statistik sesi kekal
+            self.next_bet = self.strategy.first()
+            self.current_bet = self.next_bet[0]
+            self.loss_streak_total = 0
+        profile = self.scheduler.profile if self.scheduler is not None else None
+        self._say(
+            f"[cyan]🔁 Config dikemas kini{f' (profile {profile})' if profile else ''}:[/cyan] {self.strategy.name}, "
+            + (f"base {fmt(self.base_bet)}" if changed else f"bet kekal {fmt(self.current_bet)}")
+        )
+        return changed
+
+    def _strategy_label(self):
+        profile = self.scheduler.profile if self.scheduler is not None else None
+        return f"{self.strategy.name}, {profile}" if profile else self.strategy.name
+
+    # ---------------- REST calls ----------------
+    def _log_error(self, msg):
+        if self.debug:
+            self._say(f"[yellow]⚠️ {msg}[/yellow]")
+
+    def _say(self, markup):
+        self.frontend.say(markup)
+
+    def get_balances(self):
+        return self.backend.get_balances()
+
+    def get_balance_currency(self, currency):
+        # satu refresh (blocking), kemudian lookup O(1) dalam cache reconciler
+        if not self.reconciler.refresh():
+            return None
+        return self.reconciler.get(currency.lower())
+
+    def current_balance(self):
+        return self.start_balance + self.session_profit + self.drift.drift
+
+    def _on_balances(self, balances):
+        # dipanggil dari thread reconciler; tidak sentuh loop bet
+        server = balances.get(self.currency)
+        if server is None or self.start_time is None:
+            return
+        if self.drift.observe(server, self.start_balance + self.session_profit):
+            self._log_error(f"Baki server lari {fmt(self.drift.drift, sign=True)} {self.currency.upper()}, dibetulkan")
+
+    def place_dice_bet(self, amount, rule, bet_value, request=None):
+        t0 = perf_counter_ns()
+        if request is None:
+            # luar ladder (cth. bench): bina request sekali guna
+            request = prepare_bet(self.currency, amount, rule, bet_value)
+        data, meta = self.backend.place_bet(request)
+        if self.metrics is not None:
+            self.metrics.stages["place"].observe(perf_counter_ns() - t0)
+
+        # status: int HTTP, atau str (wolfdice.retry) kalau tiada response
+        status, rl_limit, rl_left, retry_after = meta
+        if status.__class__ is int:
+            self.pacer.observe(status, rl_limit, rl_left, retry_after)
+        return data, status
+
+    # -------------- Failure & reconciliation --------------
+    def _bet_failed(self, data, status):
+        # response tanpa bet: kira counter, jadualkan backoff; pulangkan kelas kegagalan
+        kind = classify(data, status)
+        retry = self.retry
+        delay = retry.failure(kind)
+        if kind == AUTH:
+            self.halt = f"[red]🔑 Token ditolak ({status}):[/red] semak access_token"
+        elif retry.exhausted():
+            self.halt = f"[red]❌ {retry.streak} bet gagal berturut-turut ({kind}):[/red] {fmt(self.session_profit)} {self.currency.upper()}"
+        if self.halt is not None:
+            self.stop_requested = True
+        if delay > 0:
+            self.pacer.hold(delay)
+        self._log_error(f"Bet gagal ({kind}){f', cuba semula dalam {delay:.2f}s' if delay else ''}")
+        return kind
+
+    def _reconcile(self, suspects):
+        # suspects: [(amount, rule, bet_value, request)] bet samar, tiada bet lain in-flight.
+        # Beza baki server - baki tempatan mesti sama dengan tepat satu gabungan
+        # (tidak masuk / lose / win) untuk setiap bet. Pulangkan [bet | None] ikut
+        # turutan suspects (bet = dict seperti response server), atau None kalau tak pasti.
+        retry = self.retry
+        server = None
+        attempt = 0
+        while len(suspects) <= RECONCILE_MAX:
+            try:
+                for b in self.backend.get_balances() or ():
+                    if str(b.get("currency", "")).lower() == self.currency:
+                        server = to_units(b.get("amount"))
+            except Exception as e:
+                self._log_error(f"Semak baki gagal: {e}")
+            if server is not None:
+                break
+            attempt += 1
+            if attempt == RECONCILE_TRIES:
+                # bet samar mungkin sudah masuk: hantar stake sama sekarang boleh jadi bet berganda,
+                # jadi tahan bet sehingga baki dapat dibaca (atau sesi dihentikan)
+                self._log_error("Baki tak dapat dibaca, bet ditahan sehingga semakan baki berjaya")
+            delay = retry.base * 2 ** attempt if attempt < RECONCILE_TRIES else max(1.0, retry.cap)
+            deadline = time.monotonic() + delay
+            while not self.stop_requested and time.monotonic() < deadline:
+                time.sleep(min(0.1, delay))
+            if self.stop_requested:
+                self._log_error(f"Dihentikan semasa menunggu baki: {len(suspects)} bet samar tidak di-settle")
+                break
+        if server is None:
+            retry.unknown += len(suspects)
+            return None
+
+        delta = server - self.current_balance()
+        options = []
+        for amount, rule, bet_value, request in suspects:
+            if request is None:
+                request = prepare_bet(self.currency, amount, rule, bet_value)
+            win = round(amount * request.multiplier) - amount
+            options.append(((None, 0), ("lose", -amount), ("win", win)))
+        tolerance = len(suspects)   # bundar 1 unit setiap bet
+        matches = [c for c in itertools.product(*options) if abs(sum(p for _, p in c) - delta) <= tolerance]
+        # dua bet samar dengan stake sama: tak tahu yang mana masuk, tetapi accounting tetap sama
+        if len({tuple(sorted(c, key=repr)) for c in matches}) != 1:
+            retry.unknown += len(suspects)
+            # tiada bet in-flight, jadi beza ini pasti: terus jadikan drift supaya semakan seterusnya tepat
+            self.drift.assume(server - self.start_balance - self.session_profit)
+            self._log_error(f"Baki server beza {fmt(delta, sign=True)}, tak padan dengan {len(suspects)} bet samar; dikira sebagai drift")
+            return None
+
+        bets = []
+        residual = delta - sum(p for _, p in matches[0])   # beza bundar profit win (unit)
+        for (state, pnl), (amount, _, _, _) in zip(matches[0], suspects):
+            if state == "win":
+                pnl, residual = pnl + residual, 0
+            if state is None:
+                retry.not_placed += 1
+                bets.append(None)
+                continue
+            retry.placed += 1
+            retry.streak = 0
+            self._log_error(f"Bet samar sudah masuk di server: {state.upper()} {fmt(amount)}, di-settle dari baki")
+            bets.append({"state": state, "profit": fmt(pnl), "amount": fmt(amount), "result_value": None})
+        return bets
+
+    # -------------- Dice helpers --------------
+    def chance_to_rule_and_threshold(self):
+        # target over/under dikira sekali dalam RulePicker
+        return self.strategy.picker.pick()
+
+    # -------------- Strategy loops --------------
+    def _stop_reason(self):
+        if self.stop_requested:
+            if self.halt is not None:
+                return self.halt
+            return f"[red]⏹️ Dihentikan:[/red] {fmt(self.session_profit)} {self.currency.upper()}"
+        if self.session_profit <= self.stop_loss:
+            return f"[yellow]🛑 Stop-loss triggered:[/yellow] {fmt(self.session_profit)} {self.currency.upper()}"
+        if self.session_profit >= self.take_profit:
+            return f"[green]✅ Take-profit triggered:[/green] {fmt(self.session_profit)} {self.currency.upper()}"
+        if self.max_bets and self.total_bets >= self.max_bets:
+            return f"[cyan]⏹️ max_bets {self.max_bets} reached:[/cyan] {fmt(self.session_profit)} {self.currency.upper()}"
+        return None
+
+    def _settle(self, bet, rule, bet_value, lane):
+        # lane = self (mode sync) atau wolfdice.aio.Lane (mode async); kedua-dua ada strategy sendiri
+        t0 = perf_counter_ns()
+        win, amount, pnl, result_value = self._account(bet, lane)
+        # strategy pilih bet seterusnya ikut outcome
+        lane.next_bet = lane.strategy.next(win)
+        lane.current_bet = lane.next_bet[0]
+        self._record(rule, bet_value, lane, win, amount, pnl, result_value)
+        if self.metrics is not None:
+            self.metrics.stages["settle"].observe(perf_counter_ns() - t0)
+
+    def _account(self, bet, lane):
+        # profit & counter sahaja: cukup untuk _stop_reason sebelum bet seterusnya dihantar
+        state = bet.get("state")
+        profit = to_units(bet.get("profit", 0) or 0)
+        self.total_bets += 1
+        amount = to_units(bet["amount"]) if "amount" in bet else lane.current_bet
+        try:
+            result_value = float(bet.get("result_value"))
+        except (TypeError, ValueError):
+            result_value = float("nan")
+
+        if state == "win":
+            self.session_profit += profit
+            self.win_count += 1
+            lane.loss_streak_total = 0
+            return True, amount, profit, result_value
+        self.session_profit -= amount
+        self.lose_count += 1
+        lane.loss_streak_total += amount
+        return False, amount, -amount, result_value
+
+    def _record(self, rule, bet_value, lane, win, amount, pnl, result_value):
+        # stats, journal & sejarah; lane.current_bet mesti sudah bet seterusnya
+        self.stats.add(win, amount, pnl)
+        if self.journal is not None:
+            self.journal.append(
+                time.time(), amount, pnl, result_value,
+                bet_value, lane.current_bet, win, rule == "over",
+            )
+
+        self.bet_history.append(
+            rule == "over", bet_value, result_value, lane.current_bet,
+            win, pnl if win else -lane.loss_streak_total,
+        )
+
+    def _run_sync(self):
+        metrics = self.metrics
+        scheduler = self.scheduler
+        while True:
+            if scheduler is not None:
+                cfg = scheduler.poll(self)
+                if cfg is not None:
+                    self.apply_config(cfg)
+            reason = self._stop_reason()
+            if reason:
+                return reason
+
+            t0 = perf_counter_ns()
+            amount, rule, bet_value, request = self.next_bet
+            self.pacer.acquire()
+            if metrics is not None:
+                metrics.stages["pace"].observe(perf_counter_ns() - t0)
+            data, status = self.place_dice_bet(amount, rule, bet_value, request)
+            bet = data.get("bet") if data else None
+            if bet is None:
+                # samar: semak baki dahulu; stake yang sama hanya dihantar semula kalau bet tidak masuk
+                if self._bet_failed(data, status) not in AMBIGUOUS or not self.retry_reconcile:
+                    continue
+                bet = (self._reconcile([(amount, rule, bet_value, request)]) or (None,))[0]
+                if bet is None:
+                    continue
+            elif self.retry.streak:
+                self.retry.streak = 0
+
+            self._settle(bet, rule, bet_value, self)
+            if metrics is not None:
+                metrics.stages["loop"].observe(perf_counter_ns() - t0)
+
+    def _run_pipeline(self):
+        # Seperti _run_sync, tetapi request dihantar oleh satu worker thread. Semasa
+        # bet in-flight, thread bot rekod bet sebelumnya (stats / journal / sejarah)
+        # dan sedia kedua-dua bet seterusnya (win & lose, request siap); bila
+        # response tiba, hanya profit + stop check dikira sebelum bet betul dihantar.
+        metrics = self.metrics
+        scheduler = self.scheduler
+        strategy = self.strategy
+        record = None   # bet yang sudah di-settle tetapi belum direkod
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="wolfdice-pipeline") as pool:
+            try:
+                while True:
+                    if scheduler is not None:
+                        cfg = scheduler.poll(self)
+                        if cfg is not None:
+                            if record is not None:
+                                self._record(*record)   # sebelum strategy / current_bet bertukar
+                                record = None
+                            self.apply_config(cfg)
+                            strategy = self.strategy
+                    reason = self._stop_reason()
+                    if reason:
+                        return reason
+
+                    t0 = perf_counter_ns()
+                    amount, rule, bet_value, request = self.next_bet
+                    self.pacer.acquire()
+                    if metrics is not None:
+                        metrics.stages["pace"].observe(perf_counter_ns() - t0)
+                    fut = pool.submit(self.place_dice_bet, amount, rule, bet_value, request)
+
+                    # ---- bet in-flight ----
+                    t1 = perf_counter_ns()
+                    if record is not None:
+                        self._record(*record)
+                        record = None
+                    if_win, if_lose = strategy.branches()
+                    if metrics is not None:
+                        metrics.stages["settle"].observe(perf_counter_ns() - t1)
+
+                    data, status = fut.result()
+                    bet = data.get("bet") if data else None
+                    if bet is None:
+                        if self._bet_failed(data, status) not in AMBIGUOUS or not self.retry_reconcile:
+                            continue
+                        bet = (self._reconcile([(amount, rule, bet_value, request)]) or (None,))[0]
+                        if bet is None:
+                            continue
+                    elif self.retry.streak:
+                        self.retry.streak = 0
+
+                    win, amount, pnl, result_value = self._account(bet, self)
+                    strategy.follow(win)
+                    self.next_bet = if_win if win else if_lose
+                    self.current_bet = self.next_bet[0]
+                    record = (rule, bet_value, self, win, amount, pnl, result_value)
+                    if metrics is not None:
+                        metrics.stages["loop"].observe(perf_counter_ns() - t0)
+            finally:
+                if record is not None:
+                    self._record(*record)
+
+    def _open_journal(self):
+        # sambung sesi dari journal yang belum tamat, atau mula journal baru
+        if not self.journal_path:
+            return None
+        state = load_journal(self.journal_path, self.stats.window) if self.resume else None
+        if state is not None and state.bets:
+            # baki server yang baru dibaca lawan baki ikut journal: bet yang belum di-flush
+            # masa crash (atau bet dari luar bot) jadi drift, supaya baki dipapar ikut server
+            fetched = self.start_balance
+            self.start_balance = state.start_balance
+            self.session_profit = state.profit
+            gap = fetched - (state.start_balance + state.profit)
+            if gap:
+                self.drift.assume(gap)
+                self._log_error(f"Baki server beza {fmt(gap, sign=True)} {self.currency.upper()} dari journal, dikira sebagai drift")
+            self.win_count, self.lose_count, self.total_bets = state.wins, state.losses, state.bets
+            self.loss_streak_total = state.loss_streak_total
+            self.start_time = state.start_time
+            self.strategy.restore(state.next_bet)
+            self.next_bet = self.strategy.first()
+            self.current_bet = self.next_bet[0]
+            self.journal = JournalWriter(self.journal_path, state.start_balance)
+            # win rate, drawdown & streak merangkumi bet sebelum resume
+            self.stats.restore(state)
+            return state
+        if not self.resume and os.path.exists(self.journal_path):
+            archive_journal(self.journal_path)
+        self.journal = JournalWriter(self.journal_path, self.start_balance, self.start_time, fresh=True)
+        return None
+
+    def _run_loop(self):
+        reason = None
+        dumper = None
+        if self.metrics is not None and self.metrics_dump:
+            dumper = MetricsDumper(
+                self.metrics, self.metrics_dump, self.metrics_format, self.metrics_interval,
+                extra=lambda: {"bets": self.total_bets, "profit": self.session_profit / SAT},
+            ).start()
+        try:
+            with profiled(self.profile, self.profile_out):
+                if self.engine == "async":
+                    reason = run_async(self)
+                elif self.engine == "pipeline":
+                    reason = self._run_pipeline()
+                else:
+                    reason = self._run_sync()
+            return reason
+        finally:
+            if dumper is not None:
+                dumper.stop()
+            if self.journal is not None:
+                # TP / SL / max_bets: arkib journal; crash / dihentikan: simpan untuk resume
+                if reason and not self.stop_requested:
+                    self.journal.finish()
+                else:
+                    self.journal.close()
+                self.journal = None
+
+    def martingale(self, dashboard=True):
+        # dashboard=False: tiada logo / Live screen (cth. bila dijalankan oleh multibot.py)
+        if self.halt is not None:
+            # sesi lepas dihentikan oleh ralat (auth / retry_limit): auto-restart cuba semula
+            self.stop_requested, self.halt = False, None
+            self.retry.streak = 0
+        if dashboard:
+            self.frontend.intro()
+        if self.start_time is not None and self.reconciler.updated is not None:
+            # sesi seterusnya: baki tempatan yang sudah dibetulkan reconciler, tanpa request blocking
+            start_balance = self.current_balance()
+        else:
+            start_balance = self.get_balance_currency(self.currency)
+        if start_balance is None:
+            self._say(f"[red]❌ Tak dapat baca balance. Semak token/endpoint atau headers.[/red]")
+            return None
+        if dashboard:
+            self._say(f"[green]💰 Baki awal:[/green] {fmt(start_balance)} {self.currency.upper()}")
+
+        self.start_balance = start_balance
+        self.session_profit = 0
+        self.drift.reset()
+        self.reconciler.start()
+        self.strategy.reset()
+        self.next_bet = self.strategy.first()
+        self.current_bet = self.next_bet[0]
+        self.win_count, self.lose_count, self.total_bets = 0, 0, 0
+        self.start_time = time.time()
+        self.loss_streak_total = 0
+        self.stats.reset()
+        resumed = self._open_journal()
+        if self.scheduler is not None:
+            self.scheduler.start()
+            self.scheduler.begin(self)
+        if resumed is not None and dashboard:
+            self._say(f"[cyan]♻️ Sambung sesi dari journal:[/cyan] {resumed.bets} bet, profit {fmt(resumed.profit)}")
+        if not dashboard:
+            return self._run_loop()
+        return self.frontend.run_session()
+
+    def run(self, dashboard=True):
+        self.session_count += 1
+        return self.martingale(dashboard)
+
+    def close(self):
+        # process keluar: hentikan thread watcher config dan reconciler baki
+        # (reconciler dikongsi akaun yang sama: berhenti bila bot terakhir keluar)
+        if self.scheduler is not None:
+            self.scheduler.stop()
+        reconciler = self.reconciler
+        if self._on_balances in reconciler.listeners:
+            reconciler.listeners.remove(self._on_balances)
+        if not reconciler.listeners:
+            reconciler.stop()
@@ -0,0 +1,23 @@
+import importlib
+
+# ---------------- Frontends ----------------
+# Frontend = cara satu bot dipaparkan; enjin (wolfdice.engine) sama untuk semua.
+#   "classic"  - dashboard Rich asal (bot.py)
+#   "v2"       - dashboard Rich dengan emoji, 32 bet & panel speed (V2bot.py)
+#   "headless" - satu baris status text / json (VPS, log, simulator)
+# Modul frontend diimport hanya bila dipilih, jadi headless tidak muat rich.
+
+FRONTENDS = {
+    "classic": ("wolfdice.frontends.classic", "ClassicFrontend"),
+    "v2": ("wolfdice.frontends.v2", "V2Frontend"),
+    "headless": ("wolfdice.frontends.headless", "HeadlessFrontend"),
+}
+
+
+def get_frontend(name="classic"):
+    # pulangkan class frontend; import modulnya di sini (lazy)
+    name = str(name or "classic").lower()
+    if name not in FRONTENDS:
+        raise ValueError(f"ui tidak dikenali: {name} (pilih: {', '.join(FRONTENDS)})")
+    module, cls = FRONTENDS[name]
+    return getattr(importlib.import_module(module), cls)
@@ -0,0 +1,36 @@
+from wolfdice.render import plain
+
+# ---------------- Frontend asas ----------------
+# Tiada rich di sini: teks biasa ke stdout. Frontend dashboard override say(),
+# intro() dan run_session(); enjin hanya panggil tiga kaedah ini.
+
+
+class Frontend:
+    name = ""
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    def say(self, markup):
+        print(plain(markup), flush=True)
+
+    def intro(self):
+        pass
+
+    def run_session(self):
+        # jalankan loop bet sesi semasa; pulangkan sebab berhenti
+        return self.bot._run_loop()
+
+    def stats_summary(self):
+        # ringkasan akhir sesi: drawdown & streak terpanjang, taburan panjang lose streak
+        stats = self.bot.stats
+        rate, drawdown, edge = stats.describe()
+        return (
+            f"[dim]📈 Lose streak (panjang x kali): {stats.histogram()} | win rate {rate} | "
+            f"drawdown {drawdown} | edge {edge}[/dim]"
+        )
+
+    def retry_summary(self):
+        # ralat /bet/place ikut kelas; None kalau tiada
+        retry = self.bot.retry
+        return f"[dim]🚧 Ralat bet: {retry.describe()}[/dim]" if retry.total else None
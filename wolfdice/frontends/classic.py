@@ -0,0 +1,132 @@
+import time
+
+from rich.console import Console
+from rich.layout import Layout
+from rich.live import Live
+from rich.panel import Panel
+from rich.table import Table
+
+from wolfdice.frontends.base import Frontend
+from wolfdice.money import fmt
+from wolfdice.render import Renderer
+
+# ---------------- ANSI colors ----------------
+RED     = "\033[91m"
+GREEN   = "\033[92m"
+YELLOW  = "\033[93m"
+BLUE    = "\033[94m"
+CYAN    = "\033[96m"
+MAGENTA = "\033[95m"
+WHITE   = "\033[97m"
+RESET   = "\033[0m"
+
+GRADIENT = [RED, YELLOW, GREEN, CYAN, BLUE, MAGENTA]
+
+console = Console()
+
+
+# ---------------- Dashboard Rich (bot.py) ----------------
+class ClassicFrontend(Frontend):
+    name = "classic"
+    logo_text = "W O L F   D I C E   B O T"
+
+    def say(self, markup):
+        console.print(markup)
+
+    # -------------- Logo --------------
+    def intro(self):
+        for i, c in enumerate(self.logo_text):
+            color = GRADIENT[i % len(GRADIENT)]
+            print(f"{color}{c}{RESET}", end="")
+        print("\n")
+        emoji_line = "🎲🐺  🎲🐺  🎲🐺  🎲🐺  🎲🐺"
+        print(emoji_line, "\n")
+
+    # -------------- UI Rich Version --------------
+    def summary_panel(self, start_balance, current_balance, total_bets, win, lose, runtime):
+        bot = self.bot
+        rate, drawdown, edge = bot.stats.describe()
+        txt = f"""
+[bold yellow]Baki Awal :[/bold yellow] {fmt(start_balance)} {bot.currency.upper()}
+[bold cyan]Baki Sekarang:[/bold cyan] {fmt(current_balance)} {bot.currency.upper()}
+[bold green]Profit/Rugi:[/bold green] {fmt(bot.session_profit)} {bot.currency.upper()}
+[bold magenta]Jumlah BET :[/bold magenta] {total_bets} (WIN {win} / LOSE {lose})
+[bold white]Runtime :[/bold white] {runtime}
+[bold blue]Session :[/bold blue] #{bot.session_count} ({bot._strategy_label()})
+[bold red]Rate :[/bold red] {bot.pacer.describe()}
+[bold white]UI :[/bold white] {bot.renderer.describe() if bot.renderer else "-"}
+[bold yellow]Sync baki :[/bold yellow] {bot.reconciler.describe()}, drift {fmt(bot.drift.drift, sign=True)}
+[bold cyan]Stage p50/p99 :[/bold cyan] {bot.metrics.describe() if bot.metrics else "-"}
+[bold red]Ralat :[/bold red] {bot.retry.describe()}
+[bold green]Win rate :[/bold green] {rate}
+[bold red]Drawdown :[/bold red] {drawdown}
+[bold magenta]Edge :[/bold magenta] {edge}
+"""
+        return Panel(txt, title="📊 Ringkasan Sesi", border_style="bold blue")
+
+    def bet_table(self):
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column("Target")
+        table.add_column("Result")
+        table.add_column("Bet")
+        table.add_column("W/L")
+        table.add_column("Profit")
+
+        # markup hanya dibina untuk row yang dipaparkan
+        for over, bet_value, result_value, next_bet, win, profit in self.bot.bet_history.last(10):
+            arrow = "⬆" if over else "⬇"
+            color = "green" if win else "red"
+            table.add_row(
+                f"{arrow} {bet_value:.2f}",
+                "-" if result_value != result_value else f"{result_value:.2f}",
+                fmt(int(next_bet)),
+                "[green]WIN[/green]" if win else "[red]LOSE[/red]",
+                f"[{color}]{fmt(int(profit))}[/{color}]"
+            )
+        return table
+
+    def snapshot(self):
+        # dipanggil oleh render thread: snapshot counter dahulu, baru bina layout
+        bot = self.bot
+        start_balance, total_bets = bot.start_balance, bot.total_bets
+        win, lose = bot.win_count, bot.lose_count
+        current_balance = start_balance + bot.session_profit + bot.drift.drift
+        elapsed = int(time.time() - bot.start_time)
+        runtime_str = time.strftime("%H:%M:%S", time.gmtime(elapsed))
+        return start_balance, current_balance, total_bets, win, lose, runtime_str
+
+    def build_ui(self):
+        layout = Layout()
+        layout.split(
+            Layout(name="summary", size=17),
+            Layout(name="bets")
+        )
+        layout["summary"].update(self.summary_panel(*self.snapshot()))
+        layout["bets"].update(self.bet_table())
+        return layout
+
+    # -------------- Sesi --------------
+    def run_session(self):
+        bot = self.bot
+        # Live tidak auto-refresh: render thread yang bina & lukis dashboard
+        with Live(screen=True, auto_refresh=False) as live:
+            hist = bot.metrics.stages["render"] if bot.metrics is not None else None
+            bot.renderer = Renderer(self.build_ui, live, fps=bot.ui_fps, hist=hist).start()
+            try:
+                reason = bot._run_loop()
+            finally:
+                bot.renderer.stop()
+            if reason:
+                console.print(f"\n{reason}")
+
+        final_runtime = time.strftime("%H:%M:%S", time.gmtime(int(time.time() - bot.start_time)))
+        final_panel = self.summary_panel(bot.start_balance, bot.current_balance(), bot.total_bets, bot.win_count, bot.lose_count, final_runtime)
+        console.print(final_panel)
+        self.final_summary()
+        return reason
+
+    def final_summary(self):
+        console.print(self.stats_summary())
+        retry = self.retry_summary()
+        if retry:
+            console.print(retry)
@@ -0,0 +1,57 @@
+import json
+import time
+
+from wolfdice.frontends.base import Frontend
+from wolfdice.money import SAT, fmt
+from wolfdice.render import LineOutput, Renderer
+
+# ---------------- Headless ----------------
+# Tiada logo / Rich Live: satu baris status (text / json) setiap
+# status_interval saat, sesuai untuk VPS, systemd / docker log dan simulator.
+
+
+class HeadlessFrontend(Frontend):
+    name = "headless"
+
+    def status_line(self):
+        # dipanggil oleh Renderer + LineOutput
+        bot = self.bot
+        elapsed = max(1e-9, time.time() - bot.start_time)
+        speed = bot.total_bets / elapsed
+        if bot.status_format == "json":
+            record = {
+                "ts": round(time.time(), 3), "bot": bot.name, "session": bot.session_count,
+                "bets": bot.total_bets, "win": bot.win_count, "lose": bot.lose_count,
+                "profit": bot.session_profit / SAT, "balance": bot.current_balance() / SAT,
+                "bets_per_sec": round(speed, 1), "rate": bot.pacer.describe(),
+                "strategy": bot._strategy_label(),
+                "stats": bot.stats.snapshot(),
+                "errors": bot.retry.snapshot(),
+            }
+            if bot.metrics is not None:
+                record["stages"] = bot.metrics.snapshot()
+            return json.dumps(record, separators=(",", ":"))
+        return (
+            f"{time.strftime('%H:%M:%S')} {bot.name} #{bot.session_count} "
+            f"bet {bot.total_bets} W/L {bot.win_count}/{bot.lose_count} "
+            f"profit {fmt(bot.session_profit, sign=True)} baki {fmt(bot.current_balance())} {bot.currency.upper()} "
+            f"{speed:.1f} bet/s | {bot.metrics.describe() if bot.metrics else '-'}"
+            f"{f' | ralat {bot.retry.describe()}' if bot.retry.total else ''}"
+        )
+
+    def run_session(self):
+        # Renderer yang sama seperti dashboard, tetapi output = satu baris status;
+        # baris pertama & terakhir sentiasa ditulis
+        bot = self.bot
+        status = Renderer(self.status_line, LineOutput(), fps=1.0 / max(0.1, bot.status_interval)).start()
+        try:
+            reason = bot._run_loop()
+        finally:
+            status.stop()
+        if reason:
+            self.say(reason)
+        self.say(self.stats_summary())
+        retry = self.retry_summary()
+        if retry:
+            self.say(retry)
+        return reason
@@ -0,0 +1,90 @@
+import time
+
+from rich.layout import Layout
+from rich.panel import Panel
+from rich.table import Table
+
+from wolfdice.frontends.classic import ClassicFrontend, console
+from wolfdice.money import fmt
+
+
+# ---------------- Dashboard Rich V2 (V2bot.py) ----------------
+# Sama seperti classic, tetapi label emoji, 32 bet terakhir dan panel speed.
+class V2Frontend(ClassicFrontend):
+    name = "v2"
+    logo_text = "W O L F 🍀 D I C E 🍀 B O T"
+
+    # -------------- UI helpers --------------
+    def summary_panel(self, start_balance, current_balance, total_bets, win, lose, runtime):
+        bot = self.bot
+        rate, drawdown, edge = bot.stats.describe()
+        txt = f"""
+[bold yellow]🏦Baki Awal :[/bold yellow] {fmt(start_balance)} {bot.currency.upper()}
+[bold cyan]💱Baki Sekarang:[/bold cyan] {fmt(current_balance)} {bot.currency.upper()}
+[bold green]🏧Profit/Rugi:[/bold green] {fmt(bot.session_profit)} {bot.currency.upper()}
+[bold magenta]🔄Jumlah BET :[/bold magenta] {total_bets} (WIN {win} / LOSE {lose})
+[bold white]⏰Runtime :[/bold white] {runtime}
+[bold red]🚦Session :[/bold red] {bot.session_count} ({bot._strategy_label()})
+[bold green]🎯Win rate :[/bold green] {rate}
+[bold red]📉Drawdown :[/bold red] {drawdown}
+[bold magenta]⚖️Edge :[/bold magenta] {edge}
+"""
+        return Panel(txt, title="📊 Ringkasan Sesi", border_style="bold blue")
+
+    def bet_table(self):
+        table = Table(show_header=True, header_style="bold magenta")
+        table.add_column("Target")
+        table.add_column("Result")
+        table.add_column("Bet Session")
+        table.add_column("W/L")
+        table.add_column("Profit")
+
+        # markup hanya dibina untuk row yang dipaparkan
+        for over, bet_value, result_value, next_bet, win, profit in self.bot.bet_history.last(32):
+            arrow = "↑" if over else "↓"
+            table.add_row(
+                f"{bet_value:.2f}[cyan]{arrow}[/cyan]",       # Target e.g. "49.50↑" atau "49.50↓"
+                "-" if result_value != result_value else f"{result_value:.2f}",   # Result
+                fmt(int(next_bet)),               # Bet (next amount after update)
+                "[bold green]WIN[/bold green]" if win else "[red]LOSE[/red]",     # W/L
+                f"[bold green]{fmt(int(profit))}[/bold green]" if win else f"[red]{fmt(int(profit))}[/red]"   # Profit / Total Lose
+            )
+        return table
+
+    def speed_panel(self, total_bets):
+        # kira runtime & speed
+        bot = self.bot
+        elapsed = max(1, int(time.time() - bot.start_time))
+        speed = round(total_bets / elapsed, 2)
+        text = "[bold yellow][ GUNA VPS UNTUK + SPEED ][/bold yellow]\n" \
+               f"Speed :[bold magenta]{speed}[/bold magenta] Bets / Second\n" \
+               f"Limit :[bold cyan]{bot.pacer.describe()}[/bold cyan]\n" \
+               f"Render:[bold white]{bot.renderer.describe() if bot.renderer else '-'}[/bold white]\n" \
+               f"Sync  :[bold yellow]{bot.reconciler.describe()}, drift {fmt(bot.drift.drift, sign=True)}[/bold yellow]\n" \
+               f"Stage :[bold white]{bot.metrics.describe() if bot.metrics else '-'}[/bold white]\n" \
+               f"Ralat :[bold red]{bot.retry.describe()}[/bold red]"
+        return Panel(text, border_style="green")
+
+    def build_ui(self):
+        snap = self.snapshot()
+        layout = Layout()
+        layout.split(
+            Layout(name="summary", size=12),
+            Layout(name="bets", ratio=3),
+            Layout(name="speed", size=9)
+        )
+        layout["summary"].update(self.summary_panel(*snap))
+        layout["bets"].update(self.bet_table())
+        layout["speed"].update(self.speed_panel(snap[2]))
+        return layout
+
+    def final_summary(self):
+        bot = self.bot
+        console.print(self.stats_summary())
+        retry = self.retry_summary()
+        if retry:
+            console.print(retry)
+        if bot.renderer:
+            console.print(f"[dim]🖥️ Render UI: {bot.renderer.describe()}[/dim]")
+        if bot.metrics is not None:
+            console.print(f"[dim]⏱️ Stage p50/p99: {bot.metrics.describe(('loop', 'place', 'network', 'decode', 'settle', 'pace'))}[/dim]")
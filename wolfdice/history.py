@@ -0,0 +1,53 @@
+from array import array
+
+# ---------------- Bet history ring buffer ----------------
+# Saiz tetap, simpan medan mentah (nombor) sahaja. String markup Rich hanya
+# dibina untuk row yang dipaparkan. Memori tetap sama walau bot jalan berhari.
+#
+# Loop bet tulis slot dahulu, baru naikkan `count`; render thread baca paling
+# banyak capacity-1 row terakhir, jadi slot yang sedang ditulis tak dibaca.
+
+FLAG_WIN = 1
+FLAG_OVER = 2
+
+
+class BetHistory:
+    def __init__(self, capacity=64):
+        self.capacity = max(2, int(capacity))
+        self.count = 0   # jumlah bet yang pernah direkod
+        zeros = bytes(8 * self.capacity)
+        self._bet_value = array("d", zeros)
+        self._result = array("d", zeros)
+        self._next_bet = array("d", zeros)
+        self._profit = array("d", zeros)
+        self._flags = bytearray(self.capacity)
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def append(self, over, bet_value, result_value, next_bet, win, profit):
+        i = self.count % self.capacity
+        self._bet_value[i] = bet_value
+        self._result[i] = result_value
+        self._next_bet[i] = next_bet
+        self._profit[i] = profit
+        self._flags[i] = (FLAG_WIN if win else 0) | (FLAG_OVER if over else 0)
+        self.count += 1
+
+    def last(self, n):
+        # pulangkan (over, bet_value, result_value, next_bet, win, profit), lama -> baru
+        count = self.count
+        n = min(n, count, self.capacity - 1)
+        rows = []
+        for k in range(count - n, count):
+            i = k % self.capacity
+            flags = self._flags[i]
+            rows.append((
+                bool(flags & FLAG_OVER),
+                self._bet_value[i],
+                self._result[i],
+                self._next_bet[i],
+                bool(flags & FLAG_WIN),
+                self._profit[i],
+            ))
+        return rows
@@ -0,0 +1,223 @@
+import mmap
+import os
+import struct
+import time
+from array import array
+from collections import Counter
+from itertools import accumulate, compress
+from operator import sub
+
+from wolfdice.money import SAT
+
+# ---------------- Bet journal ----------------
+# Fail binari append-only, satu record saiz tetap untuk setiap bet:
+#   8 x float64 = ts, amount, profit (+win / -lose), result_value,
+#                 bet_value, next_bet, win (1/0), over (1/0)
+# Header: magic, versi, bilangan medan, start_balance, start_time.
+# Versi 2: amount / profit / next_bet / start_balance dalam unit 1e-8
+# (int disimpan sebagai float64, tepat sehingga 2**53). Versi 1 (coin) masih
+# boleh dibaca; nilainya ditukar ke unit semasa load, dan fail ditulis semula
+# sebagai versi 2 (upgrade) sebelum writer sambung menulis.
+#
+# Writer kumpul record dalam array('d') dan tulis setiap `batch` bet, jadi
+# kos setiap bet cuma beberapa mikrosaat. Reader guna mmap + memoryview
+# (tanpa parse satu-satu) untuk bina semula statistik sesi dengan cepat,
+# termasuk drawdown / streak untuk StreamStats.
+# Record separuh di hujung fail (crash masa menulis) diabaikan.
+
+MAGIC = b"WBJ1"
+VERSION = 2
+HEADER = struct.Struct("<4sHHdd8x")   # 32 bait, record bermula pada offset 8-aligned
+FIELDS = 8
+RECORD_SIZE = FIELDS * 8
+TS, AMOUNT, PROFIT, RESULT, BET_VALUE, NEXT_BET, WIN, OVER = range(FIELDS)
+# bait tertinggi float64 little-endian medan WIN: 1.0 -> 0x3F, 0.0 -> 0x00
+WIN_BYTE = WIN * 8 + 7
+_FLAG = bytes.maketrans(b"\x3f", b"\x01")
+
+
+class JournalWriter:
+    def __init__(self, path, start_balance, start_time=None, batch=64, fresh=False):
+        self.path = path
+        self.batch = max(1, int(batch)) * FIELDS
+        self._buf = array("d")
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        # fresh=False: sambung fail sedia ada (resume)
+        fresh = fresh or not os.path.exists(path) or os.path.getsize(path) < HEADER.size
+        if not fresh:
+            # fail versi lama (coin): tukar ke versi semasa dahulu, supaya record baru
+            # (unit) tidak bercampur di bawah header lama
+            upgrade(path)
+        self._f = open(path, "wb" if fresh else "r+b")
+        if fresh:
+            self._f.write(HEADER.pack(MAGIC, VERSION, FIELDS, start_balance, start_time or time.time()))
+        else:
+            # buang record separuh (kalau ada) sebelum sambung menulis
+            size = os.path.getsize(path)
+            end = HEADER.size + (size - HEADER.size) // RECORD_SIZE * RECORD_SIZE
+            self._f.truncate(end)
+            self._f.seek(end)
+
+    def append(self, ts, amount, profit, result_value, bet_value, next_bet, win, over):
+        buf = self._buf
+        buf.extend((ts, amount, profit, result_value, bet_value, next_bet, win, over))
+        if len(buf) >= self.batch:
+            self.flush()
+
+    def flush(self):
+        if self._buf:
+            self._f.write(self._buf.tobytes())
+            del self._buf[:]
+        self._f.flush()
+
+    def close(self):
+        if not self._f.closed:
+            self.flush()
+            self._f.close()
+
+    def finish(self):
+        # sesi tamat dengan betul: simpan sebagai .done supaya sesi baru tak sambung
+        self.close()
+        return archive(self.path)
+
+
+def archive(path):
+    done = f"{path}.{time.strftime('%Y%m%d-%H%M%S')}.done"
+    os.replace(path, done)
+    return done
+
+
+def upgrade(path):
+    # tulis semula journal versi 1 (coin) sebagai versi semasa (unit 1e-8), secara atomik;
+    # pulangkan True kalau fail ditukar
+    version, start_balance, start_time = read_header(path)
+    if version >= VERSION:
+        return False
+    tmp = path + ".tmp"
+    buf = array("d")
+    with open(tmp, "wb") as out:
+        out.write(HEADER.pack(MAGIC, VERSION, FIELDS, round(start_balance * SAT), start_time))
+        for record in iter_records(path):
+            record = list(record)
+            for i in (AMOUNT, PROFIT, NEXT_BET):
+                record[i] = round(record[i] * SAT)
+            buf.extend(record)
+            if len(buf) >= 4096 * FIELDS:
+                out.write(buf.tobytes())
+                del buf[:]
+        out.write(buf.tobytes())
+    os.replace(tmp, path)
+    return True
+
+
+class SessionState:
+    def __init__(self, start_balance, start_time, bets, wins, losses, profit,
+                 loss_streak, loss_streak_total, next_bet, last_ts,
+                 wagered=0, peak=0, max_drawdown=0, win_streak=0, max_loss_streak=0,
+                 max_win_streak=0, streaks=None, recent=b""):
+        self.start_balance = start_balance
+        self.start_time = start_time
+        self.bets = bets
+        self.wins = wins
+        self.losses = losses
+        self.profit = profit
+        self.loss_streak = loss_streak
+        self.loss_streak_total = loss_streak_total
+        self.next_bet = next_bet
+        self.last_ts = last_ts
+        # untuk StreamStats.restore
+        self.wagered = wagered
+        self.peak = peak
+        self.max_drawdown = max_drawdown
+        self.win_streak = win_streak
+        self.max_loss_streak = max_loss_streak
+        self.max_win_streak = max_win_streak
+        self.streaks = streaks or {}     # {panjang lose streak yang tamat: bilangan}
+        self.recent = recent             # win (1/0) bagi `window` bet terakhir
+
+
+def read_header(path):
+    with open(path, "rb") as f:
+        magic, version, fields, start_balance, start_time = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC or fields != FIELDS:
+        raise ValueError(f"bukan fail journal WolfDice: {path}")
+    return version, start_balance, start_time
+
+
+def _scan(mm, n, window):
+    # semua view memoryview hidup dalam fungsi ini sahaja, supaya mmap boleh ditutup selepasnya
+    raw = memoryview(mm)[HEADER.size:HEADER.size + n * RECORD_SIZE]
+    mv = raw.cast("d")
+
+    # v2: semua nilai int, jadi sum() float64 tepat (< 2**53)
+    profit = sum(mv[PROFIT::FIELDS])
+    wagered = sum(mv[AMOUNT::FIELDS])
+    flags = raw[WIN_BYTE::RECORD_SIZE].tobytes().translate(_FLAG)
+    wins = flags.count(1)
+
+    # Win naikkan profit dan lose turunkannya, jadi puncak hanya di hujung run win dan
+    # lembah di hujung run lose: drawdown & streak dikira ikut run, tanpa loop Python
+    # setiap bet. Win maya di kedua hujung (profit 0 sebelum bet pertama) supaya run
+    # berselang-seli win, lose, ..., win. ends[i] = 1 bila run berakhir pada s[i].
+    s = b"\x01" + flags + b"\x01"
+    ends = (int.from_bytes(s[:-1], "big") ^ int.from_bytes(s[1:], "big")).to_bytes(n + 1, "big")
+    at_ends = list(compress(accumulate(mv[PROFIT::FIELDS], initial=0.0), ends))
+    peaks, troughs = at_ends[0::2], at_ends[1::2]
+    max_drawdown = max(map(sub, accumulate(peaks, max), troughs), default=0.0)
+    # panjang run (tolak win maya di run pertama & terakhir)
+    runs = list(map((1).__add__, map(len, ends.split(b"\x01"))))
+    runs[0] -= 1
+    runs[-1] -= 1
+    win_runs, lose_runs = runs[0::2], runs[1::2]
+    loss_streak = lose_runs.pop() if flags[-1] == 0 else 0
+    loss_streak_total = sum(mv[AMOUNT::FIELDS][n - loss_streak:])
+
+    return dict(
+        profit=profit, wins=wins, loss_streak=loss_streak, loss_streak_total=loss_streak_total,
+        last=mv[(n - 1) * FIELDS:].tolist(), wagered=wagered, peak=max(peaks + [0.0, profit]),
+        max_drawdown=max_drawdown, win_streak=win_runs[-1], max_win_streak=max(win_runs),
+        max_loss_streak=max(lose_runs + [loss_streak]), streaks=dict(Counter(lose_runs)),
+        recent=flags[-window:],
+    )
+
+
+def load(path, window=1000):
+    # bina semula statistik sesi dari journal (None kalau fail tiada)
+    if not os.path.exists(path) or os.path.getsize(path) < HEADER.size:
+        return None
+    version, start_balance, start_time = read_header(path)
+    scale = 1 if version >= 2 else SAT
+    start_balance = round(start_balance * scale)
+    size = os.path.getsize(path)
+    n = (size - HEADER.size) // RECORD_SIZE
+    if n == 0:
+        return SessionState(start_balance, start_time, 0, 0, 0, 0, 0, 0, None, start_time)
+
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        scan = _scan(mm, n, max(1, int(window)))
+
+    wins, last = scan["wins"], scan["last"]
+    return SessionState(
+        start_balance, start_time, n, wins, n - wins, round(scan["profit"] * scale),
+        scan["loss_streak"], round(scan["loss_streak_total"] * scale), round(last[NEXT_BET] * scale), last[TS],
+        wagered=round(scan["wagered"] * scale), peak=round(scan["peak"] * scale),
+        max_drawdown=round(scan["max_drawdown"] * scale), win_streak=scan["win_streak"],
+        max_loss_streak=scan["max_loss_streak"], max_win_streak=scan["max_win_streak"],
+        streaks=scan["streaks"], recent=scan["recent"],
+    )
+
+
+def iter_records(path):
+    # untuk analisis: satu tuple setiap bet
+    if not os.path.exists(path):
+        return
+    with open(path, "rb") as f:
+        f.seek(HEADER.size)
+        while True:
+            chunk = f.read(RECORD_SIZE * 4096)
+            if len(chunk) < RECORD_SIZE:
+                return
+            chunk = chunk[:len(chunk) // RECORD_SIZE * RECORD_SIZE]
+            yield from struct.iter_unpack("<8d", chunk)
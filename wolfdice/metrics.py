@@ -0,0 +1,220 @@
+import cProfile
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+# ---------------- Stage timing ----------------
+# Histogram log2 (nanosaat) untuk setiap peringkat satu bet: pace (tunggu
+# rate limit), place (keseluruhan request), network, decode (JSON), settle
+# (parse + strategy + history + journal), loop (satu pusingan penuh), render.
+# observe() cuma bit_length + tambah counter, jadi kos setiap timer ~0.3us.
+# Dalam mode async, counter dikemas kini dari beberapa thread tanpa lock:
+# nilai mungkin kurang sedikit, cukup untuk melihat taburan latency.
+
+BUCKETS = 64   # bucket b = [2**(b-1), 2**b) ns; cukup untuk semua nilai int64
+
+
+class Histogram:
+    __slots__ = ("name", "counts", "total")
+
+    def __init__(self, name):
+        self.name = name
+        self.counts = [0] * BUCKETS
+        self.total = 0
+
+    def observe(self, ns):
+        self.counts[ns.bit_length()] += 1
+        self.total += ns
+
+    @property
+    def count(self):
+        return sum(self.counts)
+
+    def percentile(self, p):
+        # anggaran: had atas bucket yang mengandungi persentil p (ns)
+        count = self.count
+        rank = p / 100.0 * count
+        seen = 0
+        for b, n in enumerate(self.counts):
+            seen += n
+            if n and seen >= rank:
+                return 1 << b
+        return 0
+
+    def mean(self):
+        count = self.count
+        return self.total / count if count else 0.0
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "mean_us": round(self.mean() / 1000.0, 3),
+            "p50_us": round(self.percentile(50) / 1000.0, 3),
+            "p99_us": round(self.percentile(99) / 1000.0, 3),
+            "p999_us": round(self.percentile(99.9) / 1000.0, 3),
+        }
+
+
+class Metrics:
+    STAGES = ("loop", "pace", "place", "network", "decode", "settle", "render")
+
+    def __init__(self, name="bot"):
+        self.name = name
+        self.stages = {s: Histogram(s) for s in self.STAGES}
+        self.started = time.time()
+
+    def snapshot(self):
+        return {s: h.summary() for s, h in self.stages.items() if h.count}
+
+    def describe(self, stages=("place", "settle", "pace")):
+        # satu baris untuk dashboard: p50/p99 setiap stage
+        parts = []
+        for s in stages:
+            h = self.stages.get(s)
+            if h is not None and h.count:
+                parts.append(f"{s} {_fmt_ns(h.percentile(50))}/{_fmt_ns(h.percentile(99))}")
+        return "  ".join(parts) or "-"
+
+    def to_json(self, **extra):
+        record = {"ts": round(time.time(), 3), "bot": self.name}
+        record.update(extra)
+        record["stages"] = self.snapshot()
+        return json.dumps(record, separators=(",", ":"))
+
+    def to_prometheus(self):
+        # format textfile collector (node_exporter)
+        lines = [
+            "# HELP wolfdice_stage_seconds Masa setiap peringkat bet",
+            "# TYPE wolfdice_stage_seconds histogram",
+        ]
+        for s, h in self.stages.items():
+            if not h.count:
+                continue
+            labels = f'bot="{self.name}",stage="{s}"'
+            cumulative = 0
+            top = max(b for b, n in enumerate(h.counts) if n)
+            for b in range(top + 1):
+                cumulative += h.counts[b]
+                lines.append(f'wolfdice_stage_seconds_bucket{{{labels},le="{(1 << b) / 1e9:.9g}"}} {cumulative}')
+            lines.append(f'wolfdice_stage_seconds_bucket{{{labels},le="+Inf"}} {h.count}')
+            lines.append(f"wolfdice_stage_seconds_sum{{{labels}}} {h.total / 1e9:.9f}")
+            lines.append(f"wolfdice_stage_seconds_count{{{labels}}} {h.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _fmt_ns(ns):
+    if ns >= 1_000_000:
+        return f"{ns / 1e6:.1f}ms"
+    return f"{ns / 1e3:.0f}us"
+
+
+# ---------------- Periodic dump ----------------
+class MetricsDumper:
+    # tulis snapshot setiap `interval` saat: "jsonl" (append satu baris) atau
+    # "prom" (ganti fail secara atomik, untuk Prometheus textfile collector)
+    def __init__(self, metrics, path, fmt="jsonl", interval=10.0, extra=None):
+        self.metrics = metrics
+        self.path = path
+        self.fmt = str(fmt).lower()
+        self.interval = max(0.1, float(interval))
+        self.extra = extra   # callable -> dict (cth. jumlah bet & profit)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name="wolfdice-metrics", daemon=True)
+
+    def start(self):
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self.dump()
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            self.dump()
+
+    def dump(self):
+        if self.fmt == "prom":
+            tmp = self.path + ".tmp"
+            with open(tmp, "w") as f:
+                f.write(self.metrics.to_prometheus())
+            os.replace(tmp, self.path)
+        else:
+            extra = self.extra() if self.extra else {}
+            with open(self.path, "a") as f:
+                f.write(self.metrics.to_json(**extra) + "\n")
+
+
+# ---------------- Profiler hooks ----------------
+class SamplingProfiler:
+    # ambil stack thread sasaran setiap `interval` saat; output "folded stacks"
+    # (satu baris "a;b;c count") untuk flamegraph.pl / speedscope
+    def __init__(self, thread_id=None, interval=0.005):
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval = interval
+        self.samples = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name="wolfdice-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
+
+    def write(self, path):
+        with open(path, "w") as f:
+            for stack, n in self.samples.most_common():
+                f.write(f"{stack} {n}\n")
+
+
+@contextmanager
+def profiled(mode, path):
+    # mode: "" (tiada), "cprofile" (.prof untuk pstats/snakeviz), "sample" (folded stacks)
+    mode = str(mode or "").lower()
+    if not mode:
+        yield
+        return
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    if mode == "cprofile":
+        prof = cProfile.Profile()
+        prof.enable()
+        try:
+            yield
+        finally:
+            prof.disable()
+            prof.dump_stats(path)
+    elif mode == "sample":
+        sampler = SamplingProfiler().start()
+        try:
+            yield
+        finally:
+            sampler.stop()
+            sampler.write(path)
+    else:
+        raise ValueError(f"profile tidak dikenali: {mode} (pilih: cprofile, sample)")
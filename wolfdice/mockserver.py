@@ -0,0 +1,192 @@
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from wolfdice.simulator import DiceSimulator
+
+# ---------------- Mock WolfBet HTTP server ----------------
+# Pengganti tempatan untuk /user/balances dan /bet/place dengan bentuk JSON
+# yang sama (bet.state, bet.profit, bet.amount, bet.result_value) dan header
+# x-ratelimit-*. Keputusan dice datang dari DiceSimulator. Latency dan error
+# (500 / JSON rosak) boleh disuntik untuk uji bot dan benchmark. "lost" =
+# bet sudah dibuat tetapi response hilang (502), untuk uji semakan baki bot.
+#
+#   python -m wolfdice.mockserver --port 8099 --latency-ms 20 --error-rate 0.01
+#   config.json: "api_base": "http://127.0.0.1:8099/api/v1"
+
+
+class MockWolfBet(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, addr, sim, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0,
+                 malformed_rate=0.0, ratelimit=0, window=60.0, seed=None, lost_rate=0.0):
+        super().__init__(addr, Handler)
+        self.sim = sim
+        self.latency = latency_ms / 1000.0
+        self.jitter = jitter_ms / 1000.0
+        self.error_rate = error_rate
+        self.malformed_rate = malformed_rate
+        self.lost_rate = lost_rate      # bet dibuat, response diganti 502
+        self.ratelimit = ratelimit      # had request setiap window (0 = tiada had)
+        self.window = window
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.window_start = time.monotonic()
+        self.window_used = 0
+        self.requests = 0
+
+    def take_budget(self):
+        # pulangkan (dibenarkan, baki, retry_after)
+        with self.lock:
+            self.requests += 1
+            if not self.ratelimit:
+                return True, None, None
+            now = time.monotonic()
+            if now - self.window_start >= self.window:
+                self.window_start = now
+                self.window_used = 0
+            if self.window_used >= self.ratelimit:
+                return False, 0, self.window - (now - self.window_start)
+            self.window_used += 1
+            return True, self.ratelimit - self.window_used, None
+
+    def fault(self):
+        # pilih error yang disuntik untuk request ini (None = normal)
+        with self.lock:
+            x = self.rng.random()
+        if x < self.error_rate:
+            return "error"
+        if x < self.error_rate + self.malformed_rate:
+            return "malformed"
+        if x < self.error_rate + self.malformed_rate + self.lost_rate:
+            return "lost"
+        return None
+
+    def delay(self):
+        if self.latency or self.jitter:
+            with self.lock:
+                d = self.latency + self.rng.uniform(-self.jitter, self.jitter)
+            if d > 0:
+                time.sleep(d)
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive, sama seperti server sebenar
+    disable_nagle_algorithm = True  # header & body dihantar berasingan; elak delay 40ms
+
+    def log_message(self, fmt, *args):
+        pass
+
+    def _send(self, status, body, headers=None):
+        raw = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, str(v))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def _begin(self):
+        # auth, latency, rate limit dan error injection; pulangkan header atau None
+        if not self.headers.get("Authorization", "").startswith("Bearer "):
+            self._send(401, {"error": "Unauthenticated."})
+            return None
+        srv = self.server
+        srv.delay()
+        allowed, left, retry_after = srv.take_budget()
+        headers = {}
+        if srv.ratelimit:
+            headers["x-ratelimit-limit"] = srv.ratelimit
+            headers["x-ratelimit-remaining"] = left
+        if not allowed:
+            headers["retry-after"] = f"{retry_after:.0f}"
+            self._send(429, {"error": "Too Many Attempts."}, headers)
+            return None
+        fault = srv.fault()
+        self.lost = fault == "lost"   # /bet/place: bet tetap dibuat
+        if fault == "error":
+            self._send(500, {"error": "Server Error"}, headers)
+            return None
+        if fault == "malformed":
+            self._send(200, b'{"bet": {"state": "win", "prof', headers)
+            return None
+        return headers
+
+    def do_GET(self):
+        if self.path.rstrip("/").endswith("/user/balances"):
+            headers = self._begin()
+            if headers is None:
+                return
+            with self.server.lock:
+                balances = self.server.sim.get_balances()
+            self._send(200, {"balances": balances}, headers)
+        else:
+            self._send(404, {"error": "Not Found"})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0) or 0)
+        raw = self.rfile.read(length) if length else b""
+        if not self.path.rstrip("/").endswith("/bet/place"):
+            self._send(404, {"error": "Not Found"})
+            return
+        headers = self._begin()
+        if headers is None:
+            return
+        try:
+            payload = json.loads(raw or b"{}")
+        except ValueError:
+            self._send(400, {"error": "invalid json"}, headers)
+            return
+        with self.server.lock:
+            data, meta = self.server.sim.place_bet(payload)
+        if self.lost:
+            self._send(502, {"error": "Bad Gateway"}, headers)
+            return
+        self._send(meta[0], data, headers)
+
+
+def start_server(host="127.0.0.1", port=0, currency="doge", balance=1000.0, seed=None, **opts):
+    # jalankan server dalam thread; pulangkan (server, api_base)
+    sim = DiceSimulator({currency: balance}, seed=seed)
+    server = MockWolfBet((host, port), sim, seed=seed, **opts)
+    threading.Thread(target=server.serve_forever, name="wolfdice-mock", daemon=True).start()
+    api_base = f"http://{host}:{server.server_address[1]}/api/v1"
+    return server, api_base
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Mock WolfBet API server")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8099)
+    ap.add_argument("--currency", default="doge")
+    ap.add_argument("--balance", type=float, default=1000.0)
+    ap.add_argument("--seed", default=None)
+    ap.add_argument("--latency-ms", type=float, default=0.0)
+    ap.add_argument("--jitter-ms", type=float, default=0.0)
+    ap.add_argument("--error-rate", type=float, default=0.0, help="peratus request yang dapat 500 (0-1)")
+    ap.add_argument("--malformed-rate", type=float, default=0.0, help="peratus respons JSON rosak (0-1)")
+    ap.add_argument("--lost-rate", type=float, default=0.0, help="peratus bet yang dibuat tetapi response hilang (0-1)")
+    ap.add_argument("--ratelimit", type=int, default=0, help="had request setiap window (0 = tiada had)")
+    ap.add_argument("--window", type=float, default=60.0)
+    args = ap.parse_args(argv)
+
+    server, api_base = start_server(
+        args.host, args.port, args.currency, args.balance, args.seed,
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+        malformed_rate=args.malformed_rate, ratelimit=args.ratelimit, window=args.window,
+        lost_rate=args.lost_rate,
+    )
+    print(f"Mock WolfBet API: {api_base}", flush=True)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
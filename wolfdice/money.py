@@ -0,0 +1,69 @@
+from decimal import Decimal, ROUND_HALF_EVEN
+
+# ---------------- Fixed-point money ----------------
+# Semua amount dalam bot disimpan sebagai int unit 1e-8 (satoshi), sama
+# seperti 8 tempat perpuluhan yang server pulangkan. Tambah/tolak/banding
+# int adalah tepat, jadi session_profit tidak lari dari baki server walaupun
+# selepas berjuta bet.
+#
+# to_units("0.00000004") -> 4, fmt(4) -> "0.00000004"
+
+SAT = 10 ** 8
+_FAST_MAX = 1e7   # |nilai| < 1e7 dengan <= 8 d.p. -> unit < 2**53, float(s) * SAT dibundar tepat
+
+# amount dalam hot path datang dari ladder strategy, jadi string yang sama
+# berulang: cache parse/format jimat kos float() + round() setiap bet.
+_CACHE_MAX = 4096
+_units_cache = {}
+_str_cache = {}
+
+
+def to_units(value):
+    units = _units_cache.get(value)
+    if units is None:
+        units = _parse(value)
+        if len(_units_cache) >= _CACHE_MAX:
+            _units_cache.clear()
+        _units_cache[value] = units
+    return units
+
+
+def _parse(value):
+    # string server (<= 8 d.p.): laluan float; selebihnya tepat melalui Decimal
+    if value.__class__ is str and value and len(value) - value.find(".") <= 9:
+        f = float(value)
+        if -_FAST_MAX < f < _FAST_MAX:
+            return round(f * SAT)
+    return _to_units_exact(value)
+
+
+def _to_units_exact(value):
+    if value is None or value == "":
+        return 0
+    if isinstance(value, int):
+        return value * SAT
+    if isinstance(value, float):
+        # nilai config (cth. 0.00000004): ikut repr, bukan nilai binari penuh
+        value = repr(value)
+    units = Decimal(str(value).strip()) * SAT
+    return int(units.to_integral_value(rounding=ROUND_HALF_EVEN))
+
+
+def fmt(units, sign=False):
+    # int unit -> "0.00000004" (tepat, tanpa float)
+    if not sign:
+        text = _str_cache.get(units)
+        if text is None:
+            text = _format(units, False)
+            if len(_str_cache) >= _CACHE_MAX:
+                _str_cache.clear()
+            _str_cache[units] = text
+        return text
+    return _format(units, True)
+
+
+def _format(units, sign):
+    neg = units < 0
+    whole, frac = divmod(-units if neg else units, SAT)
+    prefix = "-" if neg else ("+" if sign else "")
+    return f"{prefix}{whole}.{frac:08d}"
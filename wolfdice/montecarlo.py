@@ -0,0 +1,194 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # numpy hanya perlu untuk analisis, bukan untuk bot
+    np = None
+
+# ---------------- Monte Carlo untuk config Martingale ----------------
+# Simulasi banyak sesi bebas serentak dengan NumPy, ikut logik martingale bot:
+#   - semak stop_loss, take_profit, reset current_bet > max_bet ke base_bet
+#   - amount dibundar 8 d.p., next bet = round(bet * multiplier, 12)
+#   - win: profit server = round(amount * payout - amount, 8); lose: -amount
+# Peluang menang ikut result 0.00 - 99.99 (10000 nilai): under menang jika
+# result < target, over menang jika result > target.
+#
+#   python -m wolfdice.montecarlo config.json --sessions 1000000 --max-bets 20000
+
+OUT_CAPPED = 0       # sesi sampai had max_bets
+OUT_TAKE_PROFIT = 1
+OUT_STOP_LOSS = 2    # ruin
+
+
+def _cap(val, lo, hi):
+    return max(lo, min(hi, val))
+
+
+def params_from_config(cfg):
+    chance = _cap(float(cfg.get("chance", 49.5)), 0.01, 99.99)
+    under_value = _cap(chance, 0.01, 99.99)
+    over_value = _cap(100.0 - chance, 0.01, 99.99)
+    # bilangan result (daripada 10000) yang menang
+    p_under = round(under_value * 100) / 10000.0
+    p_over = (9999 - round(over_value * 100)) / 10000.0
+    mode = str(cfg.get("rule_mode", "auto")).lower()
+    if mode == "under":
+        p_win = p_under
+    elif mode == "over":
+        p_win = p_over
+    else:
+        p_win = (p_under + p_over) / 2.0   # auto: 50/50 setiap bet
+
+    payout = float(f"{99.0 / under_value:.4f}")
+    return {
+        "base_bet": float(cfg.get("base_bet", 0.00000001)),
+        "multiplier": float(cfg.get("multiplier", 2.0)),
+        "max_bet": float(cfg.get("max_bet", 0.0001)),
+        "take_profit": float(cfg.get("take_profit", 0.0005)),
+        "stop_loss": float(cfg.get("stop_loss", -0.0005)),
+        "p_win": p_win,
+        "payout": payout,
+    }
+
+
+def simulate(params, sessions, max_bets, seed=None):
+    # pulangkan (outcome int8, bets int64, profit float64) untuk setiap sesi
+    rng = np.random.default_rng(seed)
+    base = params["base_bet"]
+    mult = params["multiplier"]
+    max_bet = params["max_bet"]
+    tp = params["take_profit"]
+    sl = params["stop_loss"]
+    p_win = params["p_win"]
+    payout = params["payout"]
+
+    outcome = np.full(sessions, OUT_CAPPED, dtype=np.int8)
+    bets = np.zeros(sessions, dtype=np.int64)
+    profit = np.zeros(sessions, dtype=np.float64)
+
+    # state sesi yang masih aktif sahaja (dipadatkan bila ramai sudah tamat)
+    idx = np.arange(sessions)
+    cur_profit = np.zeros(sessions, dtype=np.float64)
+    cur_bet = np.full(sessions, base, dtype=np.float64)
+
+    for step in range(max_bets):
+        hit_sl = cur_profit <= sl
+        hit_tp = ~hit_sl & (cur_profit >= tp)
+        done = hit_sl | hit_tp
+        if done.any():
+            outcome[idx[hit_sl]] = OUT_STOP_LOSS
+            outcome[idx[hit_tp]] = OUT_TAKE_PROFIT
+            bets[idx[done]] = step
+            profit[idx[done]] = cur_profit[done]
+            keep = ~done
+            idx = idx[keep]
+            cur_profit = cur_profit[keep]
+            cur_bet = cur_bet[keep]
+            if not idx.size:
+                return outcome, bets, profit
+
+        cur_bet[cur_bet > max_bet] = base
+        amount = np.round(cur_bet, 8)
+        win = rng.random(idx.size) < p_win
+
+        cur_profit += np.where(win, np.round(amount * payout - amount, 8), -amount)
+        cur_bet = np.where(win, base, np.round(cur_bet * mult, 12))
+
+    bets[idx] = max_bets
+    profit[idx] = cur_profit
+    return outcome, bets, profit
+
+
+def _chunk(args):
+    params, sessions, max_bets, seed = args
+    return simulate(params, sessions, max_bets, seed)
+
+
+def run(params, sessions, max_bets, workers=None, chunk=100000, seed=None):
+    # bahagi sesi kepada chunk dan jalankan dalam process pool
+    sizes = [chunk] * (sessions // chunk)
+    if sessions % chunk:
+        sizes.append(sessions % chunk)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = [(params, n, max_bets, s) for n, s in zip(sizes, seeds)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) == 1:
+        parts = [_chunk(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            parts = list(pool.map(_chunk, jobs))
+
+    outcome = np.concatenate([p[0] for p in parts])
+    bets = np.concatenate([p[1] for p in parts])
+    profit = np.concatenate([p[2] for p in parts])
+    return outcome, bets, profit
+
+
+def summarize(outcome, bets, profit):
+    n = outcome.size
+    pct = [1, 5, 25, 50, 75, 95, 99]
+    return {
+        "sessions": int(n),
+        "p_ruin": float(np.count_nonzero(outcome == OUT_STOP_LOSS) / n),
+        "p_take_profit": float(np.count_nonzero(outcome == OUT_TAKE_PROFIT) / n),
+        "p_capped": float(np.count_nonzero(outcome == OUT_CAPPED) / n),
+        "bets_mean": float(bets.mean()),
+        "bets_pct": dict(zip(pct, np.percentile(bets, pct).tolist())),
+        "profit_mean": float(profit.mean()),
+        "profit_std": float(profit.std()),
+        "profit_pct": dict(zip(pct, np.percentile(profit, pct).tolist())),
+    }
+
+
+def _print_summary(summary, params, elapsed):
+    print(f"Sesi          : {summary['sessions']}  ({elapsed:.2f}s, {summary['sessions'] / max(elapsed, 1e-9):,.0f} sesi/s)")
+    print(f"Peluang win   : {params['p_win'] * 100:.2f}%  payout x{params['payout']}")
+    print(f"Ruin (SL)     : {summary['p_ruin'] * 100:.3f}%")
+    print(f"Take-profit   : {summary['p_take_profit'] * 100:.3f}%")
+    print(f"Had max-bets  : {summary['p_capped'] * 100:.3f}%")
+    print(f"Panjang sesi  : purata {summary['bets_mean']:.1f} bet")
+    for p, v in summary["bets_pct"].items():
+        print(f"   p{p:<3}       : {v:.0f} bet")
+    print(f"Profit        : purata {summary['profit_mean']:.8f}  std {summary['profit_std']:.8f}")
+    for p, v in summary["profit_pct"].items():
+        print(f"   p{p:<3}       : {v:.8f}")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Monte Carlo untuk config Martingale WolfBetBot")
+    ap.add_argument("config", nargs="?", default="config.json")
+    ap.add_argument("--sessions", type=int, default=1000000)
+    ap.add_argument("--max-bets", type=int, default=10000, help="had bet setiap sesi")
+    ap.add_argument("--workers", type=int, default=None, help="bilangan process (default: semua core)")
+    ap.add_argument("--chunk", type=int, default=100000, help="sesi setiap job")
+    ap.add_argument("--seed", type=int, default=None)
+    ap.add_argument("--json", action="store_true", help="cetak ringkasan sebagai JSON")
+    args = ap.parse_args(argv)
+
+    if np is None:
+        print("numpy diperlukan: pip install numpy", file=sys.stderr)
+        return 1
+
+    with open(args.config, "r") as f:
+        params = params_from_config(json.load(f))
+
+    t0 = time.perf_counter()
+    outcome, bets, profit = run(params, args.sessions, args.max_bets, args.workers, args.chunk, args.seed)
+    elapsed = time.perf_counter() - t0
+    summary = summarize(outcome, bets, profit)
+
+    if args.json:
+        print(json.dumps({"params": params, "elapsed_sec": elapsed, **summary}, indent=2))
+    else:
+        _print_summary(summary, params, elapsed)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,287 @@
+import argparse
+import glob
+import hashlib
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from wolfdice.montecarlo import OUT_TAKE_PROFIT, np, params_from_config, simulate, summarize
+
+# ---------------- Parameter sweep (optimizer) ----------------
+# Cari base_bet / multiplier / chance / max_bet / take_profit / stop_loss yang
+# terbaik dengan simulasi Monte Carlo (logik martingale sama seperti
+# wolfdice.montecarlo). Setiap calon = satu job dalam process pool (semua core).
+#   --param chance=10,49.5,80         senarai nilai (grid: semua kombinasi)
+#   --param base_bet=1e-8:1e-6        julat, hanya dengan --samples N (sampel rawak;
+#                                     log-uniform kalau hi/lo >= 100)
+# Skor setiap calon: profit purata sesi, peluang ruin (stop-loss) dan bilangan
+# bet sampai take-profit. Calon dengan ruin > --max-ruin ditolak, selebihnya
+# disusun ikut --sort. Semua calon guna seed yang sama (common random numbers),
+# jadi beza antara calon bukan sekadar nasib.
+#
+# Hasil setiap calon disimpan dalam --cache (satu fail JSON per hash parameter +
+# sessions + max_bets + seed); sweep berulang hanya simulasi calon baru.
+# Calon terbaik ditulis sebagai profile (overlay config.json) dalam --out, terus
+# boleh dipakai dengan "profiles": "profiles/" (wolfdice.schedule). Setiap profile
+# ada "strategy": "martingale" kerana hanya martingale yang disimulasi.
+#
+#   python -m wolfdice.optimize config.json --param chance=10,25,49.5 --param multiplier=1.1,1.2,2 --top 3
+#   python -m wolfdice.optimize config.json --samples 500 --param base_bet=1e-8:1e-6 --param chance=5:80
+
+FIELDS = ("base_bet", "multiplier", "chance", "max_bet", "take_profit", "stop_loss", "rule_mode")
+SORT_BY = ("profit", "ruin", "speed")
+STRATEGY = "martingale"   # wolfdice.montecarlo hanya simulasi martingale; ditulis dalam setiap profile
+CACHE_VERSION = 1
+
+# d.p. nilai sampel rawak: amount ikut unit 1e-8, chance 2 d.p. (target bet_value)
+DECIMALS = {"base_bet": 8, "max_bet": 8, "take_profit": 8, "stop_loss": 8, "chance": 2, "multiplier": 4}
+
+# ruang carian default bila tiada --param: sekitar config semasa
+DEFAULT_SPACE = {
+    "chance": [10, 25, 49.5, 66, 80],
+    "multiplier": [1.05, 1.12, 1.5, 2.0],
+}
+
+
+# ---------------- ruang carian ----------------
+def _number(text):
+    value = float(text)
+    return int(value) if value.is_integer() and "e" not in text.lower() and "." not in text else value
+
+
+def parse_param(spec):
+    # "key=a,b,c" -> (key, [a, b, c]); "key=lo:hi" -> (key, (lo, hi))
+    key, sep, values = spec.partition("=")
+    key = key.strip()
+    if not sep or key not in FIELDS:
+        raise ValueError(f"--param tidak sah: {spec} (medan: {', '.join(FIELDS)})")
+    if key == "rule_mode":
+        return key, [v.strip().lower() for v in values.split(",") if v.strip()]
+    if ":" in values:
+        lo, hi = (float(v) for v in values.split(":", 1))
+        return key, (min(lo, hi), max(lo, hi))
+    return key, [_number(v.strip()) for v in values.split(",") if v.strip()]
+
+
+def _sample(key, bounds, rng):
+    if isinstance(bounds, list):
+        return rng.choice(bounds)
+    lo, hi = bounds
+    if lo > 0 and hi / lo >= 100:
+        value = lo * (hi / lo) ** rng.random()
+    else:
+        value = rng.uniform(lo, hi)
+    return round(value, DECIMALS[key])
+
+
+def candidates(base, space, samples=0, seed=None):
+    # senarai overlay {medan: nilai}; calon yang tidak masuk akal dibuang
+    if not samples and any(isinstance(v, tuple) for v in space.values()):
+        raise ValueError("julat lo:hi hanya boleh dengan --samples")
+    keys = list(space)
+    if samples:
+        rng = random.Random(seed)
+        combos = [tuple(_sample(k, space[k], rng) for k in keys) for _ in range(samples)]
+    else:
+        combos = itertools.product(*(space[k] for k in keys))
+    out, seen = [], set()
+    for combo in combos:
+        overlay = dict(zip(keys, combo))
+        cfg = dict(base, **overlay)
+        if not (float(cfg.get("stop_loss", -0.0005)) < 0 < float(cfg.get("take_profit", 0.0005))):
+            continue
+        if float(cfg.get("max_bet", 0.0001)) < float(cfg.get("base_bet", 0.00000001)):
+            continue
+        if not 0.01 <= float(cfg.get("chance", 49.5)) <= 99.99:
+            continue
+        key = json.dumps(overlay, sort_keys=True)
+        if key not in seen:
+            seen.add(key)
+            out.append(overlay)
+    return out
+
+
+# ---------------- simulasi + cache ----------------
+def cache_key(params, sessions, max_bets, seed):
+    raw = json.dumps({"v": CACHE_VERSION, "params": params, "sessions": sessions,
+                      "max_bets": max_bets, "seed": seed}, sort_keys=True)
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+def _cache_get(folder, key):
+    try:
+        with open(os.path.join(folder, key + ".json"), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _cache_put(folder, key, result):
+    # tulis atomik: sweep yang diganggu tidak tinggalkan fail separuh
+    path = os.path.join(folder, key + ".json")
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(result, f)
+    os.replace(tmp, path)
+
+
+def evaluate(job):
+    # satu calon dalam process pool -> ringkasan + bet sampai take-profit
+    params, sessions, max_bets, seed = job
+    outcome, bets, profit = simulate(params, sessions, max_bets, seed)
+    summary = summarize(outcome, bets, profit)
+    hit = bets[outcome == OUT_TAKE_PROFIT]
+    summary["bets_to_target"] = float(np.median(hit)) if hit.size else None
+    return summary
+
+
+def score(result, sort_by="profit"):
+    # kunci susunan (kecil = lebih baik)
+    to_target = result["bets_to_target"]
+    to_target = float("inf") if to_target is None else to_target
+    if sort_by == "ruin":
+        return (result["p_ruin"], -result["profit_mean"], to_target)
+    if sort_by == "speed":
+        return (to_target, result["p_ruin"], -result["profit_mean"])
+    return (-result["profit_mean"], result["p_ruin"], to_target)
+
+
+def sweep(base, overlays, sessions, max_bets, seed=0, workers=None, cache=None, log=None):
+    # pulangkan [(overlay, result)]; calon yang ada dalam cache tidak disimulasi semula
+    if cache:
+        os.makedirs(cache, exist_ok=True)
+    rows, todo = [], {}
+    for overlay in overlays:
+        params = params_from_config(dict(base, **overlay))
+        key = cache_key(params, sessions, max_bets, seed)
+        result = _cache_get(cache, key) if cache else None
+        if result is None:
+            todo.setdefault(key, (params, []))[1].append(overlay)
+        else:
+            rows.append((overlay, result))
+    if log:
+        log(f"{len(overlays)} calon, {len(overlays) - sum(len(v[1]) for v in todo.values())} dari cache, "
+            f"{len(todo)} perlu simulasi")
+
+    def done(key, result):
+        if cache:
+            _cache_put(cache, key, result)
+        rows.extend((overlay, result) for overlay in todo[key][1])
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(todo) <= 1:
+        for key, (params, _) in todo.items():
+            done(key, evaluate((params, sessions, max_bets, seed)))
+    elif todo:
+        with ProcessPoolExecutor(max_workers=min(workers, len(todo))) as pool:
+            futures = {pool.submit(evaluate, (params, sessions, max_bets, seed)): key
+                       for key, (params, _) in todo.items()}
+            for i, fut in enumerate(as_completed(futures), 1):
+                done(futures[fut], fut.result())
+                if log and (i % 50 == 0 or i == len(futures)):
+                    log(f"  {i}/{len(futures)} siap")
+    return rows
+
+
+# ---------------- output ----------------
+def write_profiles(folder, best, prefix="opt"):
+    # satu fail = satu profile; fail {prefix}-*.json lama dibuang supaya rotation tidak guna hasil lama
+    os.makedirs(folder, exist_ok=True)
+    for path in glob.glob(os.path.join(folder, f"{glob.escape(prefix)}-*.json")):
+        os.remove(path)
+    paths = []
+    for i, (overlay, _) in enumerate(best, 1):
+        path = os.path.join(folder, f"{prefix}-{i}.json")
+        with open(path, "w") as f:
+            # strategy yang disimulasi, supaya profile tidak warisi strategy lain dari config asas
+            json.dump(dict(overlay, strategy=STRATEGY), f, indent=2)
+            f.write("\n")
+        paths.append(path)
+    return paths
+
+
+def _print_table(rows):
+    print(f"{'#':>3} {'profit purata':>15} {'ruin':>8} {'TP':>8} {'bet->TP':>8}  parameter")
+    for i, (overlay, r) in enumerate(rows, 1):
+        to_target = "-" if r["bets_to_target"] is None else f"{r['bets_to_target']:.0f}"
+        params = " ".join(f"{k}={v}" for k, v in overlay.items())
+        print(f"{i:>3} {r['profit_mean']:>15.8f} {r['p_ruin'] * 100:>7.3f}% {r['p_take_profit'] * 100:>7.2f}% "
+              f"{to_target:>8}  {params}")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Cari parameter config.json terbaik dengan simulasi Monte Carlo")
+    ap.add_argument("config", nargs="?", default="config.json")
+    ap.add_argument("--param", action="append", default=[], metavar="KEY=V1,V2|LO:HI",
+                    help=f"ruang carian ({', '.join(FIELDS)}); boleh diulang")
+    ap.add_argument("--samples", type=int, default=0, help="sampel rawak N calon (default: grid penuh)")
+    ap.add_argument("--sessions", type=int, default=20000, help="sesi setiap calon")
+    ap.add_argument("--max-bets", type=int, default=10000, help="had bet setiap sesi")
+    ap.add_argument("--max-ruin", type=float, default=0.05, help="tolak calon dengan peluang ruin lebih tinggi")
+    ap.add_argument("--sort", choices=SORT_BY, default="profit",
+                    help="profit: profit purata, ruin: ruin terendah, speed: bet sampai take-profit")
+    ap.add_argument("--top", type=int, default=5, help="bilangan profile ditulis")
+    ap.add_argument("--out", default="profiles", help="folder profile (kosong = tidak tulis)")
+    ap.add_argument("--prefix", default="opt", help="nama fail profile: {prefix}-1.json ...")
+    ap.add_argument("--cache", default=os.path.join(".cache", "optimize"), help="folder cache (kosong = tiada)")
+    ap.add_argument("--workers", type=int, default=None, help="bilangan process (default: semua core)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--json", action="store_true", help="cetak hasil sebagai JSON")
+    args = ap.parse_args(argv)
+
+    if np is None:
+        print("numpy diperlukan: pip install numpy", file=sys.stderr)
+        return 1
+
+    with open(args.config, "r") as f:
+        base = json.load(f)
+    try:
+        space = dict(parse_param(p) for p in args.param) or dict(DEFAULT_SPACE)
+        overlays = candidates(base, space, args.samples, args.seed)
+    except ValueError as e:
+        ap.error(str(e))
+    if not overlays:
+        ap.error("tiada calon yang sah (semak stop_loss < 0 < take_profit dan max_bet >= base_bet)")
+
+    def log(msg):
+        print(msg, file=sys.stderr, flush=True)
+
+    strategy = str(base.get("strategy", STRATEGY)).lower()
+    if strategy != STRATEGY:
+        log(f"nota: config guna strategy {strategy}, tetapi simulasi hanya {STRATEGY}; profile ditulis dengan \"strategy\": \"{STRATEGY}\"")
+
+    t0 = time.perf_counter()
+    rows = sweep(base, overlays, args.sessions, args.max_bets, args.seed, args.workers, args.cache or None, log)
+    elapsed = time.perf_counter() - t0
+    ranked = sorted((row for row in rows if row[1]["p_ruin"] <= args.max_ruin), key=lambda row: score(row[1], args.sort))
+    best = ranked[:max(0, args.top)]
+    # folder profile relatif kepada config.json, sama seperti wolfdice.schedule
+    out = args.out
+    if out and not os.path.isabs(out):
+        out = os.path.join(os.path.dirname(os.path.abspath(args.config)), out)
+    paths = write_profiles(out, best, args.prefix) if out and best else []
+
+    if args.json:
+        print(json.dumps({
+            "elapsed_sec": elapsed, "candidates": len(rows), "accepted": len(ranked),
+            "best": [dict(r, params=overlay) for overlay, r in best], "profiles": paths,
+        }, indent=2))
+        return 0
+    log(f"{len(rows)} calon dalam {elapsed:.2f}s, {len(ranked)} lulus ruin <= {args.max_ruin * 100:g}%")
+    if not best:
+        print("Tiada calon lulus --max-ruin; cuba naikkan stop_loss atau --max-ruin.")
+        return 0
+    _print_table(best)
+    for path in paths:
+        print(f"profile -> {path}")
+    if paths:
+        print(f'Guna: "profiles": "{args.out}" dalam config.json (rotate_by untuk tukar antara profile)')
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
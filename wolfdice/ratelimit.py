@@ -0,0 +1,132 @@
+import threading
+import time
+
+# ---------------- Adaptive rate pacer ----------------
+# Token bucket yang belajar budget server dari header x-ratelimit-limit /
+# x-ratelimit-remaining. Selagi budget belum diketahui, hanya min_interval
+# (cooldown_sec) yang dipakai. Bila server balas 429, pacer berhenti sekejap
+# (exponential backoff, atau ikut Retry-After). Backoff untuk kegagalan lain
+# (5xx, timeout, network) dikira oleh wolfdice.retry dan dipasang dengan hold().
+
+
+class RatePacer:
+    def __init__(self, window=60.0, min_interval=0.0, backoff_base=0.5, backoff_max=30.0):
+        self.window = max(0.001, float(window))
+        self.min_interval = max(0.0, float(min_interval))
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self.limit = None       # budget per window (dari header)
+        self.remaining = None   # baki budget terakhir yang server laporkan
+        self.tokens = 0.0
+        self.backoff = 0.0
+        self._hold_until = 0.0  # tiada bet sebelum masa ini (backoff)
+        self._last_send = 0.0
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def refill_rate(self):
+        # token sesaat yang server benarkan (None = belum tahu / tiada had)
+        if self.limit is None:
+            return None
+        return self.limit / self.window
+
+    def rate(self):
+        # kadar bet/saat semasa yang pacer benarkan
+        if time.monotonic() < self._hold_until:
+            return 0.0
+        rates = []
+        if self.refill_rate is not None:
+            rates.append(self.refill_rate)
+        if self.min_interval > 0:
+            rates.append(1.0 / self.min_interval)
+        return min(rates) if rates else None
+
+    def describe(self):
+        wait = self._hold_until - time.monotonic()
+        if wait > 0:
+            return f"backoff {wait:.1f}s"
+        rate = self.rate()
+        txt = "∞" if rate is None else f"{rate:.2f}/s"
+        if self.limit is not None:
+            txt += f" (limit {self.limit}/{self.window:g}s, baki {self.remaining})"
+        return txt
+
+    def _refill(self, now):
+        rate = self.refill_rate
+        if rate is not None:
+            self.tokens = min(float(self.limit), self.tokens + (now - self._last_refill) * rate)
+        self._last_refill = now
+
+    def reserve(self):
+        # ambil satu slot, pulangkan berapa saat perlu tunggu sebelum hantar
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            send_at = max(now, self._hold_until, self._last_send + self.min_interval)
+            if self.limit is not None:
+                self.tokens -= 1.0
+                if self.tokens < 0:
+                    send_at = max(send_at, now + (-self.tokens) / self.refill_rate)
+            self._last_send = send_at
+            return send_at - now
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def hold(self, seconds):
+        # tiada bet (semua bot dengan token ini) selama `seconds` dari sekarang
+        with self._lock:
+            self._hold_until = max(self._hold_until, time.monotonic() + seconds)
+
+    def observe(self, status, limit=None, remaining=None, retry_after=None):
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            try:
+                if limit is not None:
+                    new_limit = int(limit)
+                    if new_limit > 0 and new_limit != self.limit:
+                        if self.limit is None:
+                            self.tokens = float(new_limit)
+                        self.limit = new_limit
+                if remaining is not None:
+                    self.remaining = int(remaining)
+                    if self.limit is not None:
+                        # server ialah sumber yang betul
+                        self.tokens = min(self.tokens, float(self.remaining))
+            except (TypeError, ValueError):
+                pass
+
+            if status == 429:
+                self.backoff = min(self.backoff_max, max(self.backoff_base, self.backoff * 2))
+                hold = self.backoff
+                if retry_after is not None:
+                    try:
+                        hold = max(hold, float(retry_after))
+                    except (TypeError, ValueError):
+                        pass
+                self._hold_until = max(self._hold_until, now + hold)
+                self.tokens = min(self.tokens, 0.0)
+            else:
+                self.backoff = 0.0
+
+
+# ---------------- Pacer dikongsi setiap akaun ----------------
+# Beberapa bot dengan token sama (cth. currency berbeza) kongsi satu budget.
+_pacers = {}
+_pacers_lock = threading.Lock()
+
+
+def get_pacer(key, window=60.0, min_interval=0.0):
+    if not key:
+        return RatePacer(window=window, min_interval=min_interval)
+    with _pacers_lock:
+        pacer = _pacers.get(key)
+        if pacer is None:
+            pacer = RatePacer(window=window, min_interval=min_interval)
+            _pacers[key] = pacer
+        return pacer
@@ -0,0 +1,73 @@
+import re
+import sys
+import threading
+import time
+
+# ---------------- Fixed-rate renderer ----------------
+# Dashboard dibina dalam thread sendiri pada kadar `fps`, bukan selepas setiap
+# bet. Loop bet hanya kemas kini counter; `build()` ambil snapshot counter itu
+# dan pulangkan renderable untuk Live. Kos render disimpan untuk dipaparkan.
+
+
+class Renderer:
+    def __init__(self, build, live, fps=4, hist=None):
+        self.build = build
+        self.hist = hist   # wolfdice.metrics.Histogram (optional)
+        self.live = live
+        self.interval = 1.0 / max(0.1, float(fps))
+        self.frames = 0
+        self.total_time = 0.0   # saat CPU/wall dalam build + update
+        self.last_time = 0.0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name="wolfdice-render", daemon=True)
+
+    def start(self):
+        self.render_once()
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self.render_once()
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            self.render_once()
+
+    def render_once(self):
+        t0 = time.perf_counter()
+        self.live.update(self.build(), refresh=True)
+        self.last_time = time.perf_counter() - t0
+        if self.hist is not None:
+            self.hist.observe(int(self.last_time * 1e9))
+        self.total_time += self.last_time
+        self.frames += 1
+
+    def describe(self):
+        if not self.frames:
+            return "-"
+        avg_ms = self.total_time / self.frames * 1000.0
+        return f"{avg_ms:.2f} ms/frame x {self.frames} frame"
+
+
+# ---------------- Headless output ----------------
+# Pengganti Live untuk mode headless: Renderer yang sama, tetapi setiap frame
+# ialah satu baris teks / JSON yang ditulis terus ke stdout (atau fail log).
+class LineOutput:
+    def __init__(self, stream=None):
+        self.stream = stream
+
+    def update(self, line, refresh=True):
+        stream = self.stream or sys.stdout
+        stream.write(line + "\n")
+        stream.flush()
+
+
+_MARKUP = re.compile(r"\[/?[a-z][a-z ]*\]")
+
+
+def plain(markup):
+    # buang tag Rich ("[red]...[/red]") tanpa import rich
+    return _MARKUP.sub("", markup)
@@ -0,0 +1,89 @@
+import random
+
+# ---------------- Bet failure taxonomy & retry ----------------
+# Setiap /bet/place yang tidak pulangkan bet diklasifikasi:
+#   timeout   - tiada response dalam connect/read_timeout
+#   network   - connection putus / reset / DNS
+#   429       - rate limit; pacer tunggu ikut Retry-After
+#   5xx       - server error
+#   auth      - 401 / 403: token salah atau tamat; sesi dihentikan
+#   malformed - response 2xx tanpa objek bet (JSON rosak / terpotong)
+#   rejected  - 4xx lain (cth. baki tak cukup, bet tidak sah); bet pasti tidak dibuat
+# timeout / network / 5xx / malformed adalah "samar": server mungkin sudah
+# terima bet walaupun bot tidak dapat response. Stake yang sama tidak dihantar
+# semula secara buta; baki server disemak dahulu (WolfBetBot._reconcile) untuk
+# tahu sama ada bet itu masuk (win / lose, terus di-settle) atau tidak. Jadi
+# retry tidak buat bet berganda dan session_profit kekal sama dengan server.
+#
+# Backoff: kegagalan pertama dicuba semula serta-merta; seterusnya exponential
+# dengan full jitter, uniform(0, min(retry_max_sec, retry_base_sec * 2**n)),
+# supaya banyak bot / lane tidak cuba serentak.
+
+TIMEOUT = "timeout"
+NETWORK = "network"
+RATELIMIT = "429"
+SERVER = "5xx"
+AUTH = "auth"
+MALFORMED = "malformed"
+REJECTED = "rejected"
+
+FAILURES = (TIMEOUT, NETWORK, RATELIMIT, SERVER, AUTH, MALFORMED, REJECTED)
+AMBIGUOUS = frozenset((TIMEOUT, NETWORK, SERVER, MALFORMED))
+
+
+def classify(data, status):
+    # dipanggil hanya bila response tiada bet; status int (HTTP) atau str (kegagalan transport)
+    if status.__class__ is str:
+        return status
+    if status in (401, 403):
+        return AUTH
+    if status == 429:
+        return RATELIMIT
+    if status >= 500:
+        return SERVER
+    if 400 <= status < 500:
+        return REJECTED
+    return MALFORMED
+
+
+class RetryPolicy:
+    def __init__(self, base=0.05, cap=5.0, limit=0, rng=None):
+        self.base = base            # saat; backoff kegagalan kedua
+        self.cap = cap              # had backoff (saat)
+        self.limit = limit          # henti sesi selepas N kegagalan berturut-turut (0 = tiada had)
+        self.counts = dict.fromkeys(FAILURES, 0)
+        self.streak = 0             # kegagalan berturut-turut; 0 selepas bet berjaya
+        self.placed = 0             # bet samar yang rupanya masuk (di-settle dari baki)
+        self.not_placed = 0         # bet samar yang tidak masuk (dihantar semula)
+        self.unknown = 0            # baki tidak dapat dipadankan; DriftTracker yang betulkan
+        self._random = (rng or random.Random()).random
+
+    @property
+    def total(self):
+        return sum(self.counts.values())
+
+    def failure(self, kind):
+        # pulangkan saat tunggu sebelum cuba semula
+        self.counts[kind] += 1
+        self.streak += 1
+        if self.streak == 1 or kind == RATELIMIT:   # 429: pacer sudah tunggu ikut Retry-After
+            return 0.0
+        return self._random() * min(self.cap, self.base * 2 ** min(self.streak - 2, 30))
+
+    def exhausted(self):
+        return bool(self.limit) and self.streak >= self.limit
+
+    def describe(self):
+        parts = [f"{kind} {n}" for kind, n in self.counts.items() if n]
+        if not parts:
+            return "-"
+        txt = "  ".join(parts)
+        if self.placed or self.not_placed or self.unknown:
+            txt += f" | semak baki: {self.placed} masuk / {self.not_placed} tidak / {self.unknown} ?"
+        return txt
+
+    def snapshot(self):
+        return {
+            "counts": {kind: n for kind, n in self.counts.items() if n},
+            "placed": self.placed, "not_placed": self.not_placed, "unknown": self.unknown,
+        }
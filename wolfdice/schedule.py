@@ -0,0 +1,238 @@
+import json
+import os
+import threading
+import time
+
+from wolfdice.money import to_units
+from wolfdice.strategy import check_config as check_strategy
+
+# ---------------- Session scheduler / hot reload ----------------
+# Thread watcher semak mtime config.json (dan fail *.json dalam folder
+# profiles) setiap reload_interval saat. Bila berubah, config dibaca semula
+# dan diletak sebagai `pending`; bot ambil pada sempadan bet seterusnya
+# (antara dua bet), jadi tiada restart: connection, journal dan statistik
+# sesi kekal.
+#
+# Profile = overlay atas config asas (cth. {"chance": 80, "base_bet": 1e-7}).
+# Rotation tukar ke profile seterusnya tanpa henti bet, ikut:
+#   "time"     - setiap rotate_every saat
+#   "bets"     - setiap rotate_every bet
+#   "drawdown" - profit jatuh rotate_every (coin) dari puncak profile semasa
+#
+#   "profiles": "profiles/"                       <- satu fail .json = satu profile
+#   "profiles": [{"name": "laju", "chance": 49.5}, {"name": "selamat", "chance": 80}]
+#   "rotate_by": "bets", "rotate_every": 5000
+
+ROTATE_BY = ("", "time", "bets", "drawdown")
+
+# tetapan yang hanya dibaca masa bot dibina; perubahan diabaikan sehingga restart
+RESTART_KEYS = (
+    "access_token", "backend", "api_base", "currency", "name", "engine", "inflight", "lanes",
+    "pool_size", "connect_timeout", "read_timeout", "json_decoder", "journal", "resume",
+    "metrics", "metrics_dump", "metrics_format", "metrics_interval", "profile", "profile_out",
+    "history_size", "headless", "balance_refresh_sec", "ratelimit_window_sec",
+    "hot_reload", "stats_window", "ui_fps", "status_interval",
+)
+
+
+def _read_json(path):
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+class Scheduler:
+    def __init__(self, cfg_path, cfg, log=None):
+        self.cfg_path = cfg_path if cfg.get("hot_reload", True) else None
+        self.log = log
+        self.base = dict(cfg)
+        self.profiles = []          # [(nama, overlay)]
+        self.index = 0
+        self.pending = None         # config baru dari watcher, belum dipakai bot
+        self.reloads = 0
+        self.switches = 0
+        self._configure()
+        self.profiles = self._check(self._load_profiles())
+        self._signature = self._stat()
+        self._t0 = time.monotonic()
+        self._bets0 = 0
+        self._peak = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _configure(self):
+        base = self.base
+        self.interval = float(base.get("reload_interval", 1.0))
+        self.source = base.get("profiles") or ""
+        self.rotate_by = str(base.get("rotate_by") or "").lower()
+        if self.rotate_by not in ROTATE_BY:
+            raise ValueError(f"rotate_by tidak dikenali: {self.rotate_by} (pilih: time, bets, drawdown)")
+        every = base.get("rotate_every", 0) or 0
+        # drawdown dalam unit 1e-8, sama seperti session_profit
+        self.every = to_units(every) if self.rotate_by == "drawdown" else float(every)
+
+    # ---------------- profiles ----------------
+    def _profile_dir(self):
+        if not isinstance(self.source, str) or not self.source:
+            return None
+        if os.path.isabs(self.source) or not self.cfg_path:
+            return self.source
+        return os.path.join(os.path.dirname(os.path.abspath(self.cfg_path)), self.source)
+
+    def _load_profiles(self):
+        if isinstance(self.source, list):
+            profiles = []
+            for i, entry in enumerate(self.source):
+                overlay = dict(entry)
+                profiles.append((str(overlay.pop("name", f"#{i + 1}")), overlay))
+            return profiles
+        folder = self._profile_dir()
+        if not folder or not os.path.isdir(folder):
+            return []
+        profiles = []
+        for fname in sorted(os.listdir(folder)):
+            if not fname.endswith(".json"):
+                continue
+            try:
+                overlay = _read_json(os.path.join(folder, fname))
+            except (OSError, ValueError) as e:
+                if self.log:
+                    self.log(f"profile {fname} diabaikan: {e}")
+                continue
+            overlay.pop("name", None)
+            profiles.append((fname[:-5], overlay))
+        return profiles
+
+    def _check(self, profiles):
+        # setiap gabungan config + profile mesti boleh bina strategy (ValueError kalau tidak)
+        for name, overlay in profiles or [(None, {})]:
+            try:
+                check_strategy(dict(self.base, **overlay))
+            except ValueError as e:
+                raise ValueError(f"profile {name}: {e}" if name else str(e)) from None
+        return profiles
+
+    @property
+    def profile(self):
+        return self.profiles[self.index][0] if self.profiles else None
+
+    def config(self):
+        # config asas + overlay profile semasa
+        cfg = dict(self.base)
+        if self.profiles:
+            cfg.update(self.profiles[self.index][1])
+        return cfg
+
+    # ---------------- dipanggil dari thread bot ----------------
+    def begin(self, bot):
+        # mula sesi / selepas tukar config: kira rotation dari sini
+        self._t0 = time.monotonic()
+        self._bets0 = bot.total_bets
+        self._peak = bot.session_profit
+
+    def poll(self, bot):
+        # setiap bet: config baru untuk dipakai sekarang, atau None
+        if self.pending is None:
+            by = self.rotate_by
+            if not by or len(self.profiles) < 2:
+                return None
+            if by == "bets":
+                due = bot.total_bets - self._bets0 >= self.every
+            elif by == "time":
+                due = time.monotonic() - self._t0 >= self.every
+            else:
+                profit = bot.session_profit
+                if profit > self._peak:
+                    self._peak = profit
+                due = self._peak - profit >= self.every
+            if not due:
+                return None
+            with self._lock:
+                self.index = (self.index + 1) % len(self.profiles)
+                self.switches += 1
+                cfg = self.config()
+        else:
+            with self._lock:
+                cfg, self.pending = self.pending, None
+        self.begin(bot)
+        return cfg
+
+    # ---------------- watcher thread ----------------
+    def _stat(self):
+        paths = [self.cfg_path] if self.cfg_path else []
+        folder = self._profile_dir()
+        if folder and os.path.isdir(folder):
+            paths += [os.path.join(folder, f) for f in sorted(os.listdir(folder)) if f.endswith(".json")]
+        sig = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            sig.append((path, st.st_mtime_ns, st.st_size))
+        return tuple(sig)
+
+    def check(self):
+        # satu semakan (blocking); True kalau config baru diletak sebagai pending
+        sig = self._stat()
+        if sig == self._signature:
+            return False
+        self._signature = sig
+        try:
+            base = _read_json(self.cfg_path) if self.cfg_path else self.base
+        except (OSError, ValueError) as e:
+            # fail separuh ditulis / JSON rosak: kekal dengan config lama
+            if self.log:
+                self.log(f"config tidak dibaca semula: {e}")
+            return False
+        with self._lock:
+            name = self.profile
+            if "name" in self.base:
+                base.setdefault("name", self.base["name"])   # nama dari multibot
+            old, self.base = self.base, dict(base)
+            try:
+                self._configure()
+                profiles = self._check(self._load_profiles())
+            except ValueError as e:
+                self.base = old
+                self._configure()
+                if self.log:
+                    self.log(f"config tidak dipakai: {e}")
+                return False
+            self.profiles = profiles
+            names = [p[0] for p in self.profiles]
+            self.index = names.index(name) if name in names else 0
+            self.pending = self.config()
+            self.reloads += 1
+        return True
+
+    def start(self):
+        if self.interval <= 0 or (self._thread is not None and self._thread.is_alive()):
+            return self
+        if not self.cfg_path and self._profile_dir() is None:
+            return self   # tiada fail untuk diperhati
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="wolfdice-schedule", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join()
+
+    def _loop(self):
+        while not self._stop.wait(max(0.1, self.interval)):
+            if self.interval <= 0:
+                return   # reload_interval 0 dari config baru: berhenti memerhati
+            try:
+                self.check()
+            except Exception as e:
+                if self.log:
+                    self.log(f"hot reload gagal: {e}")
+
+    def describe(self):
+        txt = self.profile or "config"
+        if self.rotate_by and len(self.profiles) > 1:
+            txt += f" ({self.index + 1}/{len(self.profiles)}, {self.rotate_by} {self.base.get('rotate_every')})"
+        return f"{txt}, reload {self.reloads}, tukar {self.switches}"
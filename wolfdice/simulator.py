@@ -0,0 +1,110 @@
+import hashlib
+import hmac
+import os
+import threading
+
+# ---------------- Offline dice simulator ----------------
+# Backend tempatan yang ikut peraturan dice WolfBet, tanpa network/duit:
+#   - result 0.00 - 99.99 dari HMAC-SHA256(server_seed, "client_seed_nonce")
+#   - "under" menang kalau result < bet_value, "over" kalau result > bet_value
+#   - payout = amount * multiplier, multiplier = 99.0 / win_chance (4 d.p.)
+# Boleh diguna terus sebagai backend WolfBetBot (backend: "sim").
+
+_OK = (200, None, None, None)
+
+
+def _result(digest):
+    # provably fair: ambil 5 hex sekali gus sehingga nilai < 1,000,000
+    for i in range(0, 60, 5):
+        lucky = int(digest[i:i + 5], 16)
+        if lucky < 1000000:
+            return (lucky % 10000) / 100.0
+    return 99.99
+
+
+def roll(server_seed, client_seed, nonce):
+    # untuk verify satu bet secara manual
+    digest = hmac.new(server_seed, f"{client_seed}_{nonce}".encode(), hashlib.sha256).hexdigest()
+    return _result(digest)
+
+
+def seed_hash(server_seed):
+    # hash yang ditunjuk sebelum bet; server_seed didedahkan selepas rotate
+    return hashlib.sha256(server_seed).hexdigest()
+
+
+class DiceSimulator:
+    def __init__(self, balances=None, seed=None, client_seed="wolfdice"):
+        if seed is None:
+            self.server_seed = os.urandom(32)
+        else:
+            self.server_seed = hashlib.sha256(str(seed).encode()).digest()
+        self.server_seed_hash = seed_hash(self.server_seed)
+        self.client_seed = str(client_seed)
+        self.nonce = 0
+        self.balances = {str(k).lower(): float(v) for k, v in (balances or {}).items()}
+        self._key = hmac.new(self.server_seed, digestmod=hashlib.sha256)
+        self._lock = threading.Lock()   # engine async panggil dari beberapa thread
+
+    @classmethod
+    def from_config(cls, cfg):
+        currency = str(cfg.get("currency", "btc")).lower()
+        return cls(
+            balances={currency: float(cfg.get("sim_balance", 100.0))},
+            seed=cfg.get("sim_seed"),
+            client_seed=cfg.get("sim_client_seed", "wolfdice"),
+        )
+
+    def _roll(self):
+        # sama seperti roll(), tapi guna semula key HMAC yang sudah di-init
+        h = self._key.copy()
+        h.update(f"{self.client_seed}_{self.nonce}".encode())
+        return _result(h.hexdigest())
+
+    # ---------------- backend interface ----------------
+    def get_balances(self):
+        return [{"currency": c, "amount": f"{a:.8f}"} for c, a in self.balances.items()]
+
+    def place_bet(self, request):
+        # BetRequest dari bot, atau dict JSON (mock server)
+        payload = request if isinstance(request, dict) else request.payload
+        try:
+            currency = str(payload["currency"]).lower()
+            amount = round(float(payload["amount"]), 8)
+            rule = payload["rule"]
+            bet_value = float(payload["bet_value"])
+            multiplier = float(payload["multiplier"])
+        except (KeyError, TypeError, ValueError):
+            return {"error": "invalid payload"}, (422, None, None, None)
+
+        if rule not in ("over", "under") or not 0.01 <= bet_value <= 99.99:
+            return {"error": "invalid bet"}, (422, None, None, None)
+
+        with self._lock:
+            balance = self.balances.get(currency)
+            if balance is None or amount <= 0 or amount > balance + 1e-12:
+                return {"error": "insufficient balance"}, (422, None, None, None)
+            result = self._roll()
+            nonce = self.nonce
+            self.nonce += 1
+            win = result < bet_value if rule == "under" else result > bet_value
+            if win:
+                profit = round(amount * multiplier - amount, 8)
+            else:
+                profit = -amount
+            balance = round(balance + profit, 8)
+            self.balances[currency] = balance
+
+        data = {
+            "bet": {
+                "state": "win" if win else "lose",
+                "profit": f"{profit:.8f}",
+                "amount": f"{amount:.8f}",
+                "result_value": f"{result:.2f}",
+                "multiplier": multiplier,
+                "nonce": nonce,
+                "currency": currency,
+            },
+            "userBalance": {"currency": currency, "amount": f"{balance:.8f}"},
+        }
+        return data, _OK
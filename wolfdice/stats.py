@@ -0,0 +1,156 @@
+from wolfdice.money import SAT, fmt
+
+# ---------------- Streaming session stats ----------------
+# Dikemas kini sekali setiap bet (dari _settle), O(1) dan memori tetap walau
+# bot jalan berjuta bet:
+#   - win rate keseluruhan + win rate `window` bet terakhir (ring buffer 1 bait/bet)
+#   - drawdown maksimum dari puncak profit sesi (unit 1e-8)
+#   - lose / win streak terpanjang + histogram panjang lose streak
+#   - edge sebenar (profit / jumlah taruhan) vs edge teori dari chance:
+#     multiplier WolfBet = 99 / chance (4 d.p.), jadi edge = chance% * multiplier - 1
+#
+# Render thread hanya membaca nilai int/float; bacaan mungkin ketinggalan satu
+# bet, cukup untuk paparan.
+
+STREAK_BUCKETS = 64   # histogram[n] = bilangan lose streak panjang n; n >= 63 dikumpul di hujung
+
+
+def theoretical_edge(chance):
+    chance = max(0.01, min(99.99, float(chance)))
+    multiplier = float(f"{99.0 / chance:.4f}")
+    return chance / 100.0 * multiplier - 1.0
+
+
+class StreamStats:
+    def __init__(self, chance=49.5, window=1000):
+        self.window = max(1, int(window))
+        self._ring = bytearray(self.window)
+        self.set_chance(chance)
+        self.reset()
+
+    def set_chance(self, chance):
+        # chance boleh bertukar semasa sesi (hot reload / profile): jangkaan dikira setiap bet
+        self.chance = float(chance)
+        self._p_win = self.chance / 100.0
+        self._edge = theoretical_edge(chance)
+
+    def reset(self):
+        self._ring[:] = bytes(self.window)
+        self._pos = 0
+        self.rolling_wins = 0
+        self.bets = 0
+        self.wins = 0
+        self.wagered = 0            # jumlah taruhan (unit)
+        self.profit = 0             # unit
+        self.peak = 0
+        self.max_drawdown = 0
+        self.loss_streak = 0
+        self.win_streak = 0
+        self.max_loss_streak = 0
+        self.max_win_streak = 0
+        self.streaks = [0] * STREAK_BUCKETS
+        self.expected_wins = 0.0
+        self.expected_profit = 0.0  # unit (float): jumlah amount * edge teori
+
+    def restore(self, state):
+        # sambung dari journal.SessionState (dikira semasa scan mmap, bukan add() setiap bet);
+        # jangkaan teori ikut chance semasa
+        self.reset()
+        recent = state.recent[-self.window:]
+        self._ring[:len(recent)] = recent
+        self._pos = len(recent) % self.window
+        self.rolling_wins = recent.count(1)
+        self.bets = state.bets
+        self.wins = state.wins
+        self.wagered = state.wagered
+        self.profit = state.profit
+        self.peak = state.peak
+        self.max_drawdown = state.max_drawdown
+        self.loss_streak = state.loss_streak
+        self.win_streak = state.win_streak
+        self.max_loss_streak = state.max_loss_streak
+        self.max_win_streak = state.max_win_streak
+        for n, count in state.streaks.items():
+            self.streaks[min(n, STREAK_BUCKETS - 1)] += count
+        self.expected_wins = self.bets * self._p_win
+        self.expected_profit = self.wagered * self._edge
+
+    def add(self, win, amount, pnl):
+        # pnl = +profit (win) / -amount (lose), unit 1e-8
+        i = self._pos
+        self.rolling_wins += win - self._ring[i]
+        self._ring[i] = win
+        self._pos = i + 1 if i + 1 < self.window else 0
+        self.bets += 1
+        self.wagered += amount
+        self.expected_wins += self._p_win
+        self.expected_profit += amount * self._edge
+        profit = self.profit = self.profit + pnl
+        if win:
+            self.wins += 1
+            if self.loss_streak:
+                self.streaks[min(self.loss_streak, STREAK_BUCKETS - 1)] += 1
+                self.loss_streak = 0
+            self.win_streak += 1
+            if self.win_streak > self.max_win_streak:
+                self.max_win_streak = self.win_streak
+            if profit > self.peak:
+                self.peak = profit
+        else:
+            self.win_streak = 0
+            self.loss_streak += 1
+            if self.loss_streak > self.max_loss_streak:
+                self.max_loss_streak = self.loss_streak
+            if self.peak - profit > self.max_drawdown:
+                self.max_drawdown = self.peak - profit
+
+    # ---------------- bacaan ----------------
+    def win_rate(self):
+        return self.wins / self.bets * 100.0 if self.bets else 0.0
+
+    def rolling_rate(self):
+        n = min(self.bets, self.window)
+        return self.rolling_wins / n * 100.0 if n else 0.0
+
+    def expected_rate(self):
+        return self.expected_wins / self.bets * 100.0 if self.bets else self._p_win * 100.0
+
+    def edge(self):
+        return self.profit / self.wagered * 100.0 if self.wagered else 0.0
+
+    def expected_edge(self):
+        if self.wagered:
+            return self.expected_profit / self.wagered * 100.0
+        return self._edge * 100.0
+
+    def drawdown(self):
+        return self.peak - self.profit
+
+    def histogram(self, top=8):
+        # "1x120 2x60 ..." untuk panjang lose streak yang paling kerap
+        pairs = [(n, c) for n, c in enumerate(self.streaks) if c]
+        pairs.sort(key=lambda p: (-p[1], p[0]))
+        parts = [f"{n}{'+' if n == STREAK_BUCKETS - 1 else ''}x{c}" for n, c in sorted(pairs[:top])]
+        return " ".join(parts) or "-"
+
+    def describe(self):
+        # baris untuk panel ringkasan (markup Rich)
+        return (
+            f"{self.win_rate():.2f}% ({min(self.bets, self.window)} terakhir {self.rolling_rate():.2f}%, "
+            f"teori {self.expected_rate():.2f}%)",
+            f"max {fmt(self.max_drawdown)} (kini {fmt(self.drawdown())}), "
+            f"lose streak max {self.max_loss_streak} / win {self.max_win_streak}",
+            f"{self.edge():+.3f}% (teori {self.expected_edge():+.3f}%)",
+        )
+
+    def snapshot(self):
+        return {
+            "win_rate": round(self.win_rate(), 3),
+            "rolling_win_rate": round(self.rolling_rate(), 3),
+            "max_drawdown": self.max_drawdown / SAT,
+            "max_loss_streak": self.max_loss_streak,
+            "max_win_streak": self.max_win_streak,
+            "edge_pct": round(self.edge(), 4),
+            "expected_edge_pct": round(self.expected_edge(), 4),
+            "loss_streaks": {str(n): c for n, c in enumerate(self.streaks) if c},
+        }
@@ -0,0 +1,390 @@
+import random
+from collections import deque
+
+from wolfdice.money import SAT, to_units
+
+# ---------------- Strategy engine ----------------
+# Strategy terima outcome (win True/False) dan pulangkan bet seterusnya
+# sebagai tuple (amount, rule, bet_value, request). Semua amount yang mungkin
+# dibina awal (ladder), jadi setiap keputusan cuma ubah index + lookup tuple
+# yang sudah wujud: O(1) dan tiada objek baru dalam hot loop.
+# request = hasil build(amount, rule, bet_value) (cth. body JSON siap dihantar,
+# lihat wolfdice.transport.prepare_bet), atau None kalau tiada bind().
+# Hanya PREBUILT_ROWS rung pertama dibina request siap; ladder linear
+# (d'alembert dengan max_bet besar) boleh ada berjuta rung yang jarang dicapai,
+# jadi rung selebihnya tidak disimpan langsung dan dibina bila dicapai.
+#
+# Jika amount seterusnya melebihi max_bet, strategy reset ke base_bet
+# (sama seperti loop martingale asal).
+#
+# branches() pulangkan kedua-dua bet seterusnya (win, lose) tanpa ubah state,
+# dengan over/under sudah dipilih dan request siap walaupun di luar
+# PREBUILT_ROWS; follow(win) kemudian sahkan branch yang betul. Dipakai oleh
+# engine "pipeline" untuk sedia bet seterusnya semasa bet semasa in-flight.
+#
+# Semua amount ialah int unit 1e-8 (wolfdice.money). Ladder geometri dikira
+# dengan formula float asal (ketepatan 1e-12), kemudian setiap anak tangga
+# dibundarkan ke unit - sama seperti round(amount, 8) sebelum dihantar.
+
+
+PREBUILT_ROWS = 1024
+
+
+def _cap(val, lo, hi):
+    return max(lo, min(hi, val))
+
+
+class RulePicker:
+    # target over/under dikira sekali sahaja dari chance + rule_mode
+    def __init__(self, chance, rule_mode="auto", rng=None):
+        chance = _cap(float(chance), 0.01, 99.99)
+        self.targets = (
+            ("over", _cap(100.0 - chance, 0.01, 99.99)),
+            ("under", _cap(chance, 0.01, 99.99)),
+        )
+        self.mode = str(rule_mode).lower()
+        self._fixed = {"over": 0, "under": 1}.get(self.mode)
+        self._bits = (rng or random.Random()).getrandbits
+
+    def index(self):
+        if self._fixed is not None:
+            return self._fixed
+        return self._bits(1)   # auto: over / under rawak
+
+    def pick(self):
+        return self.targets[self.index()]
+
+
+class Strategy:
+    name = None
+    independent = False   # True = stake tak bergantung pada result (boleh banyak bet in-flight)
+
+    def __init__(self, base_bet, max_bet, picker):
+        self.base_bet = base_bet   # unit
+        self.max_bet = max_bet     # unit
+        self.picker = picker
+        self._rows = []   # row[i] = ((amount, "over", v, req), (amount, "under", v, req))
+        self.step = 0
+        self.build = None
+
+    def _row(self, amount):
+        build = self.build
+        return tuple(
+            (amount, rule, value, build(amount, rule, value) if build else None)
+            for rule, value in self.picker.targets
+        )
+
+    def bind(self, build):
+        # bina semula semua row dengan request siap (sekali sahaja, bukan setiap bet)
+        self.build = build
+        rows = self._rows
+        rows[:PREBUILT_ROWS] = [self._row(row[0][0]) for row in rows[:PREBUILT_ROWS]]
+        return self
+
+    def _build(self, amounts):
+        self._rows = [self._row(round(a)) for a in amounts]
+
+    @property
+    def amount(self):
+        return self._rows[self.step][0][0]
+
+    def reset(self):
+        self.step = 0
+
+    def clone(self):
+        # salinan bebas (cth. untuk setiap lane async); ladder dikongsi
+        other = object.__new__(type(self))
+        other.__dict__.update(self.__dict__)
+        other.reset()
+        return other
+
+    def restore(self, amount):
+        # sambung semula dari amount terakhir (cth. selepas restart)
+        best = 0
+        for i, row in enumerate(self._rows):
+            if row[0][0] <= amount:
+                best = i
+        self.step = best
+
+    def first(self):
+        return self._rows[self.step][self.picker.index()]
+
+    def next(self, win):
+        self._advance(win)
+        return self._rows[self.step][self.picker.index()]
+
+    def branches(self):
+        # (bet kalau win, bet kalau lose); satu pilihan over/under untuk kedua-dua
+        i = self.picker.index()
+        saved = self._save()
+        out = []
+        for win in (True, False):
+            self._advance(win)
+            out.append(self._ready(self._current_row()[i]))
+            self._load(saved)
+        return out[0], out[1]
+
+    def follow(self, win):
+        # outcome sebenar tiba: maju ke branch yang sudah disediakan oleh branches()
+        self._advance(win)
+
+    def _ready(self, bet):
+        amount, rule, value, request = bet
+        if request is None and self.build is not None:
+            return amount, rule, value, self.build(amount, rule, value)
+        return bet
+
+    def _current_row(self):
+        return self._rows[self.step]
+
+    def _save(self):
+        return self.step
+
+    def _load(self, saved):
+        self.step = saved
+
+    def _advance(self, win):
+        raise NotImplementedError
+
+
+def _geometric(base_bet, factor, max_bet):
+    # formula asal dalam coin: base, round(base*f, 12), ... selagi <= max_bet;
+    # setiap anak tangga ditukar ke unit ikut round(amount, 8) yang dihantar ke server
+    base, cap = base_bet / SAT, max_bet / SAT
+    amounts = [base]
+    if factor > 1.0:
+        while True:
+            nxt = round(amounts[-1] * factor, 12)
+            if nxt > cap or nxt <= amounts[-1]:
+                break
+            amounts.append(nxt)
+    return [round(round(a, 8) * SAT) for a in amounts]
+
+
+class Martingale(Strategy):
+    name = "martingale"
+
+    def __init__(self, base_bet, max_bet, picker, multiplier=2.0):
+        super().__init__(base_bet, max_bet, picker)
+        self.independent = multiplier == 1.0
+        self._build(_geometric(base_bet, multiplier, max_bet))
+        self._top = len(self._rows) - 1
+
+    def _advance(self, win):
+        # lose: gandakan; win: balik ke base; lebih max_bet: reset
+        if win or self.step >= self._top:
+            self.step = 0
+        else:
+            self.step += 1
+
+
+class AntiMartingale(Strategy):
+    name = "anti_martingale"
+
+    def __init__(self, base_bet, max_bet, picker, multiplier=2.0, max_streak=3):
+        super().__init__(base_bet, max_bet, picker)
+        self.independent = multiplier == 1.0
+        self._build(_geometric(base_bet, multiplier, max_bet)[:max(1, max_streak) + 1])
+        self._top = len(self._rows) - 1
+
+    def _advance(self, win):
+        # win: gandakan sehingga max_streak; lose: balik ke base
+        if not win or self.step >= self._top:
+            self.step = 0
+        else:
+            self.step += 1
+
+
+class DAlembert(Strategy):
+    name = "dalembert"
+
+    # ladder linear: base + step * unit. Dengan max_bet besar boleh ada berjuta
+    # rung, jadi hanya PREBUILT_ROWS row pertama disimpan; row selebihnya dibina
+    # bila dicapai (jarang), bukan semasa strategy dibina.
+    def __init__(self, base_bet, max_bet, picker, unit=None):
+        super().__init__(base_bet, max_bet, picker)
+        unit = base_bet if unit is None else to_units(unit)
+        self.unit = unit
+        self.independent = unit <= 0
+        self._top = max(0, (max_bet - base_bet) // unit) if unit > 0 else 0
+        self._build([base_bet + i * unit for i in range(min(self._top + 1, PREBUILT_ROWS))])
+
+    def _current_row(self):
+        step = self.step
+        if step < PREBUILT_ROWS:
+            return self._rows[step]
+        return self._row(self.base_bet + step * self.unit)
+
+    @property
+    def amount(self):
+        return self.base_bet + self.step * self.unit
+
+    def restore(self, amount):
+        self.step = min(self._top, max(0, (amount - self.base_bet) // self.unit)) if self.unit > 0 else 0
+
+    def first(self):
+        return self._current_row()[self.picker.index()]
+
+    def next(self, win):
+        self._advance(win)
+        return self._current_row()[self.picker.index()]
+
+    def _advance(self, win):
+        # lose: +1 unit; win: -1 unit (tak kurang dari base)
+        if win:
+            if self.step:
+                self.step -= 1
+        elif self.step >= self._top:
+            self.step = 0
+        else:
+            self.step += 1
+
+
+class Fibonacci(Strategy):
+    name = "fibonacci"
+
+    def __init__(self, base_bet, max_bet, picker):
+        super().__init__(base_bet, max_bet, picker)
+        # base * 1, 1, 2, 3, 5, ...
+        amounts = []
+        a, b = 1, 1
+        while True:
+            amount = base_bet * a
+            if amounts and amount > max_bet:
+                break
+            amounts.append(amount)
+            a, b = b, a + b
+        self._build(amounts)
+        self._top = len(self._rows) - 1
+
+    def _advance(self, win):
+        # lose: satu langkah ke depan; win: undur dua langkah
+        if win:
+            self.step = max(0, self.step - 2)
+        elif self.step >= self._top:
+            self.step = 0
+        else:
+            self.step += 1
+
+
+class Labouchere(Strategy):
+    name = "labouchere"
+
+    def __init__(self, base_bet, max_bet, picker, sequence=(1, 2, 3, 4)):
+        super().__init__(base_bet, max_bet, picker)
+        self.sequence = tuple(int(x) for x in sequence) or (1,)
+        self._seq = deque(self.sequence)
+        self._cache = {}   # units -> row, dibina sekali untuk setiap saiz bet
+        self._units = 0
+        self._set_units()
+
+    def reset(self):
+        self._seq = deque(self.sequence)
+        self._set_units()
+
+    def restore(self, amount):
+        self.reset()
+
+    def bind(self, build):
+        self.build = build
+        self._cache.clear()
+        self._set_units()
+        return self
+
+    def _set_units(self):
+        seq = self._seq
+        units = seq[0] + seq[-1] if len(seq) > 1 else seq[0]
+        if self.base_bet * units > self.max_bet:
+            self._seq = deque(self.sequence)
+            seq = self._seq
+            units = seq[0] + seq[-1] if len(seq) > 1 else seq[0]
+        self._units = units
+        row = self._cache.get(units)
+        if row is None:
+            row = self._row(self.base_bet * units)
+            self._cache[units] = row
+        self._current = row
+
+    @property
+    def amount(self):
+        return self._current[0][0]
+
+    def first(self):
+        return self._current[self.picker.index()]
+
+    def next(self, win):
+        self._advance(win)
+        return self._current[self.picker.index()]
+
+    def _current_row(self):
+        return self._current
+
+    def _save(self):
+        return deque(self._seq), self._units, self._current
+
+    def _load(self, saved):
+        seq, self._units, self._current = saved
+        self._seq = deque(seq)
+
+    def _advance(self, win):
+        # win: buang nombor pertama & terakhir; lose: tambah jumlah bet ke hujung
+        seq = self._seq
+        if win:
+            seq.popleft()
+            if seq:
+                seq.pop()
+            if not seq:
+                seq.extend(self.sequence)
+        else:
+            seq.append(self._units)
+        self._set_units()
+
+
+STRATEGIES = {
+    cls.name: cls for cls in (Martingale, AntiMartingale, DAlembert, Fibonacci, Labouchere)
+}
+
+
+# medan config yang menentukan strategy (cth. kunci cache bila config / profile bertukar)
+CONFIG_KEYS = (
+    "strategy", "base_bet", "max_bet", "multiplier", "chance", "rule_mode",
+    "anti_max_streak", "dalembert_unit", "labouchere_sequence",
+)
+
+
+def config_key(cfg):
+    return tuple(repr(cfg.get(k)) for k in CONFIG_KEYS)
+
+
+def check_config(cfg):
+    # semakan murah sebelum ladder dibina (startup, hot reload, profile): ValueError kalau tidak sah
+    base_bet = to_units(cfg.get("base_bet", 0.00000001))
+    if base_bet <= 0:
+        # ladder (cth. fibonacci: base * 1, 1, 2, ...) tak akan capai max_bet
+        raise ValueError(f"base_bet mesti sekurang-kurangnya 0.00000001 (dapat {cfg.get('base_bet')!r})")
+    return base_bet
+
+
+def from_config(cfg, rng=None, build=None):
+    st = _from_config(cfg, rng)
+    return st.bind(build) if build else st
+
+
+def _from_config(cfg, rng=None):
+    base_bet = check_config(cfg)
+    max_bet = to_units(cfg.get("max_bet", 0.0001))
+    multiplier = float(cfg.get("multiplier", 2.0))
+    picker = RulePicker(cfg.get("chance", 49.5), cfg.get("rule_mode", "auto"), rng)
+
+    name = str(cfg.get("strategy", "martingale")).lower()
+    if name == "martingale":
+        return Martingale(base_bet, max_bet, picker, multiplier)
+    if name == "anti_martingale":
+        return AntiMartingale(base_bet, max_bet, picker, multiplier, int(cfg.get("anti_max_streak", 3)))
+    if name == "dalembert":
+        return DAlembert(base_bet, max_bet, picker, cfg.get("dalembert_unit"))
+    if name == "fibonacci":
+        return Fibonacci(base_bet, max_bet, picker)
+    if name == "labouchere":
+        return Labouchere(base_bet, max_bet, picker, cfg.get("labouchere_sequence", (1, 2, 3, 4)))
+    raise ValueError(f"strategy tidak dikenali: {name} (pilih: {', '.join(STRATEGIES)})")
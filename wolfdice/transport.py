@@ -0,0 +1,144 @@
+import json
+import threading
+from time import perf_counter_ns
+import requests
+from requests.adapters import HTTPAdapter
+
+from wolfdice.decode import get_decoder
+from wolfdice.money import fmt
+from wolfdice.retry import NETWORK, TIMEOUT
+
+# ---------------- Pooled HTTP session ----------------
+# Satu requests.Session (keep-alive + connection pool) untuk setiap token,
+# supaya setiap /bet/place guna semula sambungan TCP/TLS yang sama.
+_sessions = {}
+_lock = threading.Lock()
+
+
+def make_session(headers, pool_size=4):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(headers)
+    return session
+
+
+def get_session(token, headers, pool_size=4):
+    with _lock:
+        session = _sessions.get(token)
+        if session is None:
+            session = make_session(headers, pool_size)
+            _sessions[token] = session
+        return session
+
+
+def close_sessions():
+    with _lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
+def timeouts(cfg):
+    # (connect, read) timeout dalam saat, ikut config.json
+    return (float(cfg.get("connect_timeout", 5.0)), float(cfg.get("read_timeout", 20.0)))
+
+
+# ---------------- HTTP backend ----------------
+# Backend = apa sahaja yang ada get_balances() dan place_bet(request: BetRequest).
+# place_bet pulangkan (data, meta): meta = (status, x-ratelimit-limit,
+# x-ratelimit-remaining, retry-after); status "timeout" / "network" (str,
+# wolfdice.retry) kalau tiada response langsung.
+# metrics (wolfdice.metrics.Metrics, optional): masa network vs JSON decode.
+# decode (wolfdice.decode.get_decoder): bytes response -> dict; default json.
+class HttpBackend:
+    def __init__(self, session, api_base, timeout, log=None, metrics=None, decode=None):
+        self.session = session
+        self.api_base = api_base
+        self.timeout = timeout
+        self.log = log
+        self.metrics = metrics
+        self.decode = decode or get_decoder("json")
+
+    def _get(self, path):
+        try:
+            return self.session.get(f"{self.api_base}{path}", timeout=self.timeout)
+        except Exception as e:
+            if self.log:
+                self.log(f"GET {path} network error: {e}")
+            return None
+
+    def _post(self, path, body):
+        # pulangkan (response, None) atau (None, kelas kegagalan)
+        try:
+            return self.session.post(f"{self.api_base}{path}", data=body, timeout=self.timeout), None
+        except requests.Timeout as e:
+            kind, error = TIMEOUT, e
+        except Exception as e:
+            kind, error = NETWORK, e
+        if self.log:
+            self.log(f"POST {path} {kind}: {error}")
+        return None, kind
+
+    def get_balances(self):
+        r = self._get("/user/balances")
+        if not r:
+            return None
+        try:
+            data = r.json()
+            return data.get("balances", [])
+        except Exception:
+            return None
+
+    def place_bet(self, request):
+        t0 = perf_counter_ns()
+        r, error = self._post("/bet/place", request.body)
+        t1 = perf_counter_ns()
+        if self.metrics is not None:
+            self.metrics.stages["network"].observe(t1 - t0)
+        if r is None:
+            return None, (error, None, None, None)
+
+        meta = (
+            r.status_code,
+            r.headers.get("x-ratelimit-limit"),
+            r.headers.get("x-ratelimit-remaining"),
+            r.headers.get("retry-after"),
+        )
+        # r.content terus (tanpa r.json(): tiada teka encoding / decode str)
+        data = self.decode(r.content)
+        if self.metrics is not None:
+            self.metrics.stages["decode"].observe(perf_counter_ns() - t1)
+        return data, meta
+
+
+# ---------------- Prebuilt bet requests ----------------
+# Untuk config tetap, setiap kombinasi (amount, rule, bet_value) sudah
+# diketahui awal (ladder strategy). prepare_bet kira multiplier, format
+# string dan encode JSON sekali sahaja; hot loop cuma hantar `body`.
+class BetRequest:
+    __slots__ = ("amount", "rule", "bet_value", "multiplier", "payload", "body")
+
+    def __init__(self, amount, rule, bet_value, multiplier, payload, body):
+        self.amount = amount          # unit 1e-8
+        self.rule = rule
+        self.bet_value = bet_value
+        self.multiplier = multiplier
+        self.payload = payload        # dict (untuk backend tempatan, cth. simulator)
+        self.body = body              # bytes JSON siap dihantar
+
+
+def prepare_bet(currency, amount, rule, bet_value):
+    win_chance = bet_value if rule == "under" else (100.0 - bet_value)
+    multiplier = float(f"{99.0 / win_chance:.4f}")
+    payload = {
+        "currency": currency,
+        "game": "dice",
+        "amount": fmt(amount),
+        "rule": rule,
+        "bet_value": str(bet_value),
+        "multiplier": str(multiplier),
+    }
+    body = json.dumps(payload, separators=(",", ":")).encode()
+    return BetRequest(amount, rule, bet_value, multiplier, payload, body)